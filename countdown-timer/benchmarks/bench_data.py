@@ -0,0 +1,26 @@
+"""Benchmark data - synthetic stored events."""
+
+from datetime import date, timedelta
+from typing import Dict, Optional
+
+
+def make_events(size: int, today: Optional[date] = None) -> Dict[str, Dict]:
+    """
+    Build stored events spread over two years around today.
+    
+    About a sixth are expired; names are unique and sort in creation order.
+    """
+    today = today or date.today()
+    start = today - timedelta(days=120)
+    events = {}
+    for i in range(size):
+        target = start + timedelta(days=(i * 7919) % 730)
+        name = f"事件{i:07d}"
+        events[name] = {
+            "name": name,
+            "target_date": target.isoformat(),
+            "target_ordinal": target.toordinal(),
+            "created_at": "2026-01-01T00:00:00",
+            "status": "ACTIVE",
+        }
+    return events
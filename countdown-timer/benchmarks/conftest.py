@@ -0,0 +1,193 @@
+"""Benchmark harness - timing, memory tracking and JSON baselines.
+
+benchmarks/pytest.ini is picked up whenever benchmarks/ (or a file in
+it) is passed to pytest, from the project directory or the repository
+root. It puts the project on sys.path (benchmarks import
+src.countdown_timer like tests/ do) and leaves out the coverage options
+of the main configuration, which slow everything down unevenly:
+
+    python -m pytest benchmarks
+    python -m pytest benchmarks --bench-sizes 1000,10000,100000,1000000
+    python -m pytest benchmarks --bench-save benchmarks/baselines/main.json
+    python -m pytest benchmarks --bench-compare benchmarks/baselines/main.json
+
+Each benchmark is timed over several rounds (min/median/mean/stddev) and
+then run once more under tracemalloc for its peak memory. With
+--bench-compare, a benchmark fails when its median time or peak memory
+exceeds the baseline by more than --bench-threshold (and by more than a
+small absolute noise floor).
+"""
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import pytest
+
+from bench_data import make_events
+from src.countdown_timer.backends import create_storage
+
+
+# Smaller changes than these are noise, whatever the ratio
+MIN_TIME_DELTA = 0.001
+MIN_MEMORY_DELTA = 64 * 1024
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-sizes", default="1000,10000",
+                    help="Comma-separated event counts (e.g. 1000,10000,100000,1000000)")
+    group.addoption("--bench-rounds", type=int, default=5, help="Timed rounds per benchmark")
+    group.addoption("--bench-save", default=None, help="Write results to this JSON file")
+    group.addoption("--bench-compare", default=None, help="Fail on regressions against this JSON baseline")
+    group.addoption("--bench-threshold", type=float, default=1.5,
+                    help="Allowed ratio to the baseline for median time and peak memory")
+
+
+def pytest_generate_tests(metafunc):
+    if "size" in metafunc.fixturenames:
+        sizes = [int(s) for s in metafunc.config.getoption("--bench-sizes").split(",") if s.strip()]
+        metafunc.parametrize("size", sizes, ids=[str(s) for s in sizes], scope="module")
+
+
+def pytest_configure(config):
+    config._bench_results = {}
+    path = config.getoption("--bench-compare")
+    config._bench_baseline = json.loads(Path(path).read_text(encoding="utf-8"))["benchmarks"] if path else {}
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    path = config.getoption("--bench-save")
+    if not path or not config._bench_results:
+        return
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        },
+        "benchmarks": config._bench_results,
+    }
+    Path(path).write_text(json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config._bench_results
+    if not results:
+        return
+    terminalreporter.section("benchmarks")
+    width = max(len(name) for name in results)
+    terminalreporter.write_line(f"{'name':<{width}}  {'median':>10}  {'min':>10}  {'peak mem':>10}")
+    for name, stats in sorted(results.items()):
+        terminalreporter.write_line(
+            f"{name:<{width}}  {_ms(stats['median']):>10}  {_ms(stats['min']):>10}  "
+            f"{stats['peak_memory'] / 1024 / 1024:>8.2f}MB"
+        )
+
+
+def _ms(seconds: float) -> str:
+    return f"{seconds * 1000:.3f}ms"
+
+
+class Benchmark:
+    """
+    Times a callable like pytest-benchmark's fixture.
+    
+    benchmark(func, *args) runs func(*args) for every round;
+    benchmark.pedantic(func, setup=...) calls setup() before each round
+    (untimed) and passes the (args, kwargs) it returns to func.
+    """
+
+    def __init__(self, name: str, config):
+        self.name = name
+        self.rounds = config.getoption("--bench-rounds")
+        self.threshold = config.getoption("--bench-threshold")
+        self.results = config._bench_results
+        self.baseline = config._bench_baseline.get(name)
+        self.stats: Optional[Dict] = None
+
+    def __call__(self, func: Callable, *args, **kwargs):
+        return self.pedantic(func, setup=lambda: (args, kwargs))
+
+    def pedantic(self, func: Callable, setup: Callable[[], Tuple[tuple, dict]], rounds: Optional[int] = None):
+        if sys.gettrace() is not None:
+            pytest.skip("benchmarks must run without coverage or a debugger (see benchmarks/pytest.ini)")
+        
+        times = []
+        result = None
+        for _ in range(rounds or self.rounds):
+            args, kwargs = setup()
+            gc.collect()
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            times.append(time.perf_counter() - start)
+        
+        # One more round for memory: tracemalloc slows the code down, so it is not timed
+        args, kwargs = setup()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        
+        self.stats = {
+            "rounds": len(times),
+            "min": min(times),
+            "max": max(times),
+            "mean": statistics.fmean(times),
+            "median": statistics.median(times),
+            "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "peak_memory": peak,
+        }
+        self.results[self.name] = self.stats
+        self._compare()
+        return result
+
+    def _compare(self) -> None:
+        """Fail if the results regressed against the baseline."""
+        if self.baseline is None:
+            return
+        problems = []
+        median, base_median = self.stats["median"], self.baseline["median"]
+        if median > base_median * self.threshold and median - base_median > MIN_TIME_DELTA:
+            problems.append(f"median {_ms(median)} vs baseline {_ms(base_median)}")
+        peak, base_peak = self.stats["peak_memory"], self.baseline["peak_memory"]
+        if peak > base_peak * self.threshold and peak - base_peak > MIN_MEMORY_DELTA:
+            problems.append(f"peak memory {peak} B vs baseline {base_peak} B")
+        if problems:
+            pytest.fail(f"{self.name} regressed (> {self.threshold}x): " + "; ".join(problems))
+
+
+@pytest.fixture
+def benchmark(request):
+    """Time a callable and record/compare its results under the test's ID."""
+    # "test_bench_storage.py::test_get_event[json-1000]"
+    return Benchmark(request.node.nodeid.rsplit("/", 1)[-1], request.config)
+
+
+# Backends every storage benchmark runs against
+BACKENDS = ("json", "sqlite", "memory")
+
+
+@pytest.fixture(scope="module", params=BACKENDS)
+def storage(request, size, tmp_path_factory):
+    """Storage of each backend holding size events (shared by a module's benchmarks)."""
+    storage = create_storage(request.param, str(tmp_path_factory.mktemp(f"{request.param}-{size}")))
+    storage.save_events(make_events(size))
+    yield storage
+    close = getattr(storage, "close", None)
+    if close is not None:
+        close()
@@ -0,0 +1,386 @@
+"""HTTP load test for the API - mixed web-UI workload, per-route latency.
+
+Drives the FastAPI app in-process through httpx's ASGI transport (the
+default), or a real uvicorn server on localhost:
+
+    python benchmarks/loadtest.py --concurrency 20 --duration 10
+    python benchmarks/loadtest.py --server uvicorn --workers 4 --concurrency 50
+    python benchmarks/loadtest.py --url http://127.0.0.1:8000 --concurrency 20
+
+Each virtual user behaves like an open web page: it mostly polls
+/api/stats and the first page of /api/events (revalidating with
+If-None-Match, as the browser cache does) and now and then creates,
+edits or deletes one of its own events. The report gives requests,
+errors, throughput and p50/p95/p99 latency per route.
+
+Unless --url is given, the server writes to a temporary COUNTDOWN_HOME
+seeded with --events events. In-process runs also sample event-loop
+lag: the client and the app share one loop, so a handler that blocks it
+(synchronous disk I/O, a lock wait) shows up as lag.
+
+Exits with status 1 if any request failed or a --max-p99 /
+--max-loop-lag limit was exceeded.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+
+PROJECT_DIR = Path(__file__).resolve().parents[1]
+
+# Action -> relative weight. A page polls far more often than its user edits.
+WORKLOAD = {"list": 40, "stats": 40, "create": 8, "edit": 6, "delete": 6}
+
+# Action -> route it is reported under
+ROUTES = {
+    "list": "GET /api/events",
+    "stats": "GET /api/stats",
+    "create": "POST /api/events",
+    "edit": "PUT /api/events/{name}",
+    "delete": "DELETE /api/events/{name}",
+}
+
+# Action -> status codes that count as success
+EXPECTED = {"list": (200, 304), "stats": (200, 304), "create": (201,), "edit": (200,), "delete": (204,)}
+
+# Page size the web UI requests
+PAGE_SIZE = 50
+
+# Seconds between event-loop lag samples
+LAG_INTERVAL = 0.01
+
+# Events per seeding request (the API's batch limit)
+SEED_BATCH = 10000
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values (0.0 if empty)."""
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(q / 100 * len(values)) - 1)]
+
+
+class Recorder:
+    """Latencies of successful requests and error counts, per route."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.lag: List[float] = []
+
+    def summary(self, elapsed: float) -> Dict:
+        """Per-route and total results; times in milliseconds."""
+        routes = {}
+        for route in sorted(set(self.latencies) | set(self.errors)):
+            routes[route] = self._stats(self.latencies[route], self.errors[route], elapsed)
+        everything = [t for latencies in self.latencies.values() for t in latencies]
+        result = {
+            "duration": round(elapsed, 3),
+            "total": self._stats(everything, sum(self.errors.values()), elapsed),
+            "routes": routes,
+        }
+        if self.lag:
+            lag = sorted(self.lag)
+            result["loop_lag"] = {"p99": round(percentile(lag, 99) * 1000, 3), "max": round(lag[-1] * 1000, 3)}
+        return result
+
+    @staticmethod
+    def _stats(latencies: List[float], errors: int, elapsed: float) -> Dict:
+        latencies = sorted(latencies)
+        ms = lambda seconds: round(seconds * 1000, 3)
+        return {
+            "requests": len(latencies) + errors,
+            "errors": errors,
+            "rps": round((len(latencies) + errors) / elapsed, 1) if elapsed else 0.0,
+            "p50": ms(percentile(latencies, 50)),
+            "p95": ms(percentile(latencies, 95)),
+            "p99": ms(percentile(latencies, 99)),
+            "max": ms(latencies[-1] if latencies else 0.0),
+        }
+
+
+class VirtualUser:
+    """One open web page: polls the list and stats, edits its own events."""
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, user_id: int, seed: int):
+        self.client = client
+        self.recorder = recorder
+        self.user_id = user_id
+        self.rng = random.Random(seed)
+        self.names = itertools.count()
+        # Events this user created and has not deleted yet
+        self.own: List[str] = []
+        # Action -> last ETag seen (the browser cache)
+        self.etags: Dict[str, str] = {}
+
+    async def step(self) -> None:
+        """Send one request chosen by the workload weights."""
+        action = self.rng.choices(list(WORKLOAD), weights=list(WORKLOAD.values()))[0]
+        if action in ("edit", "delete") and not self.own:
+            action = "create"
+        method, url, kwargs = getattr(self, f"_{action}")()
+        
+        start = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.errors[ROUTES[action]] += 1
+            return
+        elapsed = time.perf_counter() - start
+        
+        if response.status_code not in EXPECTED[action]:
+            self.recorder.errors[ROUTES[action]] += 1
+            return
+        self.recorder.latencies[ROUTES[action]].append(elapsed)
+        self._after(action, response)
+
+    def _list(self):
+        headers = {"If-None-Match": self.etags["list"]} if "list" in self.etags else {}
+        return "GET", "/api/events", {"params": {"limit": PAGE_SIZE, "sort": "date"}, "headers": headers}
+
+    def _stats(self):
+        headers = {"If-None-Match": self.etags["stats"]} if "stats" in self.etags else {}
+        return "GET", "/api/stats", {"headers": headers}
+
+    def _create(self):
+        name = f"用户{self.user_id:03d}-{next(self.names):06d}"
+        self.own.append(name)
+        return "POST", "/api/events", {"json": {"name": name, "date": self._date()}}
+
+    def _edit(self):
+        return "PUT", f"/api/events/{self.rng.choice(self.own)}", {"json": {"date": self._date()}}
+
+    def _delete(self):
+        name = self.own.pop(self.rng.randrange(len(self.own)))
+        return "DELETE", f"/api/events/{name}", {}
+
+    def _date(self) -> str:
+        return (date.today() + timedelta(days=self.rng.randint(1, 730))).isoformat()
+
+    def _after(self, action: str, response: httpx.Response) -> None:
+        if action in ("list", "stats") and "etag" in response.headers:
+            self.etags[action] = response.headers["etag"]
+
+
+async def seed_events(client: httpx.AsyncClient, count: int) -> None:
+    """Create count events through the batch API."""
+    today = date.today()
+    for start in range(0, count, SEED_BATCH):
+        events = [
+            {"name": f"事件{i:07d}", "date": (today + timedelta(days=i % 730 - 120)).isoformat()}
+            for i in range(start, min(count, start + SEED_BATCH))
+        ]
+        response = await client.post("/api/events:batch", json={"events": events})
+        response.raise_for_status()
+
+
+async def _sample_lag(lags: List[float], deadline: float) -> None:
+    """Record how late the loop wakes a sleeping task."""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await asyncio.sleep(LAG_INTERVAL)
+        lags.append(max(0.0, time.perf_counter() - start - LAG_INTERVAL))
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    concurrency: int,
+    duration: float,
+    think: float = 0.0,
+    seed: int = 0,
+    measure_lag: bool = False,
+) -> Dict:
+    """
+    Run the workload against client's server.
+    
+    Args:
+        client: Client whose base URL (or ASGI transport) is the server
+        concurrency: Number of virtual users sending requests in parallel
+        duration: Seconds to run
+        think: Seconds each user waits between requests (0: closed loop)
+        seed: Random seed of the workload
+        measure_lag: Sample event-loop lag (meaningful in-process only)
+        
+    Returns:
+        Recorder.summary() of the run
+    """
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration
+
+    async def user(user_id: int) -> None:
+        virtual_user = VirtualUser(client, recorder, user_id, seed * 100003 + user_id)
+        while time.perf_counter() < deadline:
+            await virtual_user.step()
+            if think:
+                await asyncio.sleep(think)
+    
+    start = time.perf_counter()
+    tasks = [user(i) for i in range(concurrency)]
+    if measure_lag:
+        tasks.append(_sample_lag(recorder.lag, deadline))
+    await asyncio.gather(*tasks)
+    return recorder.summary(time.perf_counter() - start)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_uvicorn(port: int, workers: int, env: Dict[str, str], timeout: float = 30.0) -> subprocess.Popen:
+    """
+    Start uvicorn serving the app on 127.0.0.1:port and wait until it answers /health.
+    
+    Raises:
+        RuntimeError: If the server exits or does not answer within timeout
+    """
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "src.countdown_timer.api.app:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ],
+        cwd=PROJECT_DIR,
+        env=env,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1.0).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    process.terminate()
+    process.wait()
+    raise RuntimeError(f"uvicorn did not answer on port {port} within {timeout:.0f}s")
+
+
+async def _load_against(base_url: Optional[str], args, transport=None) -> Dict:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url or "http://loadtest", transport=transport, limits=limits, timeout=args.timeout,
+    ) as client:
+        if args.events and not args.url:
+            await seed_events(client, args.events)
+        return await run_load(
+            client, args.concurrency, args.duration, args.think, args.seed, measure_lag=transport is not None,
+        )
+
+
+def run(args) -> Dict:
+    """Run the load test described by the parsed command line."""
+    if args.url:
+        return asyncio.run(_load_against(args.url.rstrip("/"), args))
+    
+    with tempfile.TemporaryDirectory(prefix="countdown-load-") as home:
+        env = {**os.environ, "COUNTDOWN_HOME": home}
+        if args.storage:
+            env["COUNTDOWN_STORAGE"] = args.storage
+        
+        if args.server == "uvicorn":
+            port = _free_port()
+            process = start_uvicorn(port, args.workers, env)
+            try:
+                return asyncio.run(_load_against(f"http://127.0.0.1:{port}", args))
+            finally:
+                process.terminate()
+                process.wait()
+        
+        # The app opens its storage when its routes are imported
+        os.environ.update(env)
+        sys.path.insert(0, str(PROJECT_DIR))
+        from src.countdown_timer.api.app import app
+        return asyncio.run(_load_against(None, args, transport=httpx.ASGITransport(app=app)))
+
+
+def format_report(result: Dict) -> str:
+    """Render a run's result as a table."""
+    rows = [("route", "requests", "errors", "req/s", "p50 ms", "p95 ms", "p99 ms", "max ms")]
+    for route, stats in [*result["routes"].items(), ("total", result["total"])]:
+        rows.append((
+            route, stats["requests"], stats["errors"], stats["rps"],
+            stats["p50"], stats["p95"], stats["p99"], stats["max"],
+        ))
+    width = max(len(str(row[0])) for row in rows)
+    lines = [f"{row[0]:<{width}}" + "".join(f"{value:>10}" for value in row[1:]) for row in rows]
+    if "loop_lag" in result:
+        lag = result["loop_lag"]
+        lines.append(f"event loop lag: p99 {lag['p99']} ms, max {lag['max']} ms")
+    return "\n".join(lines)
+
+
+def check_limits(result: Dict, max_p99: Optional[float], max_loop_lag: Optional[float]) -> List[str]:
+    """Reasons the run failed (empty if it passed)."""
+    problems = []
+    if result["total"]["errors"]:
+        problems.append(f"{result['total']['errors']} requests failed")
+    if max_p99 is not None:
+        for route, stats in result["routes"].items():
+            if stats["p99"] > max_p99:
+                problems.append(f"{route} p99 {stats['p99']} ms > {max_p99} ms")
+    if max_loop_lag is not None and result.get("loop_lag", {}).get("max", 0.0) > max_loop_lag:
+        problems.append(f"event loop lag {result['loop_lag']['max']} ms > {max_loop_lag} ms")
+    return problems
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--server", choices=("asgi", "uvicorn"), default="asgi",
+                        help="Run the app in-process (asgi) or in a uvicorn subprocess")
+    target.add_argument("--url", help="Load an already running server instead (its data are not reset)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--storage", help="Storage backend of the server (default: $COUNTDOWN_STORAGE or sqlite)")
+    parser.add_argument("--events", type=int, default=1000, help="Events to seed before the run")
+    parser.add_argument("--concurrency", type=int, default=10, help="Virtual users")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--think", type=float, default=0.0, help="Seconds each user waits between requests")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Request timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed of the workload")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this JSON file")
+    parser.add_argument("--max-p99", type=float, help="Fail if a route's p99 exceeds this many ms")
+    parser.add_argument("--max-loop-lag", type=float, help="Fail if event-loop lag exceeds this many ms (asgi)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    result = run(args)
+    print(format_report(result))
+    
+    problems = check_limits(result, args.max_p99, args.max_loop_lag)
+    if args.json_path:
+        config = {
+            key: getattr(args, key)
+            for key in ("server", "url", "workers", "storage", "events", "concurrency", "duration", "think", "seed")
+        }
+        report = {"config": config, "result": result, "problems": problems}
+        Path(args.json_path).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    
+    for problem in problems:
+        print(f"FAIL: {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
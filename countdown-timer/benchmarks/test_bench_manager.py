@@ -0,0 +1,48 @@
+"""EventManager, Validator and Formatter benchmarks."""
+
+import itertools
+
+from bench_data import make_events
+from src.countdown_timer.event_manager import EventManager
+from src.countdown_timer.formatter import Formatter
+from src.countdown_timer.storage import Storage
+from src.countdown_timer.validator import Validator
+
+
+def test_create_event(benchmark, storage):
+    """Validated create on a full store (duplicate check, write, counters)."""
+    manager = EventManager(storage)
+    manager.get_stats()
+    counter = itertools.count()
+    
+    benchmark.pedantic(
+        manager.create_event,
+        setup=lambda: ((f"新事件{next(counter):07d}", "2030-03-15"), {}),
+    )
+
+
+def test_list_events(benchmark, storage, size):
+    assert len(benchmark(EventManager(storage).list_events)) >= size
+
+
+def test_get_stats(benchmark, storage, size):
+    """Stats with warm counters (the path every API poll takes)."""
+    manager = EventManager(storage)
+    assert benchmark(manager.get_stats)["total"] >= size
+
+
+def test_validate_events(benchmark, size):
+    """Validate size (name, date) pairs."""
+    pairs = [(e["name"], e["target_date"]) for e in make_events(size).values()]
+
+    def validate_all():
+        for name, target_date in pairs:
+            Validator.validate_event(name, target_date)
+    
+    benchmark(validate_all)
+
+
+def test_format_events_list(benchmark, size):
+    """Render a full listing for the CLI."""
+    events = Storage._with_countdowns(list(make_events(size).values()))
+    assert benchmark(Formatter.format_events_list, events).count("\n") == size - 1
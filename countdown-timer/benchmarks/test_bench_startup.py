@@ -0,0 +1,58 @@
+"""CLI cold-start import time (python -X importtime) against a budget."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+# Cold-start budget for the package's own imports in `countdown show`
+# (interpreter and click excluded); override on slow machines
+SHOW_BUDGET_MS = float(os.environ.get("COUNTDOWN_IMPORT_BUDGET_MS", "100"))
+
+
+def _importtime(home: str, *args: str) -> List[Tuple[int, str]]:
+    """
+    Run Python with -X importtime.
+    
+    Returns:
+        (cumulative microseconds, module name) for every imported
+        module; the name keeps its indentation (one space at the top
+        of the import tree, two more per nesting level)
+    """
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR), "COUNTDOWN_HOME": home}
+    env.pop("COUNTDOWN_STORAGE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        env=env, capture_output=True, text=True, encoding="utf-8", timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        modules.append((int(cumulative), name))
+    return modules
+
+
+def test_show_import_budget(tmp_path):
+    """The package's import time for `countdown show` should stay within budget."""
+    home = str(tmp_path)
+    _importtime(home, "-m", "countdown_timer.cli", "add", "生日", "2030-03-15")
+
+    def cost() -> float:
+        modules = _importtime(home, "-m", "countdown_timer.cli", "show", "生日")
+        # Top-level entries (one leading space) of the package, including what they pull in
+        return sum(
+            us for us, name in modules
+            if name.startswith(" countdown_timer") and not name.startswith("  ")
+        ) / 1000
+    
+    # Best of three to ignore a busy machine
+    best = min(cost() for _ in range(3))
+    assert best <= SHOW_BUDGET_MS, f"countdown show imports took {best:.1f} ms (budget {SHOW_BUDGET_MS} ms)"
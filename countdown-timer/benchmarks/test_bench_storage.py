@@ -0,0 +1,46 @@
+"""Storage benchmarks (every backend, every size)."""
+
+from src.countdown_timer.backends import create_storage
+
+
+def test_cold_open_and_list(benchmark, storage, size):
+    """Open the store in a new instance and read every event (CLI-style cold start)."""
+    backend = type(storage).__name__
+    if backend == "MemoryStorage":
+        # Nothing to reopen: measure the same read on the warm store
+        setup = lambda: ((storage,), {})
+    else:
+        name = "json" if backend == "Storage" else "sqlite"
+        setup = lambda: ((create_storage(name, str(storage.storage_dir)),), {})
+    
+    events = benchmark.pedantic(lambda s: s.get_all_events(), setup=setup)
+    assert len(events) == size
+
+
+def test_get_all_events(benchmark, storage, size):
+    assert len(benchmark(storage.get_all_events)) == size
+
+
+def test_get_event(benchmark, storage, size):
+    assert benchmark(storage.get_event, f"事件{size // 2:07d}") is not None
+
+
+def test_get_upcoming_events(benchmark, storage):
+    assert len(benchmark(storage.get_upcoming_events, 10)) == 10
+
+
+def test_count_events(benchmark, storage):
+    assert benchmark(storage.count_events, "ACTIVE") > 0
+
+
+def test_search_events(benchmark, storage):
+    assert benchmark(storage.search_events, "事件00001", 20)
+
+
+def test_add_and_delete_event(benchmark, storage):
+    """One insert plus one delete against a full store."""
+    def add_and_delete():
+        storage.add_event("基准事件", "2030-03-15")
+        storage.delete_event("基准事件")
+    
+    benchmark(add_and_delete)
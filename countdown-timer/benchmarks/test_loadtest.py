@@ -0,0 +1,50 @@
+"""Smoke runs of the HTTP load test (short, no latency limits)."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from loadtest import ROUTES, percentile
+
+
+LOADTEST = Path(__file__).resolve().parent / "loadtest.py"
+
+
+def _run(tmp_path, *args: str) -> dict:
+    output = tmp_path / "load.json"
+    result = subprocess.run(
+        [sys.executable, str(LOADTEST), "--events", "200", "--concurrency", "4", "--duration", "1",
+         "--json", str(output), *args],
+        capture_output=True, text=True, encoding="utf-8", timeout=120,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    return json.loads(output.read_text(encoding="utf-8"))["result"]
+
+
+def test_percentile():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_in_process(tmp_path):
+    """Every route of the workload should be exercised without errors."""
+    result = _run(tmp_path, "--storage", "memory")
+    
+    assert set(result["routes"]) == set(ROUTES.values())
+    assert result["total"]["errors"] == 0
+    assert result["loop_lag"]["max"] >= 0
+
+
+def test_uvicorn(tmp_path):
+    pytest.importorskip("uvicorn")
+    result = _run(tmp_path, "--server", "uvicorn")
+    
+    assert result["total"]["requests"] > 0
+    assert result["total"]["errors"] == 0
+    assert "loop_lag" not in result
@@ -8,6 +8,7 @@ setup(
     python_requires=">=3.11",
     install_requires=[
         "click>=8.1.0",
+        "python-dateutil>=2.8.0",
         "pytest>=7.4.0",
         "pytest-cov>=4.1.0",
     ],
@@ -28,6 +29,13 @@ setup(
             "celery>=5.3.0",
             "pytz>=2023.3",
         ],
+        "speedups": [
+            "numpy>=1.24.0",
+        ],
+        "widget": [
+            "msgpack>=1.0.0",
+            "cbor2>=5.4.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -1,16 +1,70 @@
 """Event countdown tool - Main package."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "1.0.0"
 __author__ = "Your Team"
 
-from .event_manager import EventManager
-from .storage import Storage
-from .validator import Validator
-from .formatter import Formatter
-
-__all__ = [
-    "EventManager",
-    "Storage",
-    "Validator",
-    "Formatter",
-]
+# Public name -> submodule defining it. Submodules are imported on first
+# attribute access (PEP 562), so `import countdown_timer.cli` does not
+# load asyncio, SQLite, dateutil or zoneinfo unless a command needs them.
+_LAZY = {
+    "EventManager": "event_manager",
+    "AsyncEventManager": "async_manager",
+    "Storage": "storage",
+    "StorageError": "storage",
+    "JournalStorage": "journal_storage",
+    "SQLiteStorage": "sqlite_storage",
+    "MemoryStorage": "memory_storage",
+    "StorageBackend": "backends",
+    "create_storage": "backends",
+    "register_backend": "backends",
+    "Validator": "validator",
+    "Formatter": "formatter",
+    "EventImporter": "transfer",
+    "export_events": "transfer",
+    "TenantRegistry": "tenants",
+    "ReminderScheduler": "notifier",
+    "LogSink": "notifier",
+    "MemorySink": "notifier",
+    "StatusRollover": "rollover",
+    "today_ordinal": "clock",
+    "zone_day": "clock",
+    "next_occurrence": "recurrence",
+    "normalize_rule": "recurrence",
+}
+
+__all__ = list(_LAZY)
+
+if TYPE_CHECKING:
+    from .event_manager import EventManager
+    from .async_manager import AsyncEventManager
+    from .storage import Storage, StorageError
+    from .journal_storage import JournalStorage
+    from .sqlite_storage import SQLiteStorage
+    from .memory_storage import MemoryStorage
+    from .backends import StorageBackend, create_storage, register_backend
+    from .validator import Validator
+    from .formatter import Formatter
+    from .transfer import EventImporter, export_events
+    from .tenants import TenantRegistry
+    from .notifier import LogSink, MemorySink, ReminderScheduler
+    from .rollover import StatusRollover
+    from .clock import today_ordinal, zone_day
+    from .recurrence import next_occurrence, normalize_rule
+
+
+def __getattr__(name: str):
+    """Import the submodule defining a public name on first access."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # Cache it so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,125 @@
+"""条件请求 - ETag / Last-Modified 校验"""
+
+import time
+from datetime import date, datetime, time as dt_time
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Mapping, Optional, Tuple
+
+from fastapi import Response
+
+from .. import clock
+from ..async_manager import AsyncEventManager
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    If-None-Match 是否包含指定的 ETag (弱比较，RFC 9110 13.1.2)
+    
+    Args:
+        if_none_match: If-None-Match 请求头的值
+        etag: 当前的强 ETag
+    """
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
+class CacheValidators:
+    """
+    根据存储版本生成读接口的校验器。
+    
+    读接口的响应只取决于存储内容和今天的日期 (剩余天数、状态)，
+    因此 ETag 由 存储修订号 + 今天序数 组成 (指定时区时为该时区的今天)。修订号由存储本身
+    保存 (见 Storage.revision)，多个 worker 进程和重启后都一致。
+    
+    命中的条件请求直接返回 304，不读取事件也不做序列化。响应按租户区分，
+    因此同时发送 Vary: X-Tenant-ID，共享缓存不会把一个租户的响应返回给另一个租户。
+    """
+
+    def __init__(self, events: AsyncEventManager):
+        """
+        Args:
+            events: 异步事件管理器 (在线程池中读取存储版本)
+        """
+        self.events = events
+        self._revision: Optional[str] = None
+        self._modified = 0.0
+
+    async def current(self, tz: Optional[str] = None) -> Tuple[str, float]:
+        """
+        当前的 ETag 和最后修改时间
+        
+        Args:
+            tz: 请求的 IANA 时区，None 表示服务器时区
+            
+        Returns:
+            (强 ETag, 最后修改时间戳)
+        """
+        revision = await self.events.revision()
+        if revision != self._revision:
+            self._revision = revision
+            self._modified = time.time()
+        
+        # 跨天后所有剩余天数都变了，最后修改时间不早于今天零点
+        if tz is None:
+            today = date.today()
+            ordinal = today.toordinal()
+            midnight = datetime.combine(today, dt_time()).timestamp()
+        else:
+            ordinal, midnight = clock.zone_day(tz)
+        etag = f'"{revision}-{ordinal}"'
+        return etag, max(self._modified, midnight)
+
+    async def check(
+        self,
+        headers: Mapping[str, str],
+        response: Response,
+        tz: Optional[str] = None,
+    ) -> Optional[Response]:
+        """
+        处理条件请求
+        
+        未修改时返回 304 响应；否则把校验器写入 response 的头部并返回 None。
+        
+        Args:
+            headers: 请求头
+            response: 正常响应 (用于设置头部)
+            tz: 请求的 IANA 时区，None 表示服务器时区
+            
+        Returns:
+            304 响应，或 None 表示需要正常处理请求
+        """
+        etag, modified = await self.current(tz)
+        validators = {
+            "ETag": etag,
+            "Last-Modified": formatdate(modified, usegmt=True),
+            "Cache-Control": "no-cache",
+            "Vary": "X-Tenant-ID",
+        }
+        
+        if self._is_fresh(headers, etag, modified):
+            return Response(status_code=304, headers=validators)
+        
+        response.headers.update(validators)
+        return None
+
+    @staticmethod
+    def _is_fresh(headers: Mapping[str, str], etag: str, modified: float) -> bool:
+        """
+        判断客户端缓存是否仍然有效 (RFC 9110 13.2.2)
+        
+        If-None-Match 存在时忽略 If-Modified-Since。
+        """
+        if_none_match = headers.get("if-none-match")
+        if if_none_match is not None:
+            return etag_matches(if_none_match, etag)
+        
+        if_modified_since = headers.get("if-modified-since")
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            # HTTP 日期只精确到秒
+            return int(modified) <= since
+        
+        return False
@@ -2,29 +2,50 @@
 
 from pydantic import BaseModel, Field
 from typing import Optional
-from datetime import date
+import datetime
 
 
 class EventBase(BaseModel):
     """事件基础数据模型"""
     name: str = Field(..., min_length=1, max_length=256, description="事件名称")
-    date: date = Field(..., description="事件日期 (YYYY-MM-DD)")
+    date: datetime.date = Field(..., description="事件日期 (YYYY-MM-DD)")
+
+
+# 重复规则的说明 (见 recurrence.normalize_rule)
+RECURRENCE_HELP = "重复规则: yearly / monthly / every N days / RRULE:FREQ=... (省略则不重复)"
 
 
 class EventCreate(EventBase):
-    """创建事件请求模型"""
-    pass
+    """创建事件请求模型 (重复事件的 date 为首次日期，可以早于今天)"""
+    recurrence: Optional[str] = Field(None, max_length=256, description=RECURRENCE_HELP)
 
 
 class EventUpdate(BaseModel):
     """更新事件请求模型"""
-    date: Optional[date] = Field(None, description="新的事件日期")
+    date: Optional[datetime.date] = Field(None, description="新的事件日期")
+    recurrence: Optional[str] = Field(
+        None, max_length=256, description="新的重复规则 (none 表示不再重复，省略则保持不变)"
+    )
+
+
+class Reminder(BaseModel):
+    """事件的一条提醒规则"""
+    days_before: int = Field(..., gt=0, description="提前天数")
+    notification_type: str = Field("PUSH", description="通知方式: PUSH/EMAIL/SMS")
+
+
+class ReminderUpdate(BaseModel):
+    """设置提醒请求模型 (替换事件的全部提醒规则，空列表表示取消提醒)"""
+    days_before: list[int] = Field(..., max_length=366, description="提前天数，如 [7, 3, 1]")
+    notification_type: str = Field("PUSH", description="通知方式: PUSH/EMAIL/SMS")
 
 
 class Event(EventBase):
-    """事件响应模型"""
+    """事件响应模型 (重复事件的 date 为下一次日期)"""
     status: str = Field(..., description="事件状态: ACTIVE/CURRENT/EXPIRED")
     days_remaining: int = Field(..., ge=0, description="剩余天数")
+    recurrence: Optional[str] = Field(None, description="重复规则 (不重复时为空)")
+    reminders: list[Reminder] = Field(default_factory=list, description="提醒规则")
 
     class Config:
         from_attributes = True
@@ -34,18 +55,83 @@ class EventListResponse(BaseModel):
     """事件列表响应模型"""
     events: list[Event] = Field(..., description="事件列表")
     total: int = Field(..., ge=0, description="事件总数")
+    next_cursor: Optional[str] = Field(None, description="下一页游标 (分页查询且还有更多事件时)")
 
 
 class StatsResponse(BaseModel):
     """统计数据响应模型"""
     total_events: int = Field(..., ge=0, description="总事件数")
     active_events: int = Field(..., ge=0, description="进行中事件")
+    current_events: int = Field(0, ge=0, description="今天到期事件")
     expired_events: int = Field(..., ge=0, description="已过期事件")
     next_event: Optional[str] = Field(None, description="下一个事件名称")
     next_event_days: Optional[int] = Field(None, description="下一个事件剩余天数")
 
 
+class WidgetEvent(BaseModel):
+    """小组件中的单个倒计时"""
+    name: str = Field(..., description="事件名称")
+    date: datetime.date = Field(..., description="事件日期 (重复事件为下一次日期)")
+    days: int = Field(..., ge=0, description="剩余天数")
+
+
+class WidgetResponse(BaseModel):
+    """小组件响应模型 (也可按 Accept 编码为 MessagePack/CBOR)"""
+    date: datetime.date = Field(..., description="生成数据时的今天")
+    events: list[WidgetEvent] = Field(..., description="最近的未过期事件，按日期排序")
+
+
 class ErrorResponse(BaseModel):
     """错误响应模型"""
     detail: str = Field(..., description="错误详情")
     code: str = Field(..., description="错误代码")
+
+
+# 单次批量请求最多包含的事件数
+MAX_BATCH_SIZE = 10000
+
+
+class BatchEventItem(BaseModel):
+    """批量创建中的单个事件 (逐项校验，不合法的项只影响自身结果)"""
+    name: str = Field(..., description="事件名称")
+    date: str = Field(..., description="事件日期 (YYYY-MM-DD)")
+    recurrence: Optional[str] = Field(None, max_length=256, description=RECURRENCE_HELP)
+
+
+class EventBatchCreate(BaseModel):
+    """批量创建事件请求模型"""
+    events: list[BatchEventItem] = Field(..., max_length=MAX_BATCH_SIZE, description="要创建的事件")
+
+
+class EventBatchDelete(BaseModel):
+    """批量删除事件请求模型"""
+    names: list[str] = Field(..., max_length=MAX_BATCH_SIZE, description="要删除的事件名称")
+
+
+class BatchItemResult(BaseModel):
+    """批量操作中单个事件的结果"""
+    name: str = Field(..., description="事件名称")
+    ok: bool = Field(..., description="是否成功")
+    event: Optional[Event] = Field(None, description="创建的事件 (仅批量创建成功时)")
+    error: Optional[str] = Field(None, description="失败原因")
+
+
+class BatchResponse(BaseModel):
+    """批量操作响应模型"""
+    results: list[BatchItemResult] = Field(..., description="逐项结果 (与请求顺序一致)")
+    succeeded: int = Field(..., ge=0, description="成功数")
+    failed: int = Field(..., ge=0, description="失败数")
+
+
+class ImportFailure(BaseModel):
+    """导入失败的单行"""
+    line: int = Field(..., ge=1, description="行号")
+    name: Optional[str] = Field(None, description="事件名称 (无法解析时为空)")
+    error: str = Field(..., description="失败原因")
+
+
+class ImportResponse(BaseModel):
+    """导入结果响应模型"""
+    imported: int = Field(..., ge=0, description="成功导入数")
+    failed: int = Field(..., ge=0, description="失败数")
+    errors: list[ImportFailure] = Field(..., description="失败明细 (最多 100 条)")
@@ -1,89 +1,394 @@
 """API 路由定义"""
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+import base64
+import codecs
+import json
 from datetime import datetime, date
-from typing import Optional
+from typing import AsyncIterator, Literal, Optional
 
-from ..event_manager import EventManager
-from ..storage import EventStorage
+from .. import clock
+from ..backends import create_storage
+from ..transfer import EventImporter, export_events
 from .models import (
     Event,
     EventCreate,
     EventUpdate,
+    ReminderUpdate,
     EventListResponse,
     StatsResponse,
     ErrorResponse,
+    EventBatchCreate,
+    EventBatchDelete,
+    BatchItemResult,
+    BatchResponse,
+    ImportResponse,
+    WidgetResponse,
 )
+from .conditional import etag_matches
+from .tenants import Tenant, tenant_registry
+from .widget import MAX_WIDGET_EVENTS, negotiate
 
 router = APIRouter(tags=["Events"])
 
-# 初始化存储和管理器
-storage = EventStorage()
-manager = EventManager(storage)
+
+def _to_event(event_data: dict) -> Event:
+    """将存储层事件数据转换为 API 响应模型"""
+    return Event(
+        name=event_data["name"],
+        date=datetime.strptime(event_data["target_date"], "%Y-%m-%d").date(),
+        status=event_data.get("status", "ACTIVE"),
+        days_remaining=event_data.get("remaining_days", 0),
+        recurrence=event_data.get("recurrence"),
+        reminders=event_data.get("reminders") or [],
+    )
+
+
+# 分页查询的默认和最大每页事件数
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+
+def _encode_cursor(sort: str, key: tuple) -> str:
+    """将 (排序, target_ordinal, name) 编码为不透明的游标"""
+    raw = json.dumps([sort, *key], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """
+    解码游标
+    
+    Returns:
+        (排序, (target_ordinal, name))
+        
+    Raises:
+        ValueError: 游标无效
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort, ordinal, name = json.loads(raw)
+        if not isinstance(sort, str) or not isinstance(ordinal, int) or not isinstance(name, str):
+            raise TypeError
+    except (ValueError, TypeError) as e:
+        raise ValueError("无效的分页游标") from e
+    return sort, (ordinal, name)
+
+
+def _build_stats(stats: dict) -> StatsResponse:
+    """将管理器的统计数据 (计数器增量维护，无需扫描全部事件) 转换为响应模型"""
+    
+    # 下一个最近的事件 (target_date >= 今天的第一条)
+    next_event = None
+    next_days = None
+    upcoming = stats["next_event"]
+    if upcoming:
+        next_event = upcoming["name"]
+        next_days = upcoming.get("remaining_days", 0)
+    
+    return StatsResponse(
+        total_events=stats["total"],
+        active_events=stats["active"],
+        current_events=stats["current"],
+        expired_events=stats["expired"],
+        next_event=next_event,
+        next_event_days=next_days,
+    )
+
+
+def _batch_response(results: list) -> BatchResponse:
+    """将管理器的逐项结果转换为批量响应"""
+    items = [
+        BatchItemResult(
+            name=r["name"],
+            ok=r["ok"],
+            event=_to_event(r["event"]) if "event" in r else None,
+            error=r.get("error"),
+        )
+        for r in results
+    ]
+    succeeded = sum(1 for item in items if item.ok)
+    return BatchResponse(results=items, succeeded=succeeded, failed=len(items) - succeeded)
+
+
+def _stats_data(stats: dict) -> dict:
+    """推送给事件流订阅者的统计数据"""
+    return _build_stats(stats).model_dump()
+
+
+# 存储后端由 $COUNTDOWN_STORAGE 选择 (与 CLI 相同，默认 sqlite)。
+# 默认租户 (未指定 X-Tenant-ID 的请求) 使用原有的数据目录。
+# 每个租户的存储、线程池 (磁盘 I/O 和锁等待不阻塞事件循环)、
+# ETag 校验器和实时推送都是独立的，见 Tenant。
+storage = create_storage()
+default_tenant = Tenant(storage, _stats_data)
+manager = default_tenant.manager
+async_manager = default_tenant.events
+validators = default_tenant.validators
+stream = default_tenant.stream
+
+# 其他租户按 ID 分片存储在 tenants/<租户 ID>/ 下 (同一后端)，只保持最近使用的租户打开
+tenants = tenant_registry(_stats_data)
+
+
+async def get_tenant(
+    x_tenant_id: Optional[str] = Header(None, description="租户 ID (省略时使用默认数据)"),
+) -> AsyncIterator[Tenant]:
+    """
+    解析请求所属的租户
+    
+    请求处理完毕 (流式响应发送完毕) 前租户保持打开，不会被移出 LRU。
+    释放时若租户已被移出，会关闭它并等待其线程池中的任务完成，因此放到线程池中进行。
+    """
+    if x_tenant_id is None:
+        yield default_tenant
+        return
+    
+    try:
+        # 首次访问需要打开数据库，放到线程池中进行
+        tenant = await run_in_threadpool(tenants.acquire, x_tenant_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        yield tenant
+    finally:
+        await run_in_threadpool(tenants.release, x_tenant_id)
+
+
+def get_tz(
+    tz: Optional[str] = Query(
+        None, description="计算剩余天数和状态使用的 IANA 时区，例如 Asia/Shanghai (默认服务器时区)"
+    ),
+) -> Optional[str]:
+    """校验请求的时区"""
+    if tz is not None:
+        try:
+            clock.get_zone(tz)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    return tz
+
+
+def _today(tz: Optional[str]) -> Optional[int]:
+    """时区的今天序数 (按时区缓存到当地零点)；None 表示服务器的今天"""
+    return None if tz is None else clock.today_ordinal(tz)
 
 
 @router.get("/events", response_model=EventListResponse, summary="获取所有事件")
 async def list_events(
-    status: Optional[str] = Query(None, description="筛选状态: ACTIVE/CURRENT/EXPIRED")
+    request: Request,
+    response: Response,
+    status: Optional[str] = Query(None, description="筛选状态: ACTIVE/CURRENT/EXPIRED"),
+    from_date: Optional[date] = Query(None, alias="from", description="起始日期 (含)"),
+    to_date: Optional[date] = Query(None, alias="to", description="截止日期 (含)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="每页事件数"),
+    sort: Optional[Literal["date", "name", "remaining"]] = Query(
+        None, description="排序: date (日期) / name (名称) / remaining (剩余天数)"
+    ),
+    cursor: Optional[str] = Query(None, description="上一页返回的 next_cursor"),
+    tz: Optional[str] = Depends(get_tz),
+    tenant: Tenant = Depends(get_tenant),
 ):
-    """获取所有事件，可按状态筛选"""
+    """
+    获取事件，可按状态和日期范围筛选
+    
+    指定 limit、sort 或 cursor 时分页返回: 每页直接从排序索引中取出，
+    响应中的 next_cursor 用于获取下一页。
+    """
+    not_modified = await tenant.validators.check(request.headers, response, tz)
+    if not_modified:
+        return not_modified
+    
+    today = _today(tz)
     try:
-        all_events = manager.list_events()
+        if limit or sort or cursor:
+            after = None
+            if cursor:
+                cursor_sort, after = _decode_cursor(cursor)
+                if sort and sort != cursor_sort:
+                    raise ValueError("游标与排序方式不一致")
+                sort = cursor_sort
+            sort = sort or "date"
+            
+            page, next_key = await tenant.events.events_page(
+                sort,
+                after,
+                limit or DEFAULT_PAGE_SIZE,
+                status,
+                from_date.isoformat() if from_date else None,
+                to_date.isoformat() if to_date else None,
+                today,
+            )
+            events = [_to_event(e) for e in page]
+            next_cursor = _encode_cursor(sort, next_key) if next_key else None
+            return EventListResponse(events=events, total=len(events), next_cursor=next_cursor)
         
-        # 如果指定了状态筛选
-        if status:
-            all_events = [e for e in all_events if e.get("status") == status]
+        if from_date or to_date:
+            # 日期范围查询 (按日期索引，结果按日期排序)
+            all_events = await tenant.events.events_between(
+                from_date.isoformat() if from_date else None,
+                to_date.isoformat() if to_date else None,
+                today=today,
+            )
+            if status:
+                all_events = [e for e in all_events if e["status"] == status]
+        elif status:
+            # 如果指定了状态筛选 (按 target_date 索引范围查询)
+            all_events = await tenant.events.get_event_by_status(status, today)
+        else:
+            all_events = await tenant.events.list_events(today)
         
         # 转换为 API 响应格式
-        events = [
-            Event(
-                name=e["name"],
-                date=datetime.strptime(e["date"], "%Y-%m-%d").date(),
-                status=e.get("status", "ACTIVE"),
-                days_remaining=e.get("days_remaining", 0),
-            )
-            for e in all_events
-        ]
+        events = [_to_event(e) for e in all_events]
         
         return EventListResponse(events=events, total=len(events))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"获取事件失败: {str(e)}")
 
 
 @router.post("/events", response_model=Event, status_code=201, summary="创建新事件")
-async def create_event(event: EventCreate):
+async def create_event(event: EventCreate, tenant: Tenant = Depends(get_tenant)):
     """创建一个新的倒计时事件"""
     try:
         # 验证并创建事件
-        result = manager.create_event(
+        event_data = await tenant.events.create_event(
             event.name,
-            event.date.strftime("%Y-%m-%d")
-        )
-        
-        if not result.get("success"):
-            raise HTTPException(
-                status_code=400,
-                detail=result.get("error", "创建事件失败")
-            )
-        
-        event_data = result.get("event", {})
-        return Event(
-            name=event_data["name"],
-            date=event.date,
-            status=event_data.get("status", "ACTIVE"),
-            days_remaining=event_data.get("days_remaining", 0),
+            event.date.strftime("%Y-%m-%d"),
+            event.recurrence,
         )
+        created = _to_event(event_data)
+        await tenant.stream.publish({"op": "created", "event": created.model_dump(mode="json")})
+        return created
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"创建事件失败: {str(e)}")
 
 
+@router.post("/events:batch", response_model=BatchResponse, summary="批量创建事件")
+async def create_events(batch: EventBatchCreate, tenant: Tenant = Depends(get_tenant)):
+    """批量创建事件: 逐项校验，所有合法事件一次写入存储"""
+    try:
+        results = await tenant.events.create_events(
+            (item.name, item.date, item.recurrence) for item in batch.events
+        )
+        response = _batch_response(results)
+        if response.succeeded:
+            await tenant.stream.publish()
+        return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"批量创建事件失败: {str(e)}")
+
+
+@router.delete("/events:batch", response_model=BatchResponse, summary="批量删除事件")
+async def delete_events(batch: EventBatchDelete, tenant: Tenant = Depends(get_tenant)):
+    """批量删除事件: 一次写入存储，返回逐项结果"""
+    try:
+        response = _batch_response(await tenant.events.delete_events(batch.names))
+        if response.succeeded:
+            await tenant.stream.publish()
+        return response
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"批量删除事件失败: {str(e)}")
+
+
+@router.get("/events/search", response_model=EventListResponse, summary="搜索事件")
+async def search_events(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=256, description="名称中包含的文字 (不区分大小写)"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="最多返回的事件数"),
+    tz: Optional[str] = Depends(get_tz),
+    tenant: Tenant = Depends(get_tenant),
+):
+    """按名称搜索事件: 前缀匹配在前，其余包含匹配在后，由名称索引直接查找"""
+    not_modified = await tenant.validators.check(request.headers, response, tz)
+    if not_modified:
+        return not_modified
+    
+    try:
+        events = [_to_event(e) for e in await tenant.events.search_events(q, limit, _today(tz))]
+        return EventListResponse(events=events, total=len(events))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"搜索事件失败: {str(e)}")
+
+
+@router.get("/events/export", summary="导出所有事件 (流式 NDJSON/CSV)")
+async def export_all_events(
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="导出格式"),
+    tz: Optional[str] = Depends(get_tz),
+    tenant: Tenant = Depends(get_tenant),
+):
+    """分块读取并流式发送所有事件，扫描完成前即开始输出 (每块在线程池中读取)"""
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    chunks = export_events(tenant.manager, format, today=_today(tz))
+
+    async def body():
+        async for chunk in tenant.events.iterate(chunks):
+            yield chunk.encode("utf-8")
+    
+    return StreamingResponse(
+        body(),
+        media_type=f"{media_type}; charset=utf-8",
+        headers={"Content-Disposition": f'attachment; filename="events.{format}"'},
+    )
+
+
+@router.post("/events/import", response_model=ImportResponse, summary="导入事件 (流式 NDJSON/CSV)")
+async def import_events(
+    request: Request,
+    format: Optional[Literal["ndjson", "csv"]] = Query(
+        None, description="导入格式 (默认根据 Content-Type，否则 ndjson)"
+    ),
+    chunk_size: int = Query(1000, ge=1, le=10000, description="每批校验并写入的事件数"),
+    tenant: Tenant = Depends(get_tenant),
+):
+    """边接收请求体边解析，按批次校验并写入 (在线程池中)，内存占用与文件大小无关"""
+    if format is None:
+        format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+    
+    try:
+        importer = EventImporter(tenant.manager, format, chunk_size)
+        decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        tail = ""
+        async for data in request.stream():
+            lines = (tail + decoder.decode(data)).split("\n")
+            tail = lines.pop()
+            await tenant.events.run(importer.feed, lines)
+        await tenant.events.run(importer.feed, [tail + decoder.decode(b"", final=True)])
+        summary = await tenant.events.run(importer.finish)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"导入事件失败: {str(e)}")
+    
+    if summary["imported"]:
+        await tenant.stream.publish()
+    return ImportResponse(**summary)
+
+
 @router.get("/events/{name}", response_model=Event, summary="获取事件详情")
-async def get_event(name: str):
+async def get_event(
+    name: str,
+    request: Request,
+    response: Response,
+    tz: Optional[str] = Depends(get_tz),
+    tenant: Tenant = Depends(get_tenant),
+):
     """获取指定事件的详细信息"""
+    not_modified = await tenant.validators.check(request.headers, response, tz)
+    if not_modified:
+        return not_modified
+    
     try:
-        event_data = manager.get_event(name)
+        event_data = await tenant.events.get_event(name, _today(tz))
         
         if not event_data:
             raise HTTPException(
@@ -91,12 +396,7 @@ async def get_event(name: str):
                 detail=f"事件 '{name}' 不存在"
             )
         
-        return Event(
-            name=event_data["name"],
-            date=datetime.strptime(event_data["date"], "%Y-%m-%d").date(),
-            status=event_data.get("status", "ACTIVE"),
-            days_remaining=event_data.get("days_remaining", 0),
-        )
+        return _to_event(event_data)
     except HTTPException:
         raise
     except Exception as e:
@@ -104,54 +404,72 @@ async def get_event(name: str):
 
 
 @router.put("/events/{name}", response_model=Event, summary="更新事件")
-async def update_event(name: str, event: EventUpdate):
+async def update_event(name: str, event: EventUpdate, tenant: Tenant = Depends(get_tenant)):
     """更新指定事件"""
     try:
         # 首先检查事件是否存在
-        existing = manager.get_event(name)
+        existing = await tenant.events.get_event(name)
         if not existing:
             raise HTTPException(
                 status_code=404,
                 detail=f"事件 '{name}' 不存在"
             )
         
-        # 删除旧事件
-        delete_result = manager.delete_event(name)
-        if not delete_result.get("success"):
-            raise HTTPException(status_code=400, detail="更新事件失败")
-        
-        # 创建新事件
-        new_date = event.date if event.date else datetime.strptime(existing["date"], "%Y-%m-%d").date()
-        create_result = manager.create_event(name, new_date.strftime("%Y-%m-%d"))
-        
-        if not create_result.get("success"):
+        # 更新日期 (统计计数器随之增量更新)；重复事件默认保持首次日期
+        if event.date:
+            new_date = event.date.strftime("%Y-%m-%d")
+        else:
+            new_date = existing.get("start_date") or existing["target_date"]
+        event_data = await tenant.events.update_event(name, new_date, event.recurrence)
+        if event_data is None:
             raise HTTPException(status_code=400, detail="更新事件失败")
         
-        event_data = create_result.get("event", {})
-        return Event(
-            name=event_data["name"],
-            date=new_date,
-            status=event_data.get("status", "ACTIVE"),
-            days_remaining=event_data.get("days_remaining", 0),
-        )
+        updated = _to_event(event_data)
+        await tenant.stream.publish({"op": "updated", "event": updated.model_dump(mode="json")})
+        return updated
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"更新事件失败: {str(e)}")
 
 
+@router.put("/events/{name}/reminders", response_model=Event, summary="设置事件提醒")
+async def set_reminders(name: str, reminders: ReminderUpdate, tenant: Tenant = Depends(get_tenant)):
+    """在事件前 N 天提醒 (替换原有规则)；规则随事件保存，服务重启后仍然有效"""
+    try:
+        event_data = await tenant.events.set_reminders(
+            name, reminders.days_before, reminders.notification_type
+        )
+        if event_data is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"事件 '{name}' 不存在"
+            )
+        
+        updated = _to_event(event_data)
+        await tenant.stream.publish({"op": "updated", "event": updated.model_dump(mode="json")})
+        return updated
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"设置提醒失败: {str(e)}")
+
+
 @router.delete("/events/{name}", status_code=204, summary="删除事件")
-async def delete_event(name: str):
+async def delete_event(name: str, tenant: Tenant = Depends(get_tenant)):
     """删除指定事件"""
     try:
-        result = manager.delete_event(name)
-        
-        if not result.get("success"):
+        if not await tenant.events.delete_event(name):
             raise HTTPException(
                 status_code=404,
                 detail=f"事件 '{name}' 不存在"
             )
         
+        await tenant.stream.publish({"op": "deleted", "name": name})
         return None
     except HTTPException:
         raise
@@ -160,31 +478,73 @@ async def delete_event(name: str):
 
 
 @router.get("/stats", response_model=StatsResponse, summary="获取统计数据")
-async def get_stats():
+async def get_stats(
+    request: Request,
+    response: Response,
+    tz: Optional[str] = Depends(get_tz),
+    tenant: Tenant = Depends(get_tenant),
+):
     """获取事件统计信息"""
+    not_modified = await tenant.validators.check(request.headers, response, tz)
+    if not_modified:
+        return not_modified
+    
     try:
-        all_events = manager.list_events()
-        
-        total = len(all_events)
-        active = len([e for e in all_events if e.get("status") == "ACTIVE"])
-        expired = len([e for e in all_events if e.get("status") == "EXPIRED"])
-        
-        # 找下一个最近的事件
-        next_event = None
-        next_days = None
-        active_events = [e for e in all_events if e.get("status") in ["ACTIVE", "CURRENT"]]
-        if active_events:
-            # 按剩余天数排序
-            active_events.sort(key=lambda x: x.get("days_remaining", 0))
-            next_event = active_events[0]["name"]
-            next_days = active_events[0].get("days_remaining", 0)
-        
-        return StatsResponse(
-            total_events=total,
-            active_events=active,
-            expired_events=expired,
-            next_event=next_event,
-            next_event_days=next_days,
-        )
+        return _build_stats(await tenant.events.get_stats(_today(tz)))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"获取统计数据失败: {str(e)}")
+
+
+@router.get(
+    "/widget",
+    response_model=WidgetResponse,
+    summary="获取小组件数据",
+    responses={200: {"content": {"application/msgpack": {}, "application/cbor": {}}}},
+)
+async def get_widget(
+    request: Request,
+    limit: int = Query(3, ge=1, le=MAX_WIDGET_EVENTS, description="事件数"),
+    tz: Optional[str] = Depends(get_tz),
+    tenant: Tenant = Depends(get_tenant),
+):
+    """
+    最近几个未过期事件的精简数据，供桌面小组件频繁刷新
+    
+    数据只在写操作或跨天后重新生成，响应直接使用缓存的编码结果。
+    剩余天数到下一个零点前不会变化，因此 Cache-Control 的 max-age
+    持续到该时区的零点，之后用 ETag 重新校验。
+    Accept 为 application/msgpack 或 application/cbor 且服务器安装了
+    对应的库时返回二进制编码，否则返回 JSON。
+    """
+    try:
+        widget = await tenant.widget.get(limit, tz)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"获取小组件数据失败: {str(e)}")
+    
+    media_type = negotiate(request.headers.get("accept"))
+    etag = widget.etag(media_type)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"max-age={tenant.widget.max_age(tz)}",
+        "Vary": "Accept, X-Tenant-ID",
+    }
+    if etag_matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(widget.body(media_type), media_type=media_type, headers=headers)
+
+
+@router.get("/stream", summary="订阅实时更新 (Server-Sent Events)")
+async def stream_updates(
+    tz: Optional[str] = Depends(get_tz),
+    tenant: Tenant = Depends(get_tenant),
+):
+    """
+    推送统计数据和事件变更
+    
+    连接后立即收到一次 stats，之后只在写操作、外部写入或跨天时推送。
+    """
+    return StreamingResponse(
+        tenant.stream.subscribe(tz),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,205 @@
+"""实时推送 - Server-Sent Events 事件流"""
+
+import asyncio
+import json
+from typing import AsyncIterator, Callable, Collection, Dict, Optional
+
+from .. import clock
+from ..async_manager import AsyncEventManager
+
+
+def format_sse(event: str, data: Dict) -> str:
+    """将一条消息编码为 SSE 帧"""
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+class EventStream:
+    """
+    向所有订阅者推送统计数据和事件变更。
+    
+    本进程内的写操作通过 publish() 立即推送变更和新的统计数据。
+    其他进程的写入 (例如 CLI) 和跨天由一个共享的后台任务检测：
+    它只比较存储版本和今天的日期，只有发生变化时才重新
+    计算统计数据，因此开销与打开的页面数量无关。
+    
+    读取版本和统计数据都在 AsyncEventManager 的线程池中进行，
+    不会阻塞事件循环。
+    
+    订阅者可以指定时区: 统计数据 (剩余天数、状态) 按时区各计算一次，
+    同一时区的订阅者共用同一帧；某个时区跨天时只刷新该时区的订阅者。
+    
+    消息类型:
+        stats: 最新统计数据
+        event: 单个事件变更 {"op": created/updated/deleted, ...}
+        refresh: 事件列表需要整体重新加载 (外部写入、跨天或消息积压)
+    """
+
+    def __init__(
+        self,
+        events: AsyncEventManager,
+        build_stats: Callable[[Dict], Dict],
+        poll_interval: float = 1.0,
+        keepalive: float = 15.0,
+        max_queue: int = 64,
+    ):
+        """
+        Args:
+            events: 异步事件管理器
+            build_stats: 将 EventManager.get_stats() 的结果转换为推送数据的函数
+            poll_interval: 检测外部写入和跨天的间隔 (秒)
+            keepalive: 无消息时发送心跳注释的间隔 (秒)
+            max_queue: 每个订阅者最多积压的消息数
+        """
+        self.events = events
+        self.build_stats = build_stats
+        self.poll_interval = poll_interval
+        self.keepalive = keepalive
+        self.max_queue = max_queue
+        # 订阅者队列 -> 时区 (None 表示服务器时区)
+        self._subscribers: Dict[asyncio.Queue, Optional[str]] = {}
+        # 上次推送统计数据时的存储版本，以及每个时区当时的今天序数
+        self._version: Optional[int] = None
+        self._days: Dict[Optional[str], int] = {}
+        self._watcher: Optional[asyncio.Task] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """当前订阅者数量"""
+        return len(self._subscribers)
+
+    async def publish(self, change: Optional[Dict] = None) -> None:
+        """
+        推送一次本进程内的写操作
+        
+        Args:
+            change: 事件变更，例如 {"op": "deleted", "name": "生日"}；
+                    None 表示批量变更，订阅者需要重新加载事件列表
+        """
+        if not self._subscribers:
+            return
+        frames = await self._stats_frames(set(self._subscribers.values()))
+        if change is None:
+            self._broadcast(format_sse("refresh", {}))
+        else:
+            self._broadcast(format_sse("event", change))
+        self._broadcast_stats(frames)
+
+    async def check(self) -> bool:
+        """
+        检测外部写入或跨天，有变化时推送 refresh 和统计数据
+        
+        Returns:
+            是否推送了消息
+        """
+        if not self._subscribers:
+            return False
+        
+        zones = set(self._subscribers.values())
+        if await self.events.version() != self._version:
+            stale = zones
+        else:
+            # 各时区的今天已缓存到该时区的零点，这里只是字典查找
+            stale = {tz for tz in zones if self._days.get(tz) != clock.today_ordinal(tz)}
+        if not stale:
+            return False
+        
+        frames = await self._stats_frames(stale)
+        self._broadcast(format_sse("refresh", {}), stale)
+        self._broadcast_stats(frames)
+        return True
+
+    async def subscribe(self, tz: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        订阅事件流
+        
+        先发送一次当前统计数据，之后只在有变化时发送消息，
+        空闲时定期发送心跳注释以保持连接。
+        
+        Args:
+            tz: 计算剩余天数使用的 IANA 时区，None 表示服务器时区
+            
+        Yields:
+            SSE 帧
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_queue)
+        self._subscribers[queue] = tz
+        if self._watcher is None:
+            self._watcher = asyncio.get_running_loop().create_task(self._watch())
+        
+        try:
+            yield (await self._stats_frames({tz}))[tz]
+            while True:
+                try:
+                    yield await asyncio.wait_for(queue.get(), self.keepalive)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+        finally:
+            del self._subscribers[queue]
+            if tz not in self._subscribers.values():
+                self._days.pop(tz, None)
+            if not self._subscribers and self._watcher is not None:
+                self._watcher.cancel()
+                self._watcher = None
+
+    async def _watch(self) -> None:
+        """后台任务: 定期检测外部写入和跨天"""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            await self.check()
+
+    async def _stats_frames(self, zones: Collection[Optional[str]]) -> Dict[Optional[str], str]:
+        """
+        按时区计算统计数据帧并记录对应的版本和日期
+        
+        Args:
+            zones: 需要计算的时区
+            
+        Returns:
+            {时区: stats 帧}
+        """
+        frames = {}
+        versions = []
+        for tz in zones:
+            today = clock.today_ordinal(tz)
+            # 服务器时区使用管理器增量维护的计数器
+            version, stats = await self.events.stats_with_version(None if tz is None else today)
+            versions.append(version)
+            self._days[tz] = today
+            frames[tz] = format_sse("stats", self.build_stats(stats))
+        
+        # 只有所有时区都计算过，才能认为订阅者已是最新；
+        # 计算期间发生的写入由最早读到的版本留给下一次检测
+        if versions and set(self._subscribers.values()) <= set(zones):
+            self._version = min(versions)
+        return frames
+
+    def _broadcast(self, frame: str, zones: Optional[Collection[Optional[str]]] = None) -> None:
+        """
+        将一帧放入订阅者队列
+        
+        Args:
+            frame: SSE 帧
+            zones: 只发送给这些时区的订阅者，None 表示全部
+        """
+        for queue, tz in self._subscribers.items():
+            if zones is None or tz in zones:
+                self._put(queue, frame)
+
+    def _broadcast_stats(self, frames: Dict[Optional[str], str]) -> None:
+        """将各时区的统计数据帧发送给该时区的订阅者"""
+        for queue, tz in self._subscribers.items():
+            if tz in frames:
+                self._put(queue, frames[tz])
+
+    def _put(self, queue: asyncio.Queue, frame: str) -> None:
+        """
+        将一帧放入订阅者队列
+        
+        积压已满的订阅者丢弃旧消息，改为收到 refresh 后重新加载。
+        """
+        if queue.full():
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(format_sse("refresh", {}))
+        queue.put_nowait(frame)
@@ -0,0 +1,77 @@
+"""多租户 - 每个租户独立的存储、管理器和推送"""
+
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from ..async_manager import AsyncEventManager
+from ..backends import backend_name, create_storage
+from ..event_manager import EventManager
+from ..notifier import LogSink, ReminderScheduler
+from ..tenants import TenantRegistry
+from .conditional import CacheValidators
+from .stream import EventStream
+from .widget import WidgetCache
+
+
+class Tenant:
+    """
+    一个租户的全部服务对象。
+    
+    每个租户有自己的存储 (独立的数据库文件)、线程池、ETag 校验器
+    、事件流和小组件缓存，一个租户的频繁写入不会占用其他租户的锁或线程。
+    
+    租户打开期间由自己的 ReminderScheduler 发送提醒 (写入日志)；
+    提醒规则随事件保存，租户被移出 LRU 后再次打开时重新排期。
+    """
+
+    def __init__(self, storage, build_stats: Callable[[Dict], Dict], max_workers: int = 4):
+        """
+        Args:
+            storage: 租户的存储实例
+            build_stats: 将 EventManager.get_stats() 的结果转换为推送数据的函数
+            max_workers: 租户线程池的最大线程数
+        """
+        self.storage = storage
+        self.reminders = ReminderScheduler([LogSink()])
+        self.manager = EventManager(storage, scheduler=self.reminders)
+        self.reminders.start()
+        self.events = AsyncEventManager(self.manager, max_workers=max_workers)
+        self.validators = CacheValidators(self.events)
+        self.stream = EventStream(self.events, build_stats)
+        self.widget = WidgetCache(self.events)
+
+    def close(self) -> None:
+        """停止提醒，关闭线程池和存储 (租户被移出 LRU 时调用)"""
+        self.reminders.stop()
+        self.events.close()
+        close = getattr(self.storage, "close", None)
+        if close is not None:
+            close()
+
+
+def tenant_registry(
+    build_stats: Callable[[Dict], Dict],
+    base_dir: Optional[str] = None,
+    max_open: int = 64,
+    backend: Optional[str] = None,
+) -> TenantRegistry:
+    """
+    创建按租户分片的存储注册表
+    
+    Args:
+        build_stats: 传给每个 Tenant 的统计数据转换函数
+        base_dir: 数据目录 (默认 $COUNTDOWN_HOME 或 ~/.countdown)
+        max_open: 最多保持打开的空闲租户数
+        backend: 存储后端名称 (默认 $COUNTDOWN_STORAGE，否则 sqlite)；
+                 memory 后端的租户被移出 LRU 后数据随之丢失
+                 
+    Returns:
+        TenantRegistry，租户数据位于 <base_dir>/tenants/<租户 ID>/ (sqlite 为 events.db)
+    """
+    backend = backend_name(backend)
+
+    def open_tenant(path: Path) -> Tenant:
+        # 每个租户的线程池较小，大量租户同时活跃时线程总数仍然有限
+        return Tenant(create_storage(backend, str(path)), build_stats, max_workers=2)
+    
+    return TenantRegistry(base_dir, max_open, open_tenant, Tenant.close)
@@ -0,0 +1,150 @@
+"""桌面小组件 - 预先生成的最近倒计时"""
+
+import json
+import math
+import time
+from datetime import date
+from typing import Callable, Dict, Optional, Tuple
+
+from .. import clock
+from ..async_manager import AsyncEventManager
+
+try:
+    import msgpack
+except ImportError:  # 可选: 未安装时不提供 MessagePack 编码
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # 可选: 未安装时不提供 CBOR 编码
+    cbor2 = None
+
+
+JSON_TYPE = "application/json"
+
+# 可用的编码: 媒体类型 -> 编码函数 (JSON 始终可用)
+ENCODERS: Dict[str, Callable[[Dict], bytes]] = {
+    JSON_TYPE: lambda payload: json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+}
+if msgpack is not None:
+    ENCODERS["application/msgpack"] = msgpack.packb
+    ENCODERS["application/x-msgpack"] = msgpack.packb
+if cbor2 is not None:
+    ENCODERS["application/cbor"] = cbor2.dumps
+
+# 小组件最多显示的事件数
+MAX_WIDGET_EVENTS = 20
+
+
+class WidgetPayload:
+    """一份生成好的小组件数据，各编码按需生成一次后复用"""
+
+    def __init__(self, tag: str, payload: Dict):
+        """
+        Args:
+            tag: 标识这份数据的字符串 (存储修订号、今天和数量)
+            payload: 小组件数据
+        """
+        self.tag = tag
+        self.payload = payload
+        self._bodies: Dict[str, bytes] = {}
+
+    def etag(self, media_type: str) -> str:
+        """
+        某个编码的 ETag
+        
+        不同编码的响应体不同，ETag 带上媒体类型，缓存不会把
+        CBOR 的 304 验证用于 JSON 的缓存副本
+        """
+        return f'"w{self.tag}-{media_type.rsplit("/", 1)[-1]}"'
+
+    def body(self, media_type: str) -> bytes:
+        """按媒体类型编码 (结果缓存)"""
+        body = self._bodies.get(media_type)
+        if body is None:
+            body = self._bodies[media_type] = ENCODERS[media_type](self.payload)
+        return body
+
+
+class WidgetCache:
+    """
+    为小组件预先生成最近的几个倒计时。
+    
+    小组件刷新频繁但内容每天最多变化几次，因此数据按
+    (时区, 数量) 缓存，只在存储版本变化 (写操作、跨天状态更新)
+    或该时区跨天时重新生成；其余请求只比较版本号，不读取事件也
+    不做序列化。
+    
+    ETag 使用存储的修订号 (所有 worker 和重启后都相同)，
+    而不是本进程的版本号。
+    """
+
+    def __init__(self, events: AsyncEventManager):
+        """
+        Args:
+            events: 异步事件管理器
+        """
+        self.events = events
+        # 缓存数据对应的存储版本，以及 (时区, 数量) -> (今天序数, 数据)
+        self._version: Optional[int] = None
+        self._cache: Dict[Tuple[Optional[str], int], Tuple[int, WidgetPayload]] = {}
+
+    async def get(self, limit: int, tz: Optional[str] = None) -> WidgetPayload:
+        """
+        获取最近 limit 个未过期事件的小组件数据
+        
+        Args:
+            limit: 事件数
+            tz: 计算剩余天数使用的 IANA 时区，None 表示服务器时区
+            
+        Returns:
+            WidgetPayload
+        """
+        key = (tz, limit)
+        today = clock.today_ordinal(tz)
+        self._expire(await self.events.version())
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == today:
+            return cached[1]
+        
+        # 服务器时区传 None，使用管理器自己的今天
+        upcoming = await self.events.upcoming_events(limit, None if tz is None else today)
+        # 读取时可能触发跨天状态更新，以读取后的版本为准
+        version = await self.events.version()
+        revision = await self.events.revision()
+        self._expire(version)
+        payload = {
+            "date": date.fromordinal(today).isoformat(),
+            "events": [
+                {"name": e["name"], "date": e["target_date"], "days": e.get("remaining_days", 0)}
+                for e in upcoming
+            ],
+        }
+        widget = WidgetPayload(f"{revision}-{today}-{limit}", payload)
+        self._cache[key] = (today, widget)
+        return widget
+
+    def _expire(self, version: int) -> None:
+        """存储版本变化后丢弃所有缓存的数据"""
+        if version != self._version:
+            self._version = version
+            self._cache.clear()
+
+    @staticmethod
+    def max_age(tz: Optional[str] = None) -> int:
+        """距离该时区下一个零点的秒数 (剩余天数到那时才会变化)"""
+        return max(0, math.ceil(clock.next_midnight(tz) - time.time()))
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """
+    根据 Accept 头选择编码
+    
+    依次取客户端列出的媒体类型 (忽略 q 值)，返回第一个可用的；
+    都不可用时返回 JSON。
+    """
+    for item in (accept or "").split(","):
+        media_type = item.split(";", 1)[0].strip().lower()
+        if media_type in ENCODERS:
+            return media_type
+    return JSON_TYPE
@@ -0,0 +1,206 @@
+"""Async Event Manager module - Off-loop access for asyncio servers."""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from .event_manager import EventManager
+
+
+T = TypeVar("T")
+
+
+class AsyncEventManager:
+    """
+    Awaitable facade over an EventManager.
+    
+    Every storage call (file reads and writes, SQLite queries, lock
+    waits) runs on a bounded thread pool, so the event loop keeps
+    serving other requests while one waits for the disk or for another
+    process's write lock. The pool size caps how many storage calls are
+    in flight; further calls queue until a worker is free.
+    
+    The wrapped manager and its storage serialize access between the
+    worker threads themselves (see EventManager and Storage).
+    
+    Example:
+        events = AsyncEventManager(EventManager(SQLiteStorage()))
+        event = await events.create_event("生日", "2026-12-25")
+    """
+
+    def __init__(self, manager: Optional[EventManager] = None, max_workers: int = 4):
+        """
+        Initialize async manager.
+        
+        Args:
+            manager: Manager to run calls on. Defaults to EventManager()
+            max_workers: Maximum number of storage calls running at once
+        """
+        self.manager = manager or EventManager()
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="countdown-io")
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a blocking callable on the storage thread pool.
+        
+        Args:
+            func: Callable to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            The callable's return value (its exceptions propagate)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def iterate(self, iterator: Iterator[T]) -> AsyncIterator[T]:
+        """
+        Consume a blocking iterator on the thread pool, item by item.
+        
+        Args:
+            iterator: Iterator whose next() may block, e.g. iter_events()
+            
+        Yields:
+            The iterator's items
+        """
+        done = object()
+        while True:
+            item = await self.run(next, iterator, done)
+            if item is done:
+                return
+            yield item
+
+    def close(self) -> None:
+        """Wait for running calls and shut the thread pool down."""
+        self._executor.shutdown(wait=True)
+
+    async def version(self) -> int:
+        """Get the storage change counter (see Storage.version)."""
+        return await self.run(lambda: self.manager.storage.version)
+
+    async def revision(self) -> str:
+        """Get the storage revision, shared by all processes (see Storage.revision)."""
+        return await self.run(lambda: self.manager.storage.revision)
+
+    async def create_event(self, name: str, target_date: str, recurrence: Optional[str] = None) -> Dict:
+        """Create new event (see EventManager.create_event)."""
+        return await self.run(self.manager.create_event, name, target_date, recurrence)
+
+    async def create_events(self, items: Iterable[Tuple]) -> List[Dict]:
+        """Create many events with one write (see EventManager.create_events)."""
+        return await self.run(self.manager.create_events, list(items))
+
+    async def get_event(self, name: str, today: Optional[int] = None) -> Optional[Dict]:
+        """Get event by name (see EventManager.get_event)."""
+        return await self.run(self.manager.get_event, name, today)
+
+    async def list_events(self, today: Optional[int] = None) -> List[Dict]:
+        """List all events (see EventManager.list_events)."""
+        return await self.run(self.manager.list_events, today)
+
+    async def iter_events(self, chunk_size: int = 1000, today: Optional[int] = None) -> AsyncIterator[List[Dict]]:
+        """
+        Iterate over all events in chunks, reading each chunk off-loop.
+        
+        Args:
+            chunk_size: Maximum number of events per chunk
+            today: Today's ordinal. Defaults to date.today()
+            
+        Yields:
+            Lists of events with remaining_days
+        """
+        chunks = await self.run(self.manager.iter_events, chunk_size, today)
+        async for chunk in self.iterate(chunks):
+            yield chunk
+
+    async def delete_event(self, name: str) -> bool:
+        """Delete event (see EventManager.delete_event)."""
+        return await self.run(self.manager.delete_event, name)
+
+    async def delete_events(self, names: Iterable[str]) -> List[Dict]:
+        """Delete many events with one write (see EventManager.delete_events)."""
+        return await self.run(self.manager.delete_events, list(names))
+
+    async def update_event(
+        self,
+        name: str,
+        target_date: str,
+        recurrence: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """Move an event to a new date (see EventManager.update_event)."""
+        return await self.run(self.manager.update_event, name, target_date, recurrence)
+
+    async def set_reminders(
+        self,
+        name: str,
+        days_before: Iterable[int],
+        notification_type: str = "PUSH",
+    ) -> Optional[Dict]:
+        """Replace an event's reminder rules (see EventManager.set_reminders)."""
+        return await self.run(self.manager.set_reminders, name, list(days_before), notification_type)
+
+    async def get_stats(self, today: Optional[int] = None) -> Dict:
+        """Get counts by status and the next event (see EventManager.get_stats)."""
+        return await self.run(self.manager.get_stats, today)
+
+    async def stats_with_version(self, today: Optional[int] = None) -> Tuple[int, Dict]:
+        """
+        Get the statistics together with the storage version they match.
+        
+        Args:
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            (storage version, EventManager.get_stats() dictionary)
+        """
+        def read() -> Tuple[int, Dict]:
+            with self.manager._lock:
+                return self.manager.storage.version, self.manager.get_stats(today)
+        
+        return await self.run(read)
+
+    async def get_event_by_status(self, status: str, today: Optional[int] = None) -> List[Dict]:
+        """Get events filtered by status (see EventManager.get_event_by_status)."""
+        return await self.run(self.manager.get_event_by_status, status, today)
+
+    async def count_events(self, status: Optional[str] = None, today: Optional[int] = None) -> int:
+        """Count events (see EventManager.count_events)."""
+        return await self.run(self.manager.count_events, status, today)
+
+    async def get_next_event(self, today: Optional[int] = None) -> Optional[Dict]:
+        """Get the nearest event that has not expired (see EventManager.get_next_event)."""
+        return await self.run(self.manager.get_next_event, today)
+
+    async def upcoming_events(self, limit: Optional[int] = None, today: Optional[int] = None) -> List[Dict]:
+        """Get the next events from today on (see EventManager.upcoming_events)."""
+        return await self.run(self.manager.upcoming_events, limit, today)
+
+    async def events_between(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        today: Optional[int] = None,
+    ) -> List[Dict]:
+        """Get events in a date range (see EventManager.events_between)."""
+        return await self.run(self.manager.events_between, start, end, limit, today)
+
+    async def search_events(self, query: str, limit: int = 50, today: Optional[int] = None) -> List[Dict]:
+        """Find events by name (see EventManager.search_events)."""
+        return await self.run(self.manager.search_events, query, limit, today)
+
+    async def events_page(
+        self,
+        sort: str = "date",
+        after: Optional[Tuple[int, str]] = None,
+        limit: int = 50,
+        status: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        today: Optional[int] = None,
+    ) -> Tuple[List[Dict], Optional[Tuple[int, str]]]:
+        """Get one page of events (see EventManager.events_page)."""
+        return await self.run(self.manager.events_page, sort, after, limit, status, start, end, today)
@@ -0,0 +1,184 @@
+"""Backends module - Storage protocol and config-driven backend selection."""
+
+import os
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Protocol, Tuple, runtime_checkable
+
+
+# Environment variable naming the backend for the CLI and the API
+BACKEND_ENV = "COUNTDOWN_STORAGE"
+
+# Used when neither an explicit name nor $COUNTDOWN_STORAGE is given
+DEFAULT_BACKEND = "sqlite"
+
+
+@runtime_checkable
+class StorageBackend(Protocol):
+    """
+    What EventManager needs from a storage backend.
+    
+    Dates are YYYY-MM-DD strings, "today" arguments are date ordinals
+    (None for the server's date), and events are dictionaries as
+    returned by Storage. Read methods add remaining_days and the status
+    for today.
+    """
+
+    @property
+    def version(self) -> int:
+        """Change counter, bumped by every mutation (also by other processes)."""
+        ...
+
+    @property
+    def revision(self) -> str:
+        """Identifies the stored events: equal in every process and across restarts."""
+        ...
+
+    @property
+    def rolled_day(self) -> Optional[int]:
+        """Day statuses were last rolled to (persisted by roll_statuses()), or None."""
+        ...
+
+    def load_events(self) -> Dict: ...
+
+    def save_events(self, events: Dict) -> None: ...
+
+    def clear_all(self) -> None: ...
+
+    def event_exists(self, name: str) -> bool: ...
+
+    def add_event(self, name: str, target_date: str, recurrence: Optional[str] = None) -> Dict: ...
+
+    def add_events(self, items: Iterable[Tuple]) -> List[Optional[Dict]]: ...
+
+    def get_event(self, name: str, today: Optional[int] = None) -> Optional[Dict]: ...
+
+    def get_all_events(self, today: Optional[int] = None) -> List[Dict]: ...
+
+    def iter_events(self, chunk_size: int = 1000, today: Optional[int] = None) -> Iterator[List[Dict]]: ...
+
+    def delete_event(self, name: str) -> bool: ...
+
+    def delete_events(self, names: Iterable[str]) -> List[Optional[Dict]]: ...
+
+    def set_reminders(self, name: str, reminders: List[Dict]) -> Optional[Dict]: ...
+
+    def update_event(
+        self, name: str, target_date: str, recurrence: Optional[str] = None
+    ) -> Optional[Tuple[Dict, Dict]]: ...
+
+    def get_events_by_status(self, status: str, today: Optional[int] = None) -> List[Dict]: ...
+
+    def count_events(self, status: Optional[str] = None, today: Optional[int] = None) -> int: ...
+
+    def count_between(self, start: Optional[int], end: Optional[int]) -> int: ...
+
+    def get_next_event(self, today: Optional[int] = None) -> Optional[Dict]: ...
+
+    def get_upcoming_events(self, limit: Optional[int] = None, today: Optional[int] = None) -> List[Dict]: ...
+
+    def get_events_between(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        today: Optional[int] = None,
+    ) -> List[Dict]: ...
+
+    def search_events(self, query: str, limit: int = 50, today: Optional[int] = None) -> List[Dict]: ...
+
+    def get_page(
+        self,
+        sort: str = "date",
+        after: Optional[Tuple[int, str]] = None,
+        limit: int = 50,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        today: Optional[int] = None,
+    ) -> List[Dict]: ...
+
+    def roll_statuses(self, today: int, since: Optional[int] = None) -> List[Dict]: ...
+
+
+# Factories import their module on first use, so picking a backend
+# (e.g. for a CLI command) only loads that backend's dependencies
+def _json(storage_dir: Optional[str]) -> StorageBackend:
+    """events.json (Storage with its in-memory index)."""
+    from .storage import Storage
+    return Storage(storage_dir=storage_dir, cache=True)
+
+
+def _journal(storage_dir: Optional[str]) -> StorageBackend:
+    """Snapshot plus append-only journal."""
+    from .journal_storage import JournalStorage
+    return JournalStorage(storage_dir=storage_dir)
+
+
+def _sqlite(storage_dir: Optional[str]) -> StorageBackend:
+    """SQLite database (events.db)."""
+    from .sqlite_storage import SQLiteStorage
+    return SQLiteStorage(storage_dir=storage_dir)
+
+
+def _memory(storage_dir: Optional[str]) -> StorageBackend:
+    """Process-local dictionary, no files."""
+    from .memory_storage import MemoryStorage
+    return MemoryStorage(storage_dir=storage_dir)
+
+
+# Backend name -> factory taking the storage directory (None for the default)
+BACKENDS: Dict[str, Callable[[Optional[str]], StorageBackend]] = {
+    "json": _json,
+    "journal": _journal,
+    "sqlite": _sqlite,
+    "memory": _memory,
+}
+
+
+def register_backend(name: str, factory: Callable[[Optional[str]], StorageBackend]) -> None:
+    """
+    Make a storage backend selectable by name.
+    
+    Args:
+        name: Backend name for create_storage() and $COUNTDOWN_STORAGE
+        factory: Called with the storage directory (or None) to open it
+    """
+    BACKENDS[name] = factory
+
+
+def backend_name(name: Optional[str] = None) -> str:
+    """
+    Resolve which backend to use.
+    
+    Args:
+        name: Explicit backend name, or None for $COUNTDOWN_STORAGE
+              and then DEFAULT_BACKEND
+              
+    Returns:
+        Registered backend name
+        
+    Raises:
+        ValueError: If the backend is not registered
+    """
+    name = (name or os.environ.get(BACKEND_ENV) or DEFAULT_BACKEND).strip().lower()
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown storage backend: {name}. Expected one of {', '.join(sorted(BACKENDS))}"
+        )
+    return name
+
+
+def create_storage(name: Optional[str] = None, storage_dir: Optional[str] = None) -> StorageBackend:
+    """
+    Open the configured storage backend.
+    
+    Args:
+        name: Backend name (json, journal, sqlite, memory or a registered
+              one); defaults to $COUNTDOWN_STORAGE, then "sqlite"
+        storage_dir: Data directory. Defaults to $COUNTDOWN_HOME or ~/.countdown
+        
+    Returns:
+        Storage instance
+        
+    Raises:
+        ValueError: If the backend is not registered
+    """
+    return BACKENDS[backend_name(name)](storage_dir)
@@ -1,28 +1,223 @@
 """CLI module - Command-line interface for P1."""
 
 import click
-from .event_manager import EventManager
-from .storage import Storage
+import functools
+import io
+from contextlib import redirect_stderr, redirect_stdout
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+from .backends import BACKEND_ENV, BACKENDS, backend_name, create_storage
 from .formatter import Formatter
+from .transfer import FORMATS, EventImporter, detect_format, export_events
 
+if TYPE_CHECKING:
+    from .event_manager import EventManager
 
-@click.group()
-def cli():
+
+# 守护进程运行时转发给它的命令 (不读写调用方的文件或标准输入)
+FORWARDED_COMMANDS = ("add", "list", "show", "delete", "notify")
+
+
+class Session:
+    """
+    命令使用的事件管理器。
+    
+    普通调用每条命令新建一个；shell 和守护进程在整个生命周期内复用
+    同一个，存储和索引保持加载。普通调用中 FORWARDED_COMMANDS 里的
+    命令在守护进程运行时交给它执行，不再加载存储。
+    """
+
+    def __init__(self, storage: Optional[str] = None, forward: bool = True):
+        """
+        Args:
+            storage: 存储后端名称 (None 表示 $COUNTDOWN_STORAGE，否则 sqlite)
+            forward: 是否尝试把命令转发给守护进程
+        """
+        self.storage = storage
+        self.forward = forward
+        self._manager: Optional["EventManager"] = None
+
+    @property
+    def manager(self) -> "EventManager":
+        """
+        事件管理器 (首次使用时创建)
+        
+        业务逻辑和存储模块在这里才导入，--help 等不访问事件的调用
+        不必加载它们 (见 tests/unit/test_startup.py 和 benchmarks/test_bench_startup.py)。
+        """
+        if self._manager is None:
+            from .event_manager import EventManager
+            self._manager = EventManager(create_storage(self.storage))
+        return self._manager
+
+
+@click.group(invoke_without_command=True)
+@click.option("--storage", type=click.Choice(sorted(BACKENDS)), envvar=BACKEND_ENV, default=None,
+              help=f"存储后端 (默认 ${BACKEND_ENV}，否则 sqlite)")
+@click.option("--daemon", is_flag=True,
+              help="作为守护进程运行: 保持存储加载，通过 Unix socket 执行其他 countdown 调用的命令")
+@click.pass_context
+def cli(ctx, storage, daemon):
     """事件倒计时工具 - 管理重要日期的倒计时。"""
-    pass
+    # shell 和守护进程传入自己的 Session
+    if ctx.obj is None:
+        ctx.obj = Session(storage)
+    
+    if daemon:
+        _serve(ctx.obj.storage)
+    elif ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+
+
+def _manager() -> "EventManager":
+    """当前调用 (或 shell / 守护进程) 的事件管理器"""
+    return click.get_current_context().find_root().obj.manager
+
+
+def forwardable(command):
+    """
+    守护进程运行时把命令交给它执行
+    
+    没有守护进程、连接失败或守护进程使用其他存储后端时在本进程执行。
+    """
+    @functools.wraps(command)
+    def wrapper(**params):
+        ctx = click.get_current_context()
+        session = ctx.find_root().obj
+        if session.forward:
+            response = _forward(session, ctx.command.name, params)
+            if response is not None:
+                click.echo(response["stdout"], nl=False)
+                click.echo(response["stderr"], nl=False, err=True)
+                if response["exit_code"]:
+                    raise SystemExit(response["exit_code"])
+                return None
+        return command(**params)
+    
+    return wrapper
+
+
+def _forward(session: Session, name: str, params: Dict) -> Optional[Dict]:
+    """
+    请求守护进程执行命令
+    
+    Returns:
+        {"exit_code", "stdout", "stderr"}，或 None 表示需要在本进程执行
+    """
+    from .daemon import default_socket_path, send_request
+    
+    try:
+        request = {"command": name, "params": params, "storage": backend_name(session.storage)}
+        response = send_request(default_socket_path(), request)
+    except (OSError, ValueError):
+        return None
+    if response is None or "error" in response:
+        return None
+    return response
+
+
+def run_command(session: Session, name: str, params: Dict) -> Dict:
+    """
+    在本进程中用 session 执行一条命令并捕获输出 (守护进程使用)
+    
+    Args:
+        session: 复用的 Session
+        name: 命令名
+        params: 命令参数
+        
+    Returns:
+        {"exit_code", "stdout", "stderr"}
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = 0
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            with click.Context(cli, info_name="countdown", obj=session) as ctx:
+                ctx.invoke(cli.commands[name], **params)
+        except SystemExit as e:
+            exit_code = _exit_code(e)
+        except Exception as e:
+            click.echo(Formatter.format_error(str(e)), err=True)
+            exit_code = 1
+    return {"exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+def daemon_handler(session: Session) -> Callable[[Dict], Dict]:
+    """
+    守护进程的请求处理函数
+    
+    只执行 FORWARDED_COMMANDS 中、且请求方使用同一存储后端的命令；
+    其他请求返回 error，请求方改为自己执行。
+    """
+    backend = backend_name(session.storage)
+
+    def handle(request: Dict) -> Dict:
+        if request.get("storage") != backend:
+            return {"error": f"守护进程使用 {backend} 存储"}
+        name = request.get("command")
+        if name not in FORWARDED_COMMANDS:
+            return {"error": f"不支持转发的命令: {name}"}
+        return run_command(session, name, request.get("params") or {})
+    
+    return handle
+
+
+def _exit_code(exit: SystemExit) -> int:
+    """SystemExit 对应的退出码"""
+    if exit.code is None:
+        return 0
+    return exit.code if isinstance(exit.code, int) else 1
+
+
+def _serve(storage: Optional[str]) -> None:
+    """运行守护进程直到收到 Ctrl+C 或 SIGTERM (同时发送事件提醒)"""
+    import logging
+    import signal
+    from .daemon import CommandDaemon, default_socket_path
+    from .notifier import LogSink, ReminderScheduler
+    
+    session = Session(storage, forward=False)
+    # 启动时就加载存储，第一条命令也不用等待
+    session.manager.list_events()
+    # 提醒写到标准错误；规则随事件保存，重启后重新排期
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    reminders = ReminderScheduler([LogSink()])
+    session.manager.attach_scheduler(reminders)
+    
+    path = default_socket_path()
+    try:
+        daemon = CommandDaemon(path, daemon_handler(session))
+    except (OSError, RuntimeError) as e:
+        click.echo(Formatter.format_error(str(e)), err=True)
+        raise SystemExit(1)
+    
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    click.echo(Formatter.format_success(f"守护进程已启动: {path} ({backend_name(storage)})"), err=True)
+    reminders.start()
+    with daemon:
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            reminders.stop()
 
 
 @cli.command()
 @click.argument("name")
 @click.argument("date")
-def add(name: str, date: str):
+@click.option("--repeat", default=None,
+              help="重复规则: yearly / monthly / \"every N days\" / RRULE:FREQ=...")
+@forwardable
+def add(name: str, date: str, repeat):
     """创建新事件。
     
     示例: countdown add "生日" 2026-03-15
+    
+    重复事件: countdown add "妈妈生日" 1965-08-20 --repeat yearly
     """
     try:
-        manager = EventManager()
-        event = manager.create_event(name, date)
+        manager = _manager()
+        event = manager.create_event(name, date, repeat)
         remaining = event["remaining_days"]
         message = Formatter.format_success(f"{name} 已创建，还有 {remaining} 天")
         click.echo(message)
@@ -32,10 +227,11 @@ def add(name: str, date: str):
 
 
 @cli.command()
+@forwardable
 def list():
     """列出所有事件。"""
     try:
-        manager = EventManager()
+        manager = _manager()
         events = manager.list_events()
         
         if not events:
@@ -49,13 +245,14 @@ def list():
 
 @cli.command()
 @click.argument("name")
+@forwardable
 def delete(name: str):
     """删除事件。
     
     示例: countdown delete "生日"
     """
     try:
-        manager = EventManager()
+        manager = _manager()
         if manager.delete_event(name):
             message = Formatter.format_success(f"{name} 已删除")
             click.echo(message)
@@ -69,13 +266,14 @@ def delete(name: str):
 
 @cli.command()
 @click.argument("name")
+@forwardable
 def show(name: str):
     """显示单个事件详情。
     
     示例: countdown show "生日"
     """
     try:
-        manager = EventManager()
+        manager = _manager()
         event = manager.get_event(name)
         
         if event is None:
@@ -84,11 +282,146 @@ def show(name: str):
         
         formatted = Formatter.format_event_for_cli(event)
         click.echo(formatted)
+        reminders = Formatter.format_reminders(event.get("reminders"))
+        if reminders:
+            click.echo(reminders)
     except Exception as e:
         click.echo(Formatter.format_error(str(e)), err=True)
         raise SystemExit(1)
 
 
+@cli.command()
+@click.argument("name")
+@click.argument("days")
+@click.option("--type", "notification_type", default="PUSH", show_default=True,
+              help="通知方式: PUSH / EMAIL / SMS")
+@forwardable
+def notify(name: str, days: str, notification_type: str):
+    """在事件前 N 天提醒。
+    
+    示例: countdown notify "生日" 7,3,1
+    
+    DAYS 为 none 时取消提醒。规则随事件保存，由守护进程
+    (countdown --daemon) 或 API 服务按时发送。
+    """
+    try:
+        if days.strip().lower() == "none":
+            days_before = []
+        else:
+            try:
+                days_before = [int(part) for part in days.split(",") if part.strip()]
+            except ValueError:
+                raise ValueError(f"提前天数应为逗号分隔的正整数: {days}") from None
+        
+        manager = _manager()
+        event = manager.set_reminders(name, days_before, notification_type.upper())
+        if event is None:
+            click.echo(Formatter.format_error(f"事件 '{name}' 不存在"), err=True)
+            raise SystemExit(1)
+        
+        described = Formatter.format_reminders(event.get("reminders"))
+        click.echo(Formatter.format_success(f"{name} {described or '已取消提醒'}"))
+    except ValueError as e:
+        click.echo(Formatter.format_error(str(e)), err=True)
+        raise SystemExit(1)
+
+
+@cli.command(name="export")
+@click.option("--format", "fmt", type=click.Choice(FORMATS), default=None,
+              help="输出格式 (默认根据文件扩展名，否则 ndjson)")
+@click.option("--output", "-o", type=click.File("w", encoding="utf-8"), default="-",
+              help="输出文件 (默认标准输出)")
+def export_command(fmt, output):
+    """导出所有事件 (流式输出 NDJSON 或 CSV)。
+    
+    示例: countdown export -o events.csv
+    """
+    try:
+        manager = _manager()
+        fmt = fmt or detect_format(getattr(output, "name", None))
+        for chunk in export_events(manager, fmt):
+            output.write(chunk)
+    except Exception as e:
+        click.echo(Formatter.format_error(str(e)), err=True)
+        raise SystemExit(1)
+
+
+@cli.command(name="import")
+@click.argument("source", type=click.File("r", encoding="utf-8-sig"))
+@click.option("--format", "fmt", type=click.Choice(FORMATS), default=None,
+              help="输入格式 (默认根据文件扩展名，否则 ndjson)")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=1000, show_default=True,
+              help="每批校验并写入的事件数")
+def import_command(source, fmt, chunk_size):
+    """从 NDJSON 或 CSV 文件导入事件 (- 表示标准输入)。
+    
+    示例: countdown import events.csv
+    """
+    try:
+        manager = _manager()
+        importer = EventImporter(manager, fmt or detect_format(getattr(source, "name", None)), chunk_size)
+        importer.feed(source)
+        summary = importer.finish()
+    except Exception as e:
+        click.echo(Formatter.format_error(str(e)), err=True)
+        raise SystemExit(1)
+    
+    for error in summary["errors"]:
+        label = error["name"] if error["name"] is not None else "-"
+        click.echo(Formatter.format_error(f"第 {error['line']} 行 ({label}): {error['error']}"), err=True)
+    
+    click.echo(Formatter.format_success(
+        f"已导入 {summary['imported']} 个事件，{summary['failed']} 个失败"
+    ))
+    if summary["failed"]:
+        raise SystemExit(1)
+
+
+@cli.command()
+@click.pass_obj
+def shell(session: Session):
+    """交互式 shell: 在同一进程中执行多条命令，存储和索引保持加载。
+    
+    示例: countdown shell，然后输入 add "生日" 2026-03-15、list、show "生日" 等，
+    exit 或 Ctrl+D 退出。
+    """
+    import shlex
+    
+    session.forward = False
+    click.echo("输入命令 (help 查看帮助，exit 退出)")
+    while True:
+        try:
+            line = input("countdown> ")
+        except EOFError:
+            click.echo()
+            break
+        except KeyboardInterrupt:
+            click.echo()
+            continue
+        
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            click.echo(Formatter.format_error(str(e)), err=True)
+            continue
+        if not args:
+            continue
+        if args[0] in ("exit", "quit"):
+            break
+        if args[0] == "help":
+            args = ["--help"]
+        if args[0] == "shell" or "--daemon" in args:
+            click.echo(Formatter.format_error("shell 中不能再启动 shell 或守护进程"), err=True)
+            continue
+        
+        try:
+            cli.main(args, prog_name="countdown", obj=session, standalone_mode=False)
+        except click.ClickException as e:
+            e.show()
+        except (SystemExit, click.Abort):
+            pass
+
+
 def main():
     """Main entry point."""
     cli()
@@ -0,0 +1,103 @@
+"""Clock module - Today's date per timezone."""
+
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Dict, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+# zone name -> (today's ordinal, start of today, start of tomorrow) as timestamps
+_days: Dict[str, Tuple[int, float, float]] = {}
+
+
+def get_zone(name: str) -> ZoneInfo:
+    """
+    Look up an IANA timezone.
+    
+    Args:
+        name: Zone name, e.g. "Asia/Shanghai"
+        
+    Returns:
+        ZoneInfo instance (cached by zoneinfo)
+        
+    Raises:
+        ValueError: If the zone is unknown
+    """
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError) as e:
+        raise ValueError(f"Unknown timezone: {name}") from e
+
+
+def zone_day(name: str, now: Optional[float] = None) -> Tuple[int, float]:
+    """
+    Get today's date in a timezone.
+    
+    The result is cached per zone until that zone's next midnight, so
+    serving many users only converts a timestamp to local time once per
+    zone and day rather than once per request or event.
+    
+    Args:
+        name: Zone name, e.g. "America/New_York"
+        now: Unix timestamp to use instead of the current time
+        
+    Returns:
+        (today's ordinal, Unix timestamp of today's local midnight)
+        
+    Raises:
+        ValueError: If the zone is unknown
+    """
+    if now is None:
+        now = time.time()
+    
+    cached = _days.get(name)
+    if cached is not None and cached[1] <= now < cached[2]:
+        return cached[0], cached[1]
+    
+    zone = get_zone(name)
+    today = datetime.fromtimestamp(now, zone).date()
+    start = datetime.combine(today, dt_time(), tzinfo=zone).timestamp()
+    end = datetime.combine(today + timedelta(days=1), dt_time(), tzinfo=zone).timestamp()
+    # A DST gap can move the computed midnight past now; recheck soon instead
+    start = min(start, now)
+    end = max(end, now + 60)
+    
+    _days[name] = (today.toordinal(), start, end)
+    return today.toordinal(), start
+
+
+def next_midnight(name: Optional[str] = None) -> float:
+    """
+    Get the moment tomorrow starts in a timezone.
+    
+    Args:
+        name: Zone name, or None for the server's local zone
+        
+    Returns:
+        Unix timestamp of the next local midnight
+        
+    Raises:
+        ValueError: If the zone is unknown
+    """
+    if name is None:
+        return datetime.combine(date.today() + timedelta(days=1), dt_time()).timestamp()
+    zone_day(name)
+    return _days[name][2]
+
+
+def today_ordinal(name: Optional[str] = None) -> int:
+    """
+    Get today's ordinal in a timezone.
+    
+    Args:
+        name: Zone name, or None for the server's local zone
+        
+    Returns:
+        date.toordinal() of today in that zone
+        
+    Raises:
+        ValueError: If the zone is unknown
+    """
+    if name is None:
+        return date.today().toordinal()
+    return zone_day(name)[0]
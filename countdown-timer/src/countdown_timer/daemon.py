@@ -0,0 +1,122 @@
+"""Daemon module - Serve CLI commands from a long-running process over a Unix socket."""
+
+import json
+import os
+import socket
+import socketserver
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from .storage import default_storage_dir
+
+
+# Environment variable overriding the socket path
+SOCKET_ENV = "COUNTDOWN_SOCKET"
+
+# Largest request or response line accepted (bytes)
+MAX_MESSAGE = 16 * 1024 * 1024
+
+
+def default_socket_path(storage_dir: Optional[str] = None) -> str:
+    """
+    Get the daemon's socket path.
+    
+    The socket lives next to the data it serves, so a CLI run with a
+    different $COUNTDOWN_HOME never talks to the wrong daemon.
+    
+    Args:
+        storage_dir: Data directory. Defaults to $COUNTDOWN_HOME or ~/.countdown
+        
+    Returns:
+        $COUNTDOWN_SOCKET if set, otherwise <storage_dir>/countdown.sock
+    """
+    return os.environ.get(SOCKET_ENV) or str(Path(storage_dir or default_storage_dir()) / "countdown.sock")
+
+
+def send_request(path: str, message: Dict, timeout: float = 10.0) -> Optional[Dict]:
+    """
+    Send one request to a running daemon.
+    
+    Args:
+        path: Socket path
+        message: JSON-serializable request
+        timeout: Seconds to wait for the whole exchange
+        
+    Returns:
+        The daemon's response, or None if no daemon is listening (missing
+        or stale socket, or Unix sockets unsupported on this platform)
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(path):
+        return None
+    
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            sock.sendall(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline(MAX_MESSAGE)
+    except (ConnectionRefusedError, FileNotFoundError):
+        return None
+    
+    if not line:
+        return None
+    return json.loads(line)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Reads one JSON line, answers with one JSON line ({"ping": true} -> {"ok": true})."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline(MAX_MESSAGE)
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            response = {"ok": True} if request.get("ping") else self.server.handler(request)
+        except Exception as e:  # A bad request must not stop the daemon
+            response = {"error": str(e)}
+        self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+
+
+class CommandDaemon(socketserver.UnixStreamServer):
+    """
+    Answers requests on a Unix socket with a single long-lived handler.
+    
+    Requests are served one at a time, so the handler (e.g. a CLI
+    command on a shared EventManager) needs no locking of its own and
+    keeps the storage and its indexes loaded between requests.
+    
+    Example:
+        with CommandDaemon(default_socket_path(), handler) as daemon:
+            daemon.serve_forever()
+    """
+
+    def __init__(self, path: str, handler: Callable[[Dict], Dict]):
+        """
+        Bind the socket (only the current user may connect).
+        
+        Args:
+            path: Socket path
+            handler: Called with each request, returns the response
+            
+        Raises:
+            RuntimeError: If another daemon is already listening on path
+        """
+        if send_request(path, {"ping": True}, timeout=1.0) is not None:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+        # Left behind by a daemon that did not shut down cleanly
+        Path(path).unlink(missing_ok=True)
+        
+        self.path = path
+        self.handler = handler
+        old_umask = os.umask(0o077)
+        try:
+            super().__init__(path, _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def server_close(self) -> None:
+        """Close and remove the socket."""
+        super().server_close()
+        Path(self.path).unlink(missing_ok=True)
@@ -1,31 +1,93 @@
 """Event Manager module - Business logic."""
 
-from typing import List, Dict, Optional
+import threading
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from .validator import Validator
+from .backends import StorageBackend, create_storage
 from .storage import Storage
+from .rollover import StatusRollover
+
+
+STATUSES = ("ACTIVE", "CURRENT", "EXPIRED")
 
 
 class EventManager:
-    """Manages events business logic."""
+    """
+    Manages events business logic.
+    
+    Safe to share between threads: writes and counter updates run under
+    one lock so each write is matched with its own version bump.
+    
+    Reminder rules are stored with their event. With a ReminderScheduler
+    attached, the manager keeps it in step with the events: rules are
+    scheduled when set and after updates, cancelled on delete, and
+    re-armed when a recurring event moves on to its next date.
+    """
 
-    def __init__(self, storage: Optional[Storage] = None):
+    def __init__(self, storage: Optional[StorageBackend] = None, scheduler=None):
         """
         Initialize Event Manager.
         
         Args:
-            storage: Storage instance. Defaults to Storage()
+            storage: Storage backend. Defaults to create_storage(), the
+                     backend named by $COUNTDOWN_STORAGE (sqlite if unset)
+            scheduler: ReminderScheduler to deliver reminders, or None
+                       (see attach_scheduler())
         """
-        self.storage = storage or Storage()
+        self.storage = storage if storage is not None else create_storage()
         self.validator = Validator()
+        
+        # Status counters for get_stats(), valid for one storage version and day
+        self._counts: Optional[Dict[str, int]] = None
+        self._counts_version: Optional[int] = None
+        self._counts_day: Optional[int] = None
+        self._lock = threading.RLock()
+        
+        # Persists status transitions once per day (see _roll())
+        self.rollover = StatusRollover(self.storage)
+        
+        self.scheduler = None
+        if scheduler is not None:
+            self.attach_scheduler(scheduler)
+
+    def attach_scheduler(self, scheduler) -> int:
+        """
+        Deliver reminders through a ReminderScheduler from now on.
+        
+        Schedules the rules stored with every event, so reminders survive
+        restarts. Rules changed by another process are picked up the next
+        time a scheduler is attached.
+        
+        Args:
+            scheduler: ReminderScheduler
+            
+        Returns:
+            Number of reminders scheduled (passed reminder days are skipped)
+        """
+        self._roll()
+        with self._lock:
+            if self.scheduler is None:
+                self.rollover.add_listener(self._rearm_reminders)
+            self.scheduler = scheduler
+            scheduled = 0
+            for chunk in self.storage.iter_events():
+                for event in chunk:
+                    if event.get("reminders"):
+                        scheduled += self._schedule_reminders(event)
+        return scheduled
 
-    def create_event(self, name: str, target_date: str) -> Dict:
+    def create_event(self, name: str, target_date: str, recurrence: Optional[str] = None) -> Dict:
         """
         Create new event (FR-001, FR-008a).
         
         Args:
             name: Event name (unique, max 256 chars)
-            target_date: Target date (YYYY-MM-DD)
-            
+            target_date: Target date (YYYY-MM-DD); the first occurrence
+                         of a recurring event and may then be in the past
+            recurrence: yearly, monthly, every N days or RRULE:... (see
+                        recurrence.normalize_rule()), or None
+                        
         Returns:
             Created event data with remaining_days
             
@@ -34,37 +96,113 @@ class EventManager:
         """
         # Validate input (FR-005)
         self.validator.validate_event(name, target_date)
+        recurrence = self.validator.validate_recurrence(recurrence, target_date)
         
-        # Check for duplicates (FR-008a)
-        if self.storage.event_exists(name):
-            raise ValueError(f"Event '{name}' already exists, please use a different name")
-        
-        # Create and return
-        event = self.storage.add_event(name, target_date)
-        event["remaining_days"] = self.storage._calculate_remaining_days(target_date)
+        self._roll()
+        with self._lock:
+            # Check for duplicates (FR-008a)
+            if self.storage.event_exists(name):
+                raise ValueError(f"Event '{name}' already exists, please use a different name")
+            
+            # Create and return
+            version = self.storage.version
+            event = self.storage.add_event(name, target_date, recurrence)
+            event["remaining_days"] = Storage._calculate_remaining_days(event["target_date"])
+            self._track_counts(version, {event["status"]: 1})
         
         return event
 
-    def get_event(self, name: str) -> Optional[Dict]:
+    def create_events(self, items: Iterable[Tuple]) -> List[Dict]:
+        """
+        Create many events with a single storage write (FR-001, FR-008a).
+        
+        Every item is validated on its own; invalid items and duplicate
+        names are reported and do not stop the rest of the batch.
+        
+        Args:
+            items: (name, target_date) pairs or
+                   (name, target_date, recurrence) triples
+                   
+        Returns:
+            One result per item, in order: {"name", "ok": True, "event"}
+            or {"name", "ok": False, "error"}
+        """
+        results: List[Dict] = []
+        valid: List[Tuple[str, str, Optional[str]]] = []
+        for name, target_date, *recurrence in items:
+            try:
+                self.validator.validate_event(name, target_date)
+                rule = self.validator.validate_recurrence(next(iter(recurrence), None), target_date)
+            except ValueError as e:
+                results.append({"name": name, "ok": False, "error": str(e)})
+                continue
+            results.append({"name": name, "ok": True})
+            valid.append((name, target_date, rule))
+        
+        if not valid:
+            return results
+        
+        self._roll()
+        with self._lock:
+            version = self.storage.version
+            created = self.storage.add_events(valid)
+            events = Storage._with_countdowns([e for e in created if e is not None])
+            if events:
+                self._track_counts(version, self._status_totals(events, 1))
+        
+        created_iter = iter(created)
+        for result in results:
+            if not result["ok"]:
+                continue
+            event = next(created_iter)
+            if event is None:
+                result["ok"] = False
+                result["error"] = f"Event '{result['name']}' already exists, please use a different name"
+            else:
+                result["event"] = event
+        
+        return results
+
+    def get_event(self, name: str, today: Optional[int] = None) -> Optional[Dict]:
         """
         Get event by name (FR-003).
         
         Args:
             name: Event name
+            today: Today's ordinal. Defaults to date.today()
             
         Returns:
             Event data with remaining_days, or None if not found
         """
-        return self.storage.get_event(name)
+        self._roll()
+        return self.storage.get_event(name, today)
 
-    def list_events(self) -> List[Dict]:
+    def list_events(self, today: Optional[int] = None) -> List[Dict]:
         """
         List all events (FR-003).
         
+        Args:
+            today: Today's ordinal. Defaults to date.today()
+            
         Returns:
             List of all events with remaining_days
         """
-        return self.storage.get_all_events()
+        self._roll()
+        return self.storage.get_all_events(today)
+
+    def iter_events(self, chunk_size: int = 1000, today: Optional[int] = None) -> Iterator[List[Dict]]:
+        """
+        Iterate over all events in chunks (for streaming export).
+        
+        Args:
+            chunk_size: Maximum number of events per chunk
+            today: Today's ordinal. Defaults to date.today()
+            
+        Yields:
+            Lists of events with remaining_days
+        """
+        self._roll()
+        return self.storage.iter_events(chunk_size, today)
 
     def delete_event(self, name: str) -> bool:
         """
@@ -76,17 +214,492 @@ class EventManager:
         Returns:
             True if deleted, False if not found
         """
-        return self.storage.delete_event(name)
+        self._roll()
+        with self._lock:
+            event = self.storage.get_event(name)
+            if event is None:
+                return False
+            
+            version = self.storage.version
+            deleted = self.storage.delete_event(name)
+            if deleted:
+                self._track_counts(version, {event["status"]: -1})
+                if self.scheduler is not None:
+                    self.scheduler.cancel_event(name)
+        
+        return deleted
+
+    def delete_events(self, names: Iterable[str]) -> List[Dict]:
+        """
+        Delete many events with a single storage write (FR-004).
+        
+        Args:
+            names: Event names
+            
+        Returns:
+            One result per name, in order: {"name", "ok": True} or
+            {"name", "ok": False, "error"}
+        """
+        names = list(names)
+        if not names:
+            return []
+        
+        self._roll()
+        with self._lock:
+            version = self.storage.version
+            deleted = self.storage.delete_events(names)
+            events = Storage._with_countdowns([e for e in deleted if e is not None])
+            if events:
+                self._track_counts(version, self._status_totals(events, -1))
+            if self.scheduler is not None:
+                for event in events:
+                    self.scheduler.cancel_event(event["name"])
+        
+        return [
+            {"name": name, "ok": True}
+            if event is not None
+            else {"name": name, "ok": False, "error": f"Event '{name}' not found"}
+            for name, event in zip(names, deleted)
+        ]
+
+    def update_event(
+        self,
+        name: str,
+        target_date: str,
+        recurrence: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """
+        Move an existing event to a new target date.
+        
+        The event is replaced in a single storage write, so it keeps its
+        created_at and is never missing in between. Reminder rules are
+        kept and rescheduled for the new date.
+        
+        Args:
+            name: Event name
+            target_date: New target date (YYYY-MM-DD); the new first
+                         occurrence of a recurring event
+            recurrence: New recurrence rule, "none" to stop repeating,
+                        or None to keep the current rule
+                        
+        Returns:
+            Updated event data with remaining_days, or None if not found
+            
+        Raises:
+            ValueError: If validation fails
+        """
+        self.validator.validate_event(name, target_date)
+        
+        self._roll()
+        with self._lock:
+            existing = self.storage.get_event(name)
+            if existing is None:
+                return None
+            if recurrence is None:
+                recurrence = existing.get("recurrence")
+            recurrence = self.validator.validate_recurrence(recurrence, target_date)
+            
+            version = self.storage.version
+            replaced = self.storage.update_event(name, target_date, recurrence)
+            if replaced is None:
+                self._track_counts(version, {})
+                return None
+            
+            previous, event = replaced
+            changes = self._status_totals(Storage._with_countdowns([previous]), -1)
+            changes[event["status"]] = changes.get(event["status"], 0) + 1
+            self._track_counts(version, changes)
+            
+            event["remaining_days"] = Storage._calculate_remaining_days(event["target_date"])
+            if self.scheduler is not None:
+                self._schedule_reminders(event)
+        
+        return event
+
+    def set_reminders(
+        self,
+        name: str,
+        days_before: Iterable[int],
+        notification_type: str = "PUSH",
+    ) -> Optional[Dict]:
+        """
+        Remind N days before an event (FR-013: notify "生日" 7,3,1).
+        
+        Replaces the event's reminder rules. The rules are stored with the
+        event and scheduled on the attached ReminderScheduler, if any.
+        
+        Args:
+            name: Event name
+            days_before: Days before the event to remind; empty to
+                         remove all reminders
+            notification_type: PUSH, EMAIL or SMS
+            
+        Returns:
+            Event data with remaining_days and reminders, or None if not found
+            
+        Raises:
+            ValueError: If a day count or the notification type is invalid
+        """
+        reminders = self.validator.validate_reminders(days_before, notification_type)
+        self._roll()
+        with self._lock:
+            return self._store_reminders(name, reminders)
+
+    def _store_reminders(self, name: str, reminders: List[Dict]) -> Optional[Dict]:
+        """
+        Persist an event's reminder rules and schedule them (lock held).
+        
+        Args:
+            name: Event name
+            reminders: Validated rules
+            
+        Returns:
+            Event data with remaining_days, or None if not found
+        """
+        version = self.storage.version
+        event = self.storage.set_reminders(name, reminders)
+        # Statuses are unchanged; only the version moves on
+        self._track_counts(version, {})
+        if event is None:
+            return None
+        
+        event["remaining_days"] = Storage._calculate_remaining_days(event["target_date"])
+        if self.scheduler is not None:
+            self._schedule_reminders(event)
+        return event
+
+    def _schedule_reminders(self, event: Dict) -> int:
+        """
+        Replace an event's scheduled reminders with its stored rules.
+        
+        Args:
+            event: Event data with target_date and reminders
+            
+        Returns:
+            Number of reminders scheduled
+        """
+        self.scheduler.cancel_event(event["name"])
+        return sum(
+            self.scheduler.schedule(
+                event["name"], event["target_date"], rule["days_before"], rule["notification_type"]
+            ) is not None
+            for rule in event.get("reminders") or ()
+        )
 
-    def get_event_by_status(self, status: str) -> List[Dict]:
+    def _rearm_reminders(self, changes: List[Dict]) -> None:
+        """
+        Rollover listener: schedule the reminders of recurring events
+        that moved on to their next occurrence.
+        
+        Args:
+            changes: The rollover's status changes
+        """
+        for change in changes:
+            if "old_target_date" not in change:
+                continue
+            event = self.storage.get_event(change["name"])
+            if event is not None and event.get("reminders"):
+                self._schedule_reminders(event)
+
+    def get_stats(self, today: Optional[int] = None) -> Dict:
+        """
+        Get event counts by status and the next upcoming event.
+        
+        Args:
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Dictionary with total, active, current, expired and next_event
+            (event data or None)
+        """
+        counts = self.status_counts(today)
+        return {
+            "total": sum(counts.values()),
+            "active": counts["ACTIVE"],
+            "current": counts["CURRENT"],
+            "expired": counts["EXPIRED"],
+            "next_event": self.get_next_event(today),
+        }
+
+    def status_counts(self, today: Optional[int] = None) -> Dict[str, int]:
+        """
+        Get the number of events per status.
+        
+        Counters are kept up to date by create/delete/update through this
+        manager. When the day changes, the rollover's status changes move
+        events between counters (see _roll()). A full recount only happens
+        when another writer changed storage.
+        
+        The counters follow the server's day; counts for another day
+        (a client in a different timezone) are three range counts.
+        
+        Args:
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Dictionary {status: count} for ACTIVE, CURRENT and EXPIRED
+        """
+        self._roll()
+        server_day = date.today().toordinal()
+        if today is not None and today != server_day:
+            return {
+                status: self.storage.count_between(*Storage._status_range(status, today))
+                for status in STATUSES
+            }
+        
+        with self._lock:
+            today = server_day
+            version = self.storage.version
+            
+            if self._counts is None or version != self._counts_version or today != self._counts_day:
+                self._counts = {
+                    status: self.storage.count_between(*Storage._status_range(status, today))
+                    for status in STATUSES
+                }
+            
+            self._counts_version = version
+            self._counts_day = today
+            return dict(self._counts)
+
+    def _roll(self) -> None:
+        """
+        Persist status transitions on the first access of a new day.
+        
+        Runs before reads and writes, so every write is made (and counted)
+        on rolled statuses.
+        """
+        today = date.today().toordinal()
+        if self.rollover.day == today:
+            return
+        
+        with self._lock:
+            version = self.storage.version
+            since = self.rollover.day
+            changes = self.rollover.check(today)
+            self._track_rollover(version, since, today, changes)
+
+    def _track_rollover(self, version: int, since: Optional[int], today: int, changes: List[Dict]) -> None:
+        """
+        Move the status counters to today along with a rollover.
+        
+        Counters for the day statuses were rolled from only need the
+        rollover's own changes (old_status -> status, including recurring
+        events moved to their next date); anything else drops them.
+        
+        Args:
+            version: Storage version read just before the rollover
+            since: Day statuses were rolled from, or None
+            today: Day statuses were rolled to
+            changes: The rollover's status changes
+        """
+        if (
+            self._counts is None
+            or self._counts_day != since
+            or self._counts_version != version
+            or self.storage.version != (version + 1 if changes else version)
+            or any(change["old_status"] not in STATUSES for change in changes)
+        ):
+            self._counts = None
+            return
+        
+        for change in changes:
+            self._counts[change["old_status"]] -= 1
+            self._counts[change["status"]] += 1
+        self._counts_version = self.storage.version
+        self._counts_day = today
+
+    @staticmethod
+    def _status_totals(events: List[Dict], delta: int) -> Dict[str, int]:
+        """
+        Sum counter changes per status for a batch of events.
+        
+        Args:
+            events: Created or deleted events with status filled in
+            delta: +1 for create, -1 for delete
+            
+        Returns:
+            Dictionary {status: change}
+        """
+        totals: Dict[str, int] = {}
+        for event in events:
+            totals[event["status"]] = totals.get(event["status"], 0) + delta
+        return totals
+
+    def _track_counts(self, version: int, changes: Dict[str, int]) -> None:
+        """
+        Apply one storage write (single or batch) to the status counters.
+        
+        The counters are dropped instead if storage changed in any other
+        way since they were computed.
+        
+        Args:
+            version: Storage version read just before the write
+            changes: Counter change per status, e.g. {"ACTIVE": 1}
+        """
+        if (
+            self._counts is not None
+            and self._counts_version == version
+            and self._counts_day == date.today().toordinal()
+            and self.storage.version == version + 1
+        ):
+            for status, delta in changes.items():
+                self._counts[status] += delta
+            self._counts_version = version + 1
+        else:
+            self._counts = None
+
+    def get_event_by_status(self, status: str, today: Optional[int] = None) -> List[Dict]:
         """
         Get events filtered by status (FR-008b).
         
         Args:
             status: Status to filter (ACTIVE/CURRENT/EXPIRED)
+            today: Today's ordinal. Defaults to date.today()
             
         Returns:
             List of events with matching status
         """
-        all_events = self.list_events()
-        return [e for e in all_events if e["status"] == status]
+        self._roll()
+        return self.storage.get_events_by_status(status, today)
+
+    def count_events(self, status: Optional[str] = None, today: Optional[int] = None) -> int:
+        """
+        Count events, optionally filtered by status.
+        
+        Args:
+            status: Status to count (ACTIVE/CURRENT/EXPIRED), or None for all
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Number of matching events
+        """
+        self._roll()
+        return self.storage.count_events(status, today)
+
+    def get_next_event(self, today: Optional[int] = None) -> Optional[Dict]:
+        """
+        Get the nearest event that has not expired yet.
+        
+        Args:
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Event data with remaining_days, or None if there is none
+        """
+        self._roll()
+        return self.storage.get_next_event(today)
+
+    def upcoming_events(self, limit: Optional[int] = None, today: Optional[int] = None) -> List[Dict]:
+        """
+        Get the next events from today on, nearest first.
+        
+        Args:
+            limit: Maximum number of events, or None for all
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            List of events with remaining_days
+        """
+        self._roll()
+        return self.storage.get_upcoming_events(limit, today)
+
+    def events_between(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        today: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Get events with target date in [start, end], ordered by date.
+        
+        Args:
+            start: First target date to include (YYYY-MM-DD), or None
+            end: Last target date to include (YYYY-MM-DD), or None
+            limit: Maximum number of events, or None for all
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            List of events with remaining_days
+            
+        Raises:
+            ValueError: If a bound is not a valid date
+        """
+        self._roll()
+        for bound in (start, end):
+            if bound is not None:
+                self.validator.validate_date_value(bound)
+        
+        return self.storage.get_events_between(start, end, limit, today)
+
+    def search_events(self, query: str, limit: int = 50, today: Optional[int] = None) -> List[Dict]:
+        """
+        Find events whose name contains the query (case-insensitive).
+        
+        Args:
+            query: Text to look for in event names
+            limit: Maximum number of events
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Prefix matches first, then other matches, with remaining_days
+        """
+        self._roll()
+        return self.storage.search_events(query, limit, today)
+
+    def events_page(
+        self,
+        sort: str = "date",
+        after: Optional[Tuple[int, str]] = None,
+        limit: int = 50,
+        status: Optional[str] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        today: Optional[int] = None,
+    ) -> Tuple[List[Dict], Optional[Tuple[int, str]]]:
+        """
+        Get one page of events, optionally filtered by status and date.
+        
+        Args:
+            sort: date, name or remaining (see Storage.get_page())
+            after: Key returned with the previous page, or None
+            limit: Maximum number of events
+            status: Only events with this status (ACTIVE/CURRENT/EXPIRED)
+            start: First target date to include (YYYY-MM-DD), or None
+            end: Last target date to include (YYYY-MM-DD), or None
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            (events with remaining_days, key of the next page or None
+            if this is the last page)
+            
+        Raises:
+            ValueError: If sort, status or a bound is invalid
+        """
+        self._roll()
+        if today is None:
+            today = date.today().toordinal()
+        bounds = []
+        for bound in (start, end):
+            if bound is not None:
+                self.validator.validate_date_value(bound)
+                bound = date.fromisoformat(bound).toordinal()
+            bounds.append(bound)
+        lo, hi = bounds
+        
+        if status is not None:
+            if status not in STATUSES:
+                raise ValueError(f"Invalid status: {status}")
+            status_lo, status_hi = Storage._status_range(status, today)
+            if status_lo is not None:
+                lo = status_lo if lo is None else max(lo, status_lo)
+            if status_hi is not None:
+                hi = status_hi if hi is None else min(hi, status_hi)
+        
+        # One extra event tells whether another page follows
+        events = self.storage.get_page(sort, after, limit + 1, lo, hi, today)
+        if len(events) <= limit:
+            return events, None
+        
+        events = events[:limit]
+        return events, (events[-1]["target_ordinal"], events[-1]["name"])
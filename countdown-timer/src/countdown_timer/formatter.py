@@ -1,6 +1,6 @@
 """Formatter module - Output formatting (FR-007)."""
 
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 class Formatter:
@@ -22,11 +22,51 @@ class Formatter:
         name = event["name"]
         remaining = event.get("remaining_days", 0)
         status = event.get("status", "ACTIVE")
+        repeat = Formatter.format_recurrence(event.get("recurrence"))
+        suffix = f" ({repeat})" if repeat else ""
         
         if status == "EXPIRED":
-            return f"{name} (已过期)"
+            return f"{name} (已过期){suffix}"
         else:
-            return f"{name} 还有 {remaining} 天"
+            return f"{name} 还有 {remaining} 天{suffix}"
+
+    @staticmethod
+    def format_recurrence(rule: Optional[str]) -> str:
+        """
+        Describe a normalized recurrence rule.
+        
+        Args:
+            rule: Rule (see recurrence.normalize_rule()), or None
+            
+        Returns:
+            Short description, e.g. "每年", or "" for one-off events
+        """
+        if not rule:
+            return ""
+        if rule == "yearly":
+            return "每年"
+        if rule == "monthly":
+            return "每月"
+        if rule.startswith("every "):
+            return f"每 {rule.split()[1]} 天"
+        return rule
+
+    @staticmethod
+    def format_reminders(reminders: Optional[List[Dict]]) -> str:
+        """
+        Describe an event's reminder rules.
+        
+        Args:
+            reminders: Rules as {"days_before", "notification_type"}, or None
+            
+        Returns:
+            Short description, e.g. "提前 7、3、1 天提醒 (PUSH)", or "" if none
+        """
+        if not reminders:
+            return ""
+        days = "、".join(str(rule["days_before"]) for rule in reminders)
+        types = sorted({rule["notification_type"] for rule in reminders})
+        return f"提前 {days} 天提醒 ({', '.join(types)})"
 
     @staticmethod
     def format_events_list(events: List[Dict]) -> str:
@@ -0,0 +1,285 @@
+"""Journal storage module - Log-structured event persistence."""
+
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from .storage import Storage, StorageError, synchronized
+
+
+class JournalStorage(Storage):
+    """
+    Stores events as a snapshot plus an append-only journal.
+    
+    events.json holds a snapshot in the same format as Storage, so the
+    two backends can read each other's data. Every mutation appends one
+    compact record to events.journal instead of rewriting the snapshot;
+    once the journal holds compact_threshold records, the next write
+    folds it into a new snapshot and truncates it. Compaction only runs
+    under the cross-process write lock, never from a read.
+    
+    Journal records are whole-event "put" or "del" operations, so
+    replaying a record that is already part of the snapshot is harmless.
+    """
+
+    def __init__(
+        self,
+        storage_dir: Optional[str] = None,
+        compact_threshold: int = 1000,
+        fsync: bool = False,
+    ):
+        """
+        Initialize journal storage and recover its state.
+        
+        Args:
+            storage_dir: Directory for events.json and events.journal.
+                        Defaults to $COUNTDOWN_HOME or ~/.countdown
+            compact_threshold: Journal records that trigger compaction
+            fsync: fsync the journal after every appended record
+        """
+        super().__init__(storage_dir, cache=True)
+        self.journal_file = self.storage_dir / "events.journal"
+        self.compact_threshold = compact_threshold
+        self.fsync = fsync
+        self._journal_offset = 0
+        self._journal_records = 0
+        self._recover()
+
+    def load_events(self) -> Dict:
+        """
+        Load all events from snapshot and journal.
+        
+        Returns:
+            Dictionary of events {name: event_data}
+        """
+        events, _, _ = self._read_state()
+        return events
+
+    def save_events(self, events: Dict) -> None:
+        """
+        Replace all events by writing a new snapshot.
+        
+        The journal is truncated afterwards since the snapshot already
+        contains everything it recorded.
+        
+        Args:
+            events: Dictionary of events to save
+        """
+        with self._locked():
+            self._write_snapshot(events)
+            with open(self.journal_file, "wb"):
+                pass
+            
+            if events is not self._index:
+                self._drop_indexes()
+                self._version += 1
+            self._index = events
+            self._fingerprint = self._file_fingerprint()
+            self._journal_offset = 0
+            self._journal_records = 0
+
+    @property
+    @synchronized
+    def version(self) -> int:
+        """
+        Change counter of the stored events.
+        
+        Bumped by every mutation made through this instance and whenever
+        another writer changed the snapshot or appended to the journal.
+        
+        Returns:
+            Current version number
+        """
+        self._events()
+        return self._version
+
+    @property
+    @synchronized
+    def revision(self) -> str:
+        """
+        Identify the stored events across processes and restarts.
+        
+        The snapshot's revision plus the journal length: appends only
+        grow the journal, and compaction replaces the snapshot.
+        
+        Returns:
+            Opaque revision string
+        """
+        return f"{Storage.revision.fget(self)}-{self._journal_size():x}"
+
+    @synchronized
+    def compact(self) -> None:
+        """
+        Fold the journal into a new snapshot.
+        
+        The journal is re-read under the write lock, so records another
+        process appended since this instance last read it are kept.
+        """
+        with self._locked():
+            self.save_events(self._events())
+
+    def _events(self) -> Dict:
+        """
+        Get the in-memory index, catching up with changes on disk.
+        
+        A new snapshot triggers full recovery; a longer journal only
+        replays the records appended since the last read.
+        
+        Returns:
+            Dictionary of events {name: event_data}
+        """
+        if self._index is None or self._file_fingerprint() != self._fingerprint:
+            self._recover()
+            return self._index
+        
+        size = self._journal_size()
+        if size < self._journal_offset:
+            self._recover()
+        elif size > self._journal_offset:
+            offset, records = self._replay(self._index, self._journal_offset)
+            self._journal_offset = offset
+            self._journal_records += records
+            self._drop_indexes()
+            self._version += 1
+        
+        return self._index
+
+    def _write_events(self, events: Dict, batch: List[Dict]) -> None:
+        """Append a put record per event in one write."""
+        self._append([{"op": "put", "event": event_data} for event_data in batch])
+        for event_data in batch:
+            events[event_data["name"]] = event_data
+        self._maybe_compact()
+
+    def _remove_events(self, events: Dict, names: List[str]) -> None:
+        """Append a del record per event in one write."""
+        self._append([{"op": "del", "name": name} for name in names])
+        for name in names:
+            del events[name]
+        self._maybe_compact()
+
+    def _append(self, records: List[Dict]) -> None:
+        """
+        Append records to the journal with a single write.
+        
+        Anything past the last complete record (a torn write) is cut off
+        first so the new records start on a record boundary. Callers hold
+        the write lock and have caught up with the journal.
+        
+        Args:
+            records: Journal records to append
+        """
+        data = "".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in records
+        ).encode("utf-8")
+        
+        with open(self.journal_file, "ab") as f:
+            f.truncate(self._journal_offset)
+            f.write(data)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        
+        self._journal_offset += len(data)
+        self._journal_records += len(records)
+        self._version += 1
+
+    def _maybe_compact(self) -> None:
+        """Compact once the journal reaches compact_threshold records (writers only)."""
+        if self._journal_records >= self.compact_threshold:
+            self.compact()
+
+    def _recover(self) -> None:
+        """
+        Rebuild the in-memory index from snapshot and full journal.
+        
+        Runs under the write lock, so a trailing record without its
+        newline cannot be a write in progress: it was torn by a crash and
+        is truncated.
+        """
+        with self._locked():
+            fingerprint = self._file_fingerprint()
+            events, offset, records = self._read_state()
+            if self._journal_size() > offset:
+                os.truncate(self.journal_file, offset)
+        
+        self._index = events
+        self._drop_indexes()
+        self._version += 1
+        self._fingerprint = fingerprint
+        self._journal_offset = offset
+        self._journal_records = records
+
+    def _read_state(self) -> Tuple[Dict, int, int]:
+        """
+        Read the snapshot and replay the whole journal on top of it.
+        
+        Returns:
+            (events, journal offset after replay, records replayed)
+        """
+        events = Storage.load_events(self)
+        offset, records = self._replay(events, 0)
+        return events, offset, records
+
+    def _replay(self, events: Dict, offset: int) -> Tuple[int, int]:
+        """
+        Apply journal records starting at a byte offset.
+        
+        A trailing record without its newline is a write in progress (or
+        torn by a crash) and is left for a later read; recovery truncates
+        a torn one.
+        
+        Args:
+            events: Events dictionary to apply records to
+            offset: Byte offset of the first record to apply
+            
+        Returns:
+            (offset after the last complete record, records applied)
+            
+        Raises:
+            StorageError: If a complete record is not valid JSON.
+        """
+        try:
+            with open(self.journal_file, "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except FileNotFoundError:
+            return 0, 0
+        
+        records = 0
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                break
+            
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                raise StorageError(
+                    f"Corrupt record at byte {offset} of {self.journal_file}: {e}"
+                ) from e
+            offset += len(line)
+            
+            if record.get("op") == "put":
+                events[record["event"]["name"]] = record["event"]
+            elif record.get("op") == "del":
+                events.pop(record["name"], None)
+            records += 1
+        
+        return offset, records
+
+    def _write_snapshot(self, events: Dict) -> None:
+        """
+        Atomically replace events.json with a compact snapshot.
+        
+        Args:
+            events: Dictionary of events to write
+        """
+        self._write_atomic(events, separators=(",", ":"))
+
+    def _journal_size(self) -> int:
+        """Get the journal size in bytes (0 if missing)."""
+        try:
+            return os.stat(self.journal_file).st_size
+        except FileNotFoundError:
+            return 0
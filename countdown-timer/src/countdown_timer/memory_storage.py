@@ -0,0 +1,100 @@
+"""Memory storage module - Process-local event storage without files."""
+
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from .storage import Storage
+
+
+class MemoryStorage(Storage):
+    """
+    Keeps events in a dictionary in this process only.
+    
+    Shares all queries and indexes with Storage in cache mode but never
+    touches the disk: there is no events.json, no file lock and no
+    external change to detect. Data is lost when the process exits and
+    is not visible to other processes (e.g. the CLI), so this backend is
+    meant for tests, benchmarks and throwaway deployments.
+    """
+
+    def __init__(self, storage_dir: Optional[str] = None):
+        """
+        Initialize empty storage.
+        
+        Args:
+            storage_dir: Ignored; accepted so every backend can be
+                         created the same way (see backends.create_storage)
+        """
+        super().__init__(storage_dir, cache=True)
+        self._index = {}
+        # Another process (or a restart) holds other data under the same versions
+        self._instance = uuid.uuid4().hex[:8]
+        self._rolled_day: Optional[int] = None
+
+    def _ensure_storage_dir(self) -> None:
+        """Nothing is written to disk."""
+
+    def load_events(self) -> Dict:
+        """
+        Get a copy of all events.
+        
+        Returns:
+            Dictionary of events {name: event_data}
+        """
+        return {name: dict(e) for name, e in self._index.items()}
+
+    def save_events(self, events: Dict) -> None:
+        """
+        Replace all events.
+        
+        Args:
+            events: Dictionary of events to keep
+        """
+        with self._locked():
+            if events is not self._index:
+                self._drop_indexes()
+            self._index = events
+            self._version += 1
+
+    @property
+    def revision(self) -> str:
+        """
+        Identify the stored events (this instance and its version).
+        
+        Returns:
+            Opaque revision string
+        """
+        return f"{self._instance}-{self.version}"
+
+    @property
+    def rolled_day(self) -> Optional[int]:
+        """
+        Day statuses were last rolled to.
+        
+        Returns:
+            Date ordinal, or None if statuses were never rolled
+        """
+        return self._rolled_day
+
+    def _save_rolled_day(self, today: int) -> None:
+        """Record the day statuses were rolled to."""
+        self._rolled_day = today
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the thread lock (there are no other processes to exclude)."""
+        with self._thread_lock:
+            yield
+
+    def _check_fingerprint(self) -> None:
+        """No one else can change the events."""
+
+    def _events(self) -> Dict:
+        """
+        Get the current events dictionary (never reloaded).
+        
+        Returns:
+            Dictionary of events {name: event_data}
+        """
+        return self._index
@@ -0,0 +1,359 @@
+"""Notifier module - Reminder scheduling and dispatch (FR-013)."""
+
+import functools
+import heapq
+import logging
+import threading
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .validator import NOTIFICATION_TYPES
+
+
+logger = logging.getLogger(__name__)
+
+# (event_name, days_before, notification_type)
+ReminderKey = Tuple[str, int, str]
+
+
+@functools.lru_cache(maxsize=4096)
+def _due_timestamp(remind_on: date, fire_time: dt_time) -> float:
+    """Unix timestamp of fire_time (local) on a day; many rules share a day."""
+    return datetime.combine(remind_on, fire_time).timestamp()
+
+
+class LogSink:
+    """Sink that writes every reminder to a logger (for local use and tests)."""
+
+    def __init__(self, log: Optional[logging.Logger] = None, level: int = logging.INFO):
+        """
+        Initialize sink.
+        
+        Args:
+            log: Logger to write to. Defaults to this module's logger
+            level: Log level of the reminder messages
+        """
+        self.log = log or logger
+        self.level = level
+
+    def send(self, reminder: Dict) -> None:
+        """Log one reminder."""
+        self.log.log(
+            self.level,
+            "[%s] %s in %d day(s) (%s)",
+            reminder["notification_type"],
+            reminder["event_name"],
+            reminder["days_before"],
+            reminder["target_date"],
+        )
+
+
+class MemorySink:
+    """Sink that keeps every reminder in a list (for tests)."""
+
+    def __init__(self):
+        self.sent: List[Dict] = []
+
+    def send(self, reminder: Dict) -> None:
+        """Record one reminder."""
+        self.sent.append(reminder)
+
+
+class ReminderScheduler:
+    """
+    Fires reminders N days before events (notify "生日" 7,3,1).
+    
+    Pending reminders sit in a min-heap ordered by due time, so adding
+    one is O(log n) and finding the next one is O(1); nothing scans all
+    events. Cancelling only drops the reminder from a dictionary and
+    leaves its heap entry behind to be skipped when it surfaces; the
+    heap is rebuilt once such stale entries outnumber the live ones.
+    
+    Reminders are sent to every sink: any object with a send(reminder)
+    method, where reminder is a dictionary with event_name, target_date,
+    days_before, notification_type and due_at.
+    
+    Either call run_pending() yourself or start() a background thread
+    that sleeps until the earliest reminder is due (or one is added).
+    
+    Example:
+        scheduler = ReminderScheduler([LogSink()])
+        scheduler.schedule_event("生日", "2026-03-15", [7, 3, 1])
+        scheduler.start()
+    """
+
+    def __init__(
+        self,
+        sinks: Iterable = (),
+        fire_time: dt_time = dt_time(9, 0),
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Initialize scheduler.
+        
+        Args:
+            sinks: Objects with a send(reminder) method
+            fire_time: Local time of day at which reminders are sent
+            clock: Returns the current time as a Unix timestamp
+        """
+        self.sinks = list(sinks)
+        self.fire_time = fire_time
+        self.clock = clock
+        self._heap: List[Tuple[float, int, ReminderKey]] = []
+        self._live: Dict[ReminderKey, Tuple[float, int, str]] = {}
+        self._by_event: Dict[str, Set[ReminderKey]] = {}
+        self._seq = 0
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def schedule(
+        self,
+        event_name: str,
+        target_date: str,
+        days_before: int,
+        notification_type: str = "PUSH",
+    ) -> Optional[float]:
+        """
+        Schedule one reminder, replacing the same rule if already scheduled.
+        
+        Args:
+            event_name: Event name
+            target_date: Event date (YYYY-MM-DD)
+            days_before: Days before the event to remind (> 0)
+            notification_type: PUSH, EMAIL or SMS
+            
+        Returns:
+            Due time as a Unix timestamp, or None if the reminder day has
+            already passed (nothing is scheduled)
+            
+        Raises:
+            ValueError: If days_before or notification_type is invalid
+        """
+        if not isinstance(days_before, int) or days_before <= 0:
+            raise ValueError(f"days_before must be a positive integer, got {days_before!r}")
+        if notification_type not in NOTIFICATION_TYPES:
+            raise ValueError(
+                f"Invalid notification type: {notification_type}. "
+                f"Expected one of {', '.join(NOTIFICATION_TYPES)}"
+            )
+        
+        remind_on = date.fromisoformat(target_date) - timedelta(days=days_before)
+        key = (event_name, days_before, notification_type)
+        with self._condition:
+            self._discard(key)
+            if remind_on < datetime.fromtimestamp(self.clock()).date():
+                return None
+            
+            due = _due_timestamp(remind_on, self.fire_time)
+            self._seq += 1
+            self._live[key] = (due, self._seq, target_date)
+            self._by_event.setdefault(event_name, set()).add(key)
+            heapq.heappush(self._heap, (due, self._seq, key))
+            
+            # Wake the runner if this is now the earliest reminder
+            if self._heap[0][0] == due:
+                self._condition.notify()
+        
+        return due
+
+    def schedule_event(
+        self,
+        event_name: str,
+        target_date: str,
+        days_before: Iterable[int],
+        notification_type: str = "PUSH",
+    ) -> int:
+        """
+        Schedule several reminders for one event, e.g. 7, 3 and 1 days before.
+        
+        Args:
+            event_name: Event name
+            target_date: Event date (YYYY-MM-DD)
+            days_before: Days before the event to remind
+            notification_type: PUSH, EMAIL or SMS
+            
+        Returns:
+            Number of reminders scheduled (passed days are skipped)
+            
+        Raises:
+            ValueError: If a day count or notification_type is invalid
+        """
+        return sum(
+            self.schedule(event_name, target_date, days, notification_type) is not None
+            for days in days_before
+        )
+
+    def cancel(self, event_name: str, days_before: int, notification_type: str = "PUSH") -> bool:
+        """
+        Cancel one reminder.
+        
+        Args:
+            event_name: Event name
+            days_before: Days before the event
+            notification_type: PUSH, EMAIL or SMS
+            
+        Returns:
+            True if it was scheduled, False otherwise
+        """
+        with self._condition:
+            return self._discard((event_name, days_before, notification_type))
+
+    def cancel_event(self, event_name: str) -> int:
+        """
+        Cancel all reminders of an event (e.g. after it was deleted).
+        
+        Args:
+            event_name: Event name
+            
+        Returns:
+            Number of reminders cancelled
+        """
+        with self._condition:
+            keys = list(self._by_event.get(event_name, ()))
+            for key in keys:
+                self._discard(key)
+            return len(keys)
+
+    def reschedule_event(self, event_name: str, target_date: str) -> int:
+        """
+        Move all reminders of an event to a new event date.
+        
+        Args:
+            event_name: Event name
+            target_date: New event date (YYYY-MM-DD)
+            
+        Returns:
+            Number of reminders still scheduled
+        """
+        with self._condition:
+            keys = list(self._by_event.get(event_name, ()))
+            return sum(
+                self.schedule(event_name, target_date, days_before, notification_type) is not None
+                for _, days_before, notification_type in keys
+            )
+
+    def next_due(self) -> Optional[float]:
+        """
+        Get the due time of the earliest pending reminder.
+        
+        Returns:
+            Unix timestamp, or None if nothing is scheduled
+        """
+        with self._condition:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def run_pending(self, now: Optional[float] = None) -> List[Dict]:
+        """
+        Send every reminder that is due.
+        
+        A sink that raises is logged and does not stop the other sinks
+        or reminders.
+        
+        Args:
+            now: Current Unix timestamp. Defaults to clock()
+            
+        Returns:
+            The reminders sent, earliest first
+        """
+        if now is None:
+            now = self.clock()
+        
+        due: List[Dict] = []
+        with self._condition:
+            while self._heap and self._heap[0][0] <= now:
+                when, seq, key = heapq.heappop(self._heap)
+                entry = self._live.get(key)
+                if entry is None or entry[1] != seq:
+                    continue
+                self._discard(key)
+                event_name, days_before, notification_type = key
+                due.append({
+                    "event_name": event_name,
+                    "target_date": entry[2],
+                    "days_before": days_before,
+                    "notification_type": notification_type,
+                    "due_at": datetime.fromtimestamp(when).isoformat(),
+                })
+        
+        # Sinks may do network I/O: call them without holding the lock
+        for reminder in due:
+            for sink in self.sinks:
+                try:
+                    sink.send(reminder)
+                except Exception:
+                    logger.exception("Reminder sink %r failed", sink)
+        return due
+
+    def start(self) -> None:
+        """Send reminders from a background thread until stop() is called."""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="countdown-reminders", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background thread.
+        
+        Args:
+            timeout: Seconds to wait for it to finish, or None to wait
+        """
+        with self._condition:
+            thread, self._thread = self._thread, None
+            self._stopping = True
+            self._condition.notify()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _run(self) -> None:
+        """Background loop: sleep until the earliest reminder is due, then send."""
+        while True:
+            with self._condition:
+                while not self._stopping:
+                    due = self.next_due()
+                    delay = None if due is None else due - self.clock()
+                    if delay is not None and delay <= 0:
+                        break
+                    self._condition.wait(delay)
+                if self._stopping:
+                    return
+            self.run_pending()
+
+    def _discard(self, key: ReminderKey) -> bool:
+        """
+        Forget a reminder; its heap entry becomes stale.
+        
+        Must be called with the lock held.
+        
+        Returns:
+            True if it was scheduled
+        """
+        if self._live.pop(key, None) is None:
+            return False
+        
+        keys = self._by_event[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._by_event[key[0]]
+        
+        if len(self._heap) > 2 * len(self._live) + 64:
+            self._heap = [(due, seq, k) for k, (due, seq, _) in self._live.items()]
+            heapq.heapify(self._heap)
+        return True
+
+    def _drop_stale(self) -> None:
+        """Pop cancelled entries off the top of the heap (lock held)."""
+        while self._heap:
+            _, seq, key = self._heap[0]
+            entry = self._live.get(key)
+            if entry is not None and entry[1] == seq:
+                return
+            heapq.heappop(self._heap)
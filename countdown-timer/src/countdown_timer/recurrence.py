@@ -0,0 +1,147 @@
+"""Recurrence module - Repeating events (yearly, monthly, every N days, RRULE)."""
+
+import functools
+import re
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Optional
+
+# python-dateutil is imported on first use: most events do not repeat, and
+# CLI commands that never compute an occurrence should not pay for it
+if TYPE_CHECKING:
+    from dateutil.rrule import rrule
+
+
+# Simple rules -> months between occurrences
+MONTH_STEPS = {"yearly": 12, "monthly": 1}
+
+# Aliases for day-based rules
+DAY_ALIASES = {"daily": 1, "weekly": 7}
+
+# RRULE subset: whole-day rules anchored at the event's date
+RRULE_FREQS = ("YEARLY", "MONTHLY", "WEEKLY", "DAILY")
+RRULE_PARTS = ("FREQ", "INTERVAL", "COUNT", "UNTIL", "BYMONTH", "BYMONTHDAY", "BYDAY", "BYSETPOS", "WKST")
+
+_EVERY_DAYS = re.compile(r"every\s+(\d+)\s+days?")
+
+
+def normalize_rule(rule: Optional[str]) -> Optional[str]:
+    """
+    Validate a recurrence rule and convert it to its stored form.
+    
+    Accepted rules (case-insensitive):
+    - yearly, monthly: same day every year/month; days missing from a
+      month fall on its last day (Jan 31 -> Feb 28 -> Mar 31)
+    - every N days, daily, weekly
+    - RRULE:FREQ=...;... with FREQ YEARLY/MONTHLY/WEEKLY/DAILY and
+      INTERVAL, COUNT, UNTIL (YYYYMMDD), BYMONTH, BYMONTHDAY, BYDAY,
+      BYSETPOS, WKST; evaluated by python-dateutil from the event date
+    - none or an empty string for no recurrence
+    
+    Args:
+        rule: Rule text, or None
+        
+    Returns:
+        "yearly", "monthly", "every N days", "RRULE:..." or None
+        
+    Raises:
+        ValueError: If the rule is not supported
+    """
+    if rule is None:
+        return None
+    
+    text = rule.strip()
+    lowered = " ".join(text.lower().split())
+    if lowered in ("", "none"):
+        return None
+    if lowered in MONTH_STEPS:
+        return lowered
+    if lowered in DAY_ALIASES:
+        return _every_days(DAY_ALIASES[lowered])
+    
+    match = _EVERY_DAYS.fullmatch(lowered)
+    if match:
+        days = int(match.group(1))
+        if days < 1:
+            raise ValueError(f"Invalid recurrence: {rule}. Interval must be at least 1 day")
+        return _every_days(days)
+    
+    body = text.upper()
+    if body.startswith("RRULE:"):
+        body = body[len("RRULE:"):]
+    if "FREQ=" not in body:
+        raise ValueError(
+            f"Invalid recurrence: {rule}. Expected yearly, monthly, every N days or RRULE:FREQ=..."
+        )
+    
+    parts = {}
+    for part in body.split(";"):
+        key, _, value = part.partition("=")
+        if key not in RRULE_PARTS or not value:
+            raise ValueError(f"Unsupported RRULE part: {part}")
+        parts[key] = value
+    if parts.get("FREQ") not in RRULE_FREQS:
+        raise ValueError(f"Unsupported RRULE frequency: {parts.get('FREQ')}")
+    if "UNTIL" in parts and not re.fullmatch(r"\d{8}", parts["UNTIL"]):
+        raise ValueError(f"Invalid RRULE UNTIL: {parts['UNTIL']}. Expected YYYYMMDD")
+    
+    normalized = "RRULE:" + ";".join(f"{key}={value}" for key, value in parts.items())
+    from dateutil.rrule import rrulestr
+    try:
+        rrulestr(normalized, dtstart=datetime(2000, 1, 1))
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid RRULE: {rule}") from e
+    return normalized
+
+
+@functools.lru_cache(maxsize=4096)
+def next_occurrence(rule: str, start: int, today: int) -> Optional[int]:
+    """
+    Get the first occurrence on or after today.
+    
+    Results are cached: callers only ask again once the occurrence
+    they got has passed, so each event costs one evaluation per
+    occurrence rather than one per read.
+    
+    Args:
+        rule: Normalized rule (see normalize_rule())
+        start: Ordinal of the first occurrence (the event's date)
+        today: Today's ordinal
+        
+    Returns:
+        Ordinal of the next occurrence, or None if the rule has ended
+        (COUNT or UNTIL reached)
+    """
+    if rule.startswith("RRULE:"):
+        occurrence = _rrule(rule, start).after(datetime.fromordinal(today), inc=True)
+        return None if occurrence is None else occurrence.toordinal()
+    
+    if today <= start:
+        return start
+    
+    months = MONTH_STEPS.get(rule)
+    if months is not None:
+        from dateutil.relativedelta import relativedelta
+        first = date.fromordinal(start)
+        now = date.fromordinal(today)
+        # Always step from the first date so clamped days do not drift
+        step = ((now.year - first.year) * 12 + now.month - first.month) // months
+        while True:
+            occurrence = (first + relativedelta(months=step * months)).toordinal()
+            if occurrence >= today:
+                return occurrence
+            step += 1
+    
+    days = int(_EVERY_DAYS.fullmatch(rule).group(1))
+    return start + -(-(today - start) // days) * days
+
+
+@functools.lru_cache(maxsize=1024)
+def _rrule(rule: str, start: int) -> "rrule":
+    """Parsed RRULE anchored at a start day (shared by all its lookups)."""
+    from dateutil.rrule import rrulestr
+    return rrulestr(rule, dtstart=datetime.fromordinal(start))
+
+
+def _every_days(days: int) -> str:
+    """Stored form of a rule repeating every N days."""
+    return f"every {days} day" if days == 1 else f"every {days} days"
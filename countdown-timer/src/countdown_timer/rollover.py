@@ -0,0 +1,89 @@
+"""Rollover module - Daily persisted status transitions (FR-008b)."""
+
+import threading
+from datetime import date
+from typing import Callable, Dict, List, Optional
+
+
+# Receives the status changes of one rollover
+RolloverListener = Callable[[List[Dict]], None]
+
+
+class StatusRollover:
+    """
+    Keeps stored event statuses in step with the calendar.
+    
+    Statuses only change when the day changes (ACTIVE -> CURRENT on the
+    target date, CURRENT -> EXPIRED the day after). check() is cheap on
+    every call but does work only on the first call of a new day: it
+    asks storage for the events dated between the last rolled day and
+    today, persists their new status in one batch and passes the
+    changes to every listener (EventManager re-arms the reminders of
+    recurring events that moved on; it updates its status counters
+    from check()'s return value).
+    
+    The last rolled day is persisted by storage and shared by every
+    process, so a new process only examines the days since then. Only
+    storage that was never rolled (new, or written by older versions)
+    has all events dated up to today compared, which also repairs
+    stale statuses.
+    
+    Example:
+        rollover = StatusRollover(storage)
+        rollover.add_listener(lambda changes: print(len(changes), "changed"))
+        rollover.check()
+    """
+
+    def __init__(self, storage):
+        """
+        Initialize rollover.
+        
+        Args:
+            storage: Storage instance (provides roll_statuses())
+        """
+        self.storage = storage
+        # Loaded from storage.rolled_day on the first check
+        self.day: Optional[int] = None
+        self._listeners: List[RolloverListener] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: RolloverListener) -> None:
+        """
+        Call listener with the changes of every rollover that changed events.
+        
+        Listeners run on the thread that triggered the rollover and should
+        return quickly.
+        
+        Args:
+            listener: Callable taking a list of
+                      {"name", "target_date", "old_status", "status"}
+        """
+        self._listeners.append(listener)
+
+    def check(self, today: Optional[int] = None) -> List[Dict]:
+        """
+        Roll statuses over if the day changed since the last check.
+        
+        Args:
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Events whose status changed (empty if the day did not change)
+        """
+        if today is None:
+            today = date.today().toordinal()
+        if today == self.day:
+            return []
+        
+        with self._lock:
+            if self.day is None:
+                self.day = self.storage.rolled_day
+            if today == self.day:
+                return []
+            changes = self.storage.roll_statuses(today, self.day)
+            self.day = today
+        
+        if changes:
+            for listener in self._listeners:
+                listener(changes)
+        return changes
@@ -0,0 +1,120 @@
+"""Search module - In-memory name index for prefix and substring search."""
+
+import heapq
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class NameIndex:
+    """
+    Case-insensitive name index answering prefix and substring queries.
+    
+    Names are compared casefolded. Two structures are kept in sync:
+    
+    - a sorted list of (folded name, name) pairs; a prefix query is one
+      bisect plus a walk over the matches
+    - a map from every 1- and 2-character gram to the names containing
+      it; a substring query intersects the postings of the query's
+      bigrams (smallest first) and verifies the few candidates left
+      
+    Grams are plain characters, so CJK names such as "生日" need no
+    tokenizer.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        """
+        Build the index.
+        
+        Args:
+            names: Initial event names
+        """
+        self._sorted: List[Tuple[str, str]] = sorted((name.casefold(), name) for name in names)
+        self._grams: Dict[str, Set[str]] = {}
+        for folded, name in self._sorted:
+            for gram in self._grams_of(folded):
+                self._grams.setdefault(gram, set()).add(name)
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def add(self, name: str) -> None:
+        """
+        Index a new name.
+        
+        Args:
+            name: Event name
+        """
+        folded = name.casefold()
+        insort(self._sorted, (folded, name))
+        for gram in self._grams_of(folded):
+            self._grams.setdefault(gram, set()).add(name)
+
+    def remove(self, name: str) -> None:
+        """
+        Remove a name (ignored if not indexed).
+        
+        Args:
+            name: Event name
+        """
+        folded = name.casefold()
+        position = bisect_left(self._sorted, (folded, name))
+        if position == len(self._sorted) or self._sorted[position] != (folded, name):
+            return
+        
+        del self._sorted[position]
+        for gram in self._grams_of(folded):
+            names = self._grams[gram]
+            names.discard(name)
+            if not names:
+                del self._grams[gram]
+
+    def search(self, query: str, limit: int = 50) -> List[str]:
+        """
+        Find names containing the query.
+        
+        Args:
+            query: Text to look for (case-insensitive)
+            limit: Maximum number of names
+            
+        Returns:
+            Names starting with the query in name order, followed by
+            the other names containing it in name order
+        """
+        folded = query.casefold()
+        if not folded or limit <= 0:
+            return []
+        
+        # Prefix matches: contiguous run in the sorted list
+        prefix: List[str] = []
+        position = bisect_left(self._sorted, (folded,))
+        while (
+            position < len(self._sorted)
+            and len(prefix) < limit
+            and self._sorted[position][0].startswith(folded)
+        ):
+            prefix.append(self._sorted[position][1])
+            position += 1
+        if len(prefix) == limit:
+            return prefix
+        
+        # Substring matches: intersect gram postings, then verify
+        grams = [folded] if len(folded) == 1 else sorted(
+            {folded[i:i + 2] for i in range(len(folded) - 1)},
+            key=lambda gram: len(self._grams.get(gram, ())),
+        )
+        postings = [self._grams.get(gram) for gram in grams]
+        if not all(postings):
+            return prefix
+        candidates = set(postings[0]).intersection(*postings[1:])
+        
+        others = (
+            (name.casefold(), name)
+            for name in candidates
+            if folded in name.casefold() and not name.casefold().startswith(folded)
+        )
+        return prefix + [name for _, name in heapq.nsmallest(limit - len(prefix), others)]
+
+    @staticmethod
+    def _grams_of(folded: str) -> Set[str]:
+        """Get the distinct 1- and 2-character grams of a folded name."""
+        return set(folded) | {folded[i:i + 2] for i in range(len(folded) - 1)}
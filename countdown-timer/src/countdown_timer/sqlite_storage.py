@@ -0,0 +1,890 @@
+"""SQLite storage module - Event data persistence (P2: SQLite)."""
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
+
+from .recurrence import next_occurrence
+from .search import NameIndex
+from .storage import SORTS, Storage, StorageError, default_storage_dir
+
+
+# Schema from specs/001-countdown-timer/data-model.md (events table only).
+# Status is derived from target_date, so status queries are target_date ranges.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL,
+    target_date DATE NOT NULL,
+    target_ordinal INTEGER NOT NULL,
+    created_at TIMESTAMP NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    status TEXT DEFAULT 'ACTIVE',
+    recurrence TEXT,
+    start_date DATE,
+    reminders TEXT,
+    CHECK (name != ''),
+    CHECK (length(name) <= 256),
+    CHECK (status IN ('ACTIVE', 'CURRENT', 'EXPIRED', 'DELETED'))
+);
+CREATE INDEX IF NOT EXISTS idx_events_target_date ON events(target_date, name);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('changes', 0);
+"""
+
+# Upgrades from older schema versions, keyed by the version they produce
+MIGRATIONS = {
+    2: """
+    ALTER TABLE events ADD COLUMN target_ordinal INTEGER NOT NULL DEFAULT 0;
+    UPDATE events SET target_ordinal =
+        CAST(julianday(target_date) - julianday('0001-01-01') AS INTEGER) + 1;
+    """,
+    3: """
+    ALTER TABLE events ADD COLUMN recurrence TEXT;
+    ALTER TABLE events ADD COLUMN start_date DATE;
+    """,
+    4: """
+    CREATE TABLE IF NOT EXISTS meta (
+        key TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    );
+    INSERT OR IGNORE INTO meta (key, value) VALUES ('changes', 0);
+    """,
+    5: """
+    ALTER TABLE events ADD COLUMN reminders TEXT;
+    """,
+}
+
+SCHEMA_VERSION = 5
+
+# Recurring events are stored at their next occurrence (start_date keeps the first);
+# reminders holds the event's reminder rules as a JSON list, or NULL
+COLUMNS = "name, target_date, target_ordinal, created_at, status, recurrence, start_date, reminders"
+PLACEHOLDERS = ", ".join("?" * len(COLUMNS.split(", ")))
+
+# Status of an event on day :today (stored status is kept in sync by roll_statuses)
+STATUS_CASE = (
+    "CASE WHEN target_date > :today THEN 'ACTIVE' "
+    "WHEN target_date = :today THEN 'CURRENT' ELSE 'EXPIRED' END"
+)
+
+# Status -> WHERE clause comparing target_date with today
+STATUS_RANGES = {
+    "ACTIVE": "target_date > ?",
+    "CURRENT": "target_date = ?",
+    "EXPIRED": "target_date < ?",
+}
+
+
+class SQLiteStorage:
+    """Manages event data storage (SQLite for P2)."""
+    
+    # Same date arithmetic as the JSON storage
+    _calculate_remaining_days = staticmethod(Storage._calculate_remaining_days)
+    _calculate_status = staticmethod(Storage._calculate_status)
+
+    def __init__(self, storage_dir: Optional[str] = None, migrate_json: bool = True):
+        """
+        Initialize storage and create the schema if needed.
+        
+        Args:
+            storage_dir: Directory for storing events.db.
+                        Defaults to $COUNTDOWN_HOME or ~/.countdown
+            migrate_json: Import events.json (and events.journal) from the
+                          same directory when the database is first created
+                          
+        Raises:
+            StorageError: If the events to migrate cannot be read; the
+                          migration is retried on the next start
+        """
+        if storage_dir is None:
+            storage_dir = default_storage_dir()
+        
+        self.storage_dir = Path(storage_dir)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.db_file = self.storage_dir / "events.db"
+        
+        # Shared between the threads serving API requests; _lock serializes use
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._version = 0
+        self._data_version: Optional[int] = None
+        # Search index over names, valid for one storage version
+        self._search_index: Optional[NameIndex] = None
+        self._search_version: Optional[int] = None
+        try:
+            self._init_schema(migrate_json)
+        except BaseException:
+            self._conn.close()
+            raise
+        # Baseline, so only other connections' commits count as external changes
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _init_schema(self, migrate_json: bool) -> None:
+        """
+        Create or upgrade tables and run the one-shot JSON migration.
+        
+        The schema version is only set once the migration succeeded, so
+        a failed or interrupted import runs again (names already imported
+        are skipped).
+        
+        Args:
+            migrate_json: Whether to import an existing events.json
+        """
+        with self._lock:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                return
+            
+            if version == 0:
+                self._conn.executescript(SCHEMA)
+                json_file = self.storage_dir / "events.json"
+                if migrate_json and (self.storage_dir / "events.journal").exists():
+                    # The journal backend's events are its snapshot plus the journal
+                    from .journal_storage import JournalStorage
+                    self._import_events(JournalStorage(storage_dir=str(self.storage_dir)).load_events())
+                elif migrate_json and json_file.exists():
+                    self.import_json(json_file)
+            else:
+                for target in range(version + 1, SCHEMA_VERSION + 1):
+                    self._conn.executescript(MIGRATIONS[target])
+            
+            self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def import_json(self, json_file) -> int:
+        """
+        Import events from a P1 events.json file.
+        
+        Events whose name already exists in the database are skipped.
+        
+        Args:
+            json_file: Path to the JSON file
+            
+        Returns:
+            Number of imported events (0 if the file does not exist)
+            
+        Raises:
+            StorageError: If the file is not valid JSON
+        """
+        try:
+            with open(json_file, "r") as f:
+                events = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except json.JSONDecodeError as e:
+            raise StorageError(f"Corrupt events file {json_file}: {e}") from e
+        return self._import_events(events)
+
+    def _import_events(self, events: Dict) -> int:
+        """
+        Insert P1 events, skipping names that already exist.
+        
+        Args:
+            events: Dictionary of events {name: event_data}
+            
+        Returns:
+            Number of imported events
+        """
+        rows = [
+            (
+                name,
+                event["target_date"],
+                Storage._target_ordinal(event),
+                event.get("created_at") or datetime.now().isoformat(),
+                self._calculate_status(event["target_date"]),
+                event.get("recurrence"),
+                event.get("start_date"),
+                _reminders_json(event),
+            )
+            for name, event in events.items()
+        ]
+        
+        with self._write():
+            before = self._conn.total_changes
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO events ({COLUMNS}) VALUES ({PLACEHOLDERS})", rows
+            )
+            return self._conn.total_changes - before
+
+    @property
+    def version(self) -> int:
+        """
+        Change counter of the stored events.
+        
+        Bumped by every write made through this connection and whenever
+        PRAGMA data_version shows a commit from another connection.
+        
+        Returns:
+            Current version number
+        """
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version:
+                self._data_version = data_version
+                self._version += 1
+            return self._version
+
+    @property
+    def revision(self) -> str:
+        """
+        Identify the stored events across processes and restarts.
+        
+        The change counter stored in the database, bumped by every write
+        transaction (version and PRAGMA data_version are per connection).
+        
+        Returns:
+            Opaque revision string
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'changes'").fetchone()
+            return f"{row[0]:x}"
+
+    @property
+    def rolled_day(self) -> Optional[int]:
+        """
+        Day statuses were last rolled to, by any process (see roll_statuses()).
+        
+        Returns:
+            Date ordinal, or None if statuses were never rolled
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'rolled_day'").fetchone()
+            return None if row is None else row[0]
+
+    def _save_rolled_day(self, today: int) -> None:
+        """Record the day statuses were rolled to (inside a transaction, lock held)."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('rolled_day', ?)", (today,)
+        )
+
+    @contextmanager
+    def _write(self):
+        """Run a write transaction and bump the version once it commits."""
+        with self._lock:
+            with self._conn:
+                yield self._conn
+                self._conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'changes'")
+            self._version += 1
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def load_events(self) -> Dict:
+        """
+        Load all events from storage.
+        
+        Returns:
+            Dictionary of events {name: event_data}
+        """
+        return {e["name"]: e for e in self._query(f"SELECT {COLUMNS} FROM events ORDER BY id")}
+
+    def save_events(self, events: Dict) -> None:
+        """
+        Replace all stored events in one transaction.
+        
+        Args:
+            events: Dictionary of events to save
+        """
+        rows = [
+            (
+                name,
+                e["target_date"],
+                Storage._target_ordinal(e),
+                e["created_at"],
+                e.get("status", "ACTIVE"),
+                e.get("recurrence"),
+                e.get("start_date"),
+                _reminders_json(e),
+            )
+            for name, e in events.items()
+        ]
+        with self._write():
+            self._conn.execute("DELETE FROM events")
+            self._conn.executemany(
+                f"INSERT INTO events ({COLUMNS}) VALUES ({PLACEHOLDERS})", rows
+            )
+
+    def event_exists(self, name: str) -> bool:
+        """
+        Check if event with given name exists (FR-008a: reject duplicates).
+        
+        Args:
+            name: Event name to check
+            
+        Returns:
+            True if event exists, False otherwise
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM events WHERE name = ?", (name,)).fetchone()
+        return row is not None
+
+    def add_event(self, name: str, target_date: str, recurrence: Optional[str] = None) -> Dict:
+        """
+        Add new event to storage (FR-001: create event).
+        
+        Args:
+            name: Event name (unique)
+            target_date: Target date (YYYY-MM-DD)
+            recurrence: Normalized recurrence rule, or None
+            
+        Returns:
+            Created event data
+            
+        Raises:
+            ValueError: If event already exists
+        """
+        created = self.add_events([(name, target_date, recurrence)])[0]
+        if created is None:
+            raise ValueError(f"Event '{name}' already exists")
+        return created
+
+    def add_events(self, items: Iterable[Tuple]) -> List[Optional[Dict]]:
+        """
+        Add many events in one transaction.
+        
+        Args:
+            items: (name, target_date) pairs or
+                   (name, target_date, recurrence) triples
+                   
+        Returns:
+            Created event data per item, in order; None for names that
+            already exist (in storage or earlier in the batch)
+        """
+        results: List[Optional[Dict]] = []
+        with self._lock:
+            indexed = self._search_current()
+            with self._write():
+                for name, target_date, *recurrence in items:
+                    event_data = Storage._new_event(name, target_date, *recurrence)
+                    cursor = self._conn.execute(
+                        f"INSERT OR IGNORE INTO events ({COLUMNS}) VALUES ({PLACEHOLDERS})",
+                        tuple(event_data.get(column) for column in COLUMNS.split(", ")),
+                    )
+                    results.append(event_data if cursor.rowcount else None)
+            
+            if indexed:
+                for event in results:
+                    if event is not None:
+                        self._search_index.add(event["name"])
+                self._search_version = self._version
+        return results
+
+    def get_event(self, name: str, today: Optional[int] = None) -> Optional[Dict]:
+        """
+        Get single event (FR-003: query event).
+        
+        Args:
+            name: Event name
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Event data with remaining_days, or None if not found
+        """
+        events = self._query(f"SELECT {COLUMNS} FROM events WHERE name = ?", (name,))
+        return Storage._with_countdowns(events, today)[0] if events else None
+
+    def get_all_events(self, today: Optional[int] = None) -> List[Dict]:
+        """
+        Get all events (FR-003: query all events).
+        
+        Args:
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            List of all events with remaining_days calculated
+        """
+        events = self._query(f"SELECT {COLUMNS} FROM events ORDER BY id")
+        return Storage._with_countdowns(events, today)
+
+    def iter_events(self, chunk_size: int = 1000, today: Optional[int] = None) -> Iterator[List[Dict]]:
+        """
+        Iterate over all events in chunks, in insertion order.
+        
+        Each chunk is a separate keyset query on the primary key, so no
+        cursor or lock is held between chunks.
+        
+        Args:
+            chunk_size: Maximum number of events per chunk
+            today: Today's ordinal. Defaults to date.today()
+            
+        Yields:
+            Lists of events with remaining_days calculated
+        """
+        last_id = 0
+        if today is None:
+            today = date.today().toordinal()
+        while True:
+            rows = self._query(
+                f"SELECT id, {COLUMNS} FROM events WHERE id > ? ORDER BY id LIMIT ?",
+                (last_id, chunk_size),
+            )
+            if not rows:
+                return
+            last_id = rows[-1]["id"]
+            for row in rows:
+                del row["id"]
+            yield Storage._with_countdowns(rows, today)
+
+    def delete_event(self, name: str) -> bool:
+        """
+        Delete event (FR-004: delete event).
+        
+        Args:
+            name: Event name to delete
+            
+        Returns:
+            True if deleted, False if not found
+        """
+        return self.delete_events([name])[0] is not None
+
+    def delete_events(self, names: Iterable[str]) -> List[Optional[Dict]]:
+        """
+        Delete many events in one transaction.
+        
+        Args:
+            names: Names of the events to delete
+            
+        Returns:
+            Deleted event data per name, in order; None if not found
+        """
+        results: List[Optional[Dict]] = []
+        with self._lock:
+            indexed = self._search_current()
+            with self._write():
+                for name in names:
+                    row = self._conn.execute(
+                        f"SELECT {COLUMNS} FROM events WHERE name = ?", (name,)
+                    ).fetchone()
+                    if row is not None:
+                        self._conn.execute("DELETE FROM events WHERE name = ?", (name,))
+                    results.append(None if row is None else _event(row))
+            
+            if indexed:
+                for event in results:
+                    if event is not None:
+                        self._search_index.remove(event["name"])
+                self._search_version = self._version
+        return results
+
+    def set_reminders(self, name: str, reminders: List[Dict]) -> Optional[Dict]:
+        """
+        Replace the reminder rules stored with an event (FR-013).
+        
+        Args:
+            name: Event name
+            reminders: Rules as {"days_before", "notification_type"};
+                       empty to remove all reminders
+                       
+        Returns:
+            Updated event data, or None if not found
+        """
+        with self._lock:
+            with self._write():
+                cursor = self._conn.execute(
+                    "UPDATE events SET reminders = ?, updated_at = CURRENT_TIMESTAMP WHERE name = ?",
+                    (_reminders_json({"reminders": reminders}), name),
+                )
+            if not cursor.rowcount:
+                return None
+            return self._query(f"SELECT {COLUMNS} FROM events WHERE name = ?", (name,))[0]
+
+    def update_event(
+        self, name: str, target_date: str, recurrence: Optional[str] = None
+    ) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Move an event to a new date with a single UPDATE.
+        
+        Date, status, recurrence and start_date are rebuilt as for a new
+        event; created_at and the reminder rules are kept.
+        
+        Args:
+            name: Event name
+            target_date: New target date (YYYY-MM-DD)
+            recurrence: Normalized recurrence rule, or None
+            
+        Returns:
+            (previous, updated) event data, or None if not found
+        """
+        event = Storage._new_event(name, target_date, recurrence)
+        with self._lock:
+            with self._write():
+                row = self._conn.execute(
+                    f"SELECT {COLUMNS} FROM events WHERE name = ?", (name,)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE events SET target_date = ?, target_ordinal = ?, status = ?, "
+                        "recurrence = ?, start_date = ?, updated_at = CURRENT_TIMESTAMP WHERE name = ?",
+                        (
+                            event["target_date"], event["target_ordinal"], event["status"],
+                            event.get("recurrence"), event.get("start_date"), name,
+                        ),
+                    )
+            if row is None:
+                return None
+            return _event(row), self._query(f"SELECT {COLUMNS} FROM events WHERE name = ?", (name,))[0]
+
+    def get_events_by_status(self, status: str, today: Optional[int] = None) -> List[Dict]:
+        """
+        Get events with the given status using the target_date index.
+        
+        Args:
+            status: Status to filter (ACTIVE/CURRENT/EXPIRED)
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            List of matching events with remaining_days calculated
+        """
+        if status not in STATUS_RANGES:
+            return []
+        
+        today = date.today() if today is None else date.fromordinal(today)
+        events = self._query(
+            f"SELECT {COLUMNS} FROM events WHERE {STATUS_RANGES[status]} "
+            "ORDER BY target_date, name",
+            (today.isoformat(),),
+        )
+        return Storage._with_countdowns(events, today.toordinal())
+
+    def count_events(self, status: Optional[str] = None, today: Optional[int] = None) -> int:
+        """
+        Count events, optionally only those with the given status.
+        
+        Args:
+            status: Status to count (ACTIVE/CURRENT/EXPIRED), or None for all
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Number of matching events
+        """
+        with self._lock:
+            if status is None:
+                return self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+            if status not in STATUS_RANGES:
+                return 0
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM events WHERE {STATUS_RANGES[status]}",
+                (_iso(today, date.today().isoformat()),),
+            ).fetchone()[0]
+
+    def get_next_event(self, today: Optional[int] = None) -> Optional[Dict]:
+        """
+        Get the nearest event that has not expired yet (index range scan).
+        
+        Args:
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Event data with remaining_days, or None if there is none
+        """
+        upcoming = self.get_upcoming_events(limit=1, today=today)
+        return upcoming[0] if upcoming else None
+
+    def get_upcoming_events(self, limit: Optional[int] = None, today: Optional[int] = None) -> List[Dict]:
+        """
+        Get the next events from today on, nearest first.
+        
+        Args:
+            limit: Maximum number of events, or None for all
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            List of events with remaining_days calculated
+        """
+        return self.get_events_between(_iso(today, date.today().isoformat()), None, limit, today)
+
+    def get_events_between(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        today: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Get events whose target date lies in [start, end] (index range scan).
+        
+        Args:
+            start: First target date to include (YYYY-MM-DD), or None
+            end: Last target date to include (YYYY-MM-DD), or None
+            limit: Maximum number of events, or None for all
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            List of events with remaining_days calculated
+        """
+        events = self._query(
+            f"SELECT {COLUMNS} FROM events WHERE target_date >= ? AND target_date <= ? "
+            "ORDER BY target_date, name LIMIT ?",
+            (start or "0000-00-00", end or "9999-99-99", -1 if limit is None else limit),
+        )
+        return Storage._with_countdowns(events, today)
+
+    def search_events(self, query: str, limit: int = 50, today: Optional[int] = None) -> List[Dict]:
+        """
+        Find events whose name contains the query (case-insensitive).
+        
+        Names are served from an in-memory NameIndex that is rebuilt
+        only after another connection changed the table; only matching
+        rows are read.
+        
+        Args:
+            query: Text to look for in event names
+            limit: Maximum number of events
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Events whose name starts with the query, then other matches,
+            each group in name order, with remaining_days calculated
+        """
+        with self._lock:
+            if not self._search_current():
+                names = [row[0] for row in self._conn.execute("SELECT name FROM events")]
+                self._search_index = NameIndex(names)
+                self._search_version = self._version
+            names = self._search_index.search(query, limit)
+        
+        if not names:
+            return []
+        
+        rows = self._query(
+            f"SELECT {COLUMNS} FROM events WHERE name IN ({', '.join('?' * len(names))})",
+            tuple(names),
+        )
+        order = {name: i for i, name in enumerate(names)}
+        rows.sort(key=lambda row: order[row["name"]])
+        return Storage._with_countdowns(rows, today)
+
+    def _search_current(self) -> bool:
+        """Whether the search index matches the current storage version."""
+        return self._search_index is not None and self._search_version == self.version
+
+    def get_page(
+        self,
+        sort: str = "date",
+        after: Optional[Tuple[int, str]] = None,
+        limit: int = 50,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        today: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Get one page of events in sort order (keyset pagination).
+        
+        Each page is an index range scan continuing after the previous
+        page's last (target_date, name) key; see Storage.get_page() for
+        the sort orders.
+        
+        Args:
+            sort: date, name or remaining
+            after: (target_ordinal, name) of the previous page's last
+                   event, or None for the first page
+            limit: Maximum number of events
+            start: First target ordinal to include, or None for unbounded
+            end: Last target ordinal to include, or None for unbounded
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            List of events with remaining_days calculated
+            
+        Raises:
+            ValueError: If sort is not supported
+        """
+        if sort not in SORTS:
+            raise ValueError(f"Unsupported sort: {sort}. Expected one of {', '.join(SORTS)}")
+        
+        today = date.today() if today is None else date.fromordinal(today)
+        lower = _iso(start, "0000-00-00")
+        upper = _iso(end, "9999-99-99")
+        after_key = (_iso(after[0], ""), after[1]) if after is not None else None
+        
+        if sort == "name":
+            events = self._query(
+                f"SELECT {COLUMNS} FROM events WHERE name > ? "
+                "AND target_date >= ? AND target_date <= ? ORDER BY name LIMIT ?",
+                (after[1] if after is not None else "", lower, upper, limit),
+            )
+        elif sort == "date":
+            events = self._query(
+                f"SELECT {COLUMNS} FROM events WHERE (target_date, name) > (?, ?) "
+                "AND target_date >= ? AND target_date <= ? ORDER BY target_date, name LIMIT ?",
+                (*(after_key or ("", "")), lower, upper, limit),
+            )
+        else:
+            # remaining: ascending from today, then the expired part descending
+            events = []
+            descend_before = ("9999-99-99", "")
+            if after is None or after[0] >= today.toordinal():
+                events = self._query(
+                    f"SELECT {COLUMNS} FROM events WHERE (target_date, name) > (?, ?) "
+                    "AND target_date >= ? AND target_date <= ? ORDER BY target_date, name LIMIT ?",
+                    (*(after_key or ("", "")), max(lower, today.isoformat()), upper, limit),
+                )
+            else:
+                descend_before = after_key
+            
+            if len(events) < limit:
+                events += self._query(
+                    f"SELECT {COLUMNS} FROM events WHERE (target_date, name) < (?, ?) "
+                    "AND target_date < ? AND target_date >= ? AND target_date <= ? "
+                    "ORDER BY target_date DESC, name DESC LIMIT ?",
+                    (*descend_before, today.isoformat(), lower, upper, limit - len(events)),
+                )
+        
+        return Storage._with_countdowns(events, today.toordinal())
+
+    def count_between(self, start: Optional[int], end: Optional[int]) -> int:
+        """
+        Count events whose target ordinal lies in [start, end].
+        
+        Args:
+            start: First ordinal to include, or None for unbounded
+            end: Last ordinal to include, or None for unbounded
+            
+        Returns:
+            Number of events in the range
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM events WHERE target_date >= ? AND target_date <= ?",
+                (_iso(start, "0000-00-00"), _iso(end, "9999-99-99")),
+            ).fetchone()[0]
+
+    def roll_statuses(self, today: int, since: Optional[int] = None) -> List[Dict]:
+        """
+        Persist the status changes caused by the day moving to today.
+        
+        Only rows dated between since and today are examined (a
+        target_date index range) and they are updated with a single
+        UPDATE statement. Recurring events whose occurrence has passed
+        move on to their next occurrence instead (one UPDATE per moved
+        row, in the same transaction) and their change also carries
+        "old_target_date". today is recorded as rolled_day in the same
+        transaction.
+        
+        Args:
+            today: Today's ordinal
+            since: Ordinal of the day statuses were last rolled to, or None
+                   to check every event dated up to today
+                   
+        Returns:
+            Changed events as {"name", "target_date", "old_status", "status"}
+        """
+        params = {
+            "today": date.fromordinal(today).isoformat(),
+            "lo": _iso(None if since is None else min(since, today), "0000-00-00"),
+            "hi": _iso(today if since is None else max(since, today), "9999-99-99"),
+        }
+        where = f"target_date >= :lo AND target_date <= :hi AND status IS NOT {STATUS_CASE}"
+        
+        with self._lock:
+            moves = []
+            changes = {}
+            recurring = self._conn.execute(
+                "SELECT name, target_date, status, recurrence, start_date FROM events "
+                "WHERE target_date >= :lo AND target_date < :today AND recurrence IS NOT NULL",
+                params,
+            ).fetchall()
+            for row in recurring:
+                start = date.fromisoformat(row["start_date"]).toordinal()
+                occurrence = next_occurrence(row["recurrence"], start, today)
+                if occurrence is None:
+                    continue
+                status = Storage._status_for_days(occurrence - today)
+                target_date = date.fromordinal(occurrence).isoformat()
+                moves.append((target_date, occurrence, status, row["name"]))
+                changes[row["name"]] = {
+                    "name": row["name"],
+                    "target_date": target_date,
+                    "old_status": row["status"],
+                    "status": status,
+                    "old_target_date": row["target_date"],
+                }
+            
+            rows = self._conn.execute(
+                f"SELECT name, target_date, status AS old_status, {STATUS_CASE} AS status "
+                f"FROM events WHERE {where} ORDER BY target_date, name",
+                params,
+            ).fetchall()
+            for row in rows:
+                changes.setdefault(row["name"], dict(row))
+            
+            if changes:
+                with self._write():
+                    # Moved rows get their new status here and no longer match `where`
+                    self._conn.executemany(
+                        "UPDATE events SET target_date = ?, target_ordinal = ?, status = ?, "
+                        "updated_at = CURRENT_TIMESTAMP WHERE name = ?",
+                        moves,
+                    )
+                    self._conn.execute(
+                        f"UPDATE events SET status = {STATUS_CASE}, "
+                        f"updated_at = CURRENT_TIMESTAMP WHERE {where}",
+                        params,
+                    )
+                    self._save_rolled_day(today)
+            else:
+                # Not a change to the events: version and revision stay put
+                with self._conn:
+                    self._save_rolled_day(today)
+        return sorted(
+            changes.values(),
+            key=lambda change: (change.get("old_target_date", change["target_date"]), change["name"]),
+        )
+
+    def clear_all(self) -> None:
+        """Delete all events."""
+        with self._write():
+            self._conn.execute("DELETE FROM events")
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Dict]:
+        """
+        Run a SELECT and convert rows to event dictionaries.
+        
+        Args:
+            sql: Parameterized SQL statement
+            params: Statement parameters
+            
+        Returns:
+            List of event dictionaries
+        """
+        with self._lock:
+            return [_event(row) for row in self._conn.execute(sql, params)]
+
+
+def _event(row: sqlite3.Row) -> Dict:
+    """Convert a row to an event dictionary, decoding its reminder rules."""
+    event = dict(row)
+    if event.get("reminders"):
+        event["reminders"] = json.loads(event["reminders"])
+    return event
+
+
+def _reminders_json(event: Dict) -> Optional[str]:
+    """Encode an event's reminder rules for the reminders column (NULL if none)."""
+    return json.dumps(event["reminders"]) if event.get("reminders") else None
+
+
+def _iso(ordinal: Optional[int], default: str) -> str:
+    """
+    Convert a day ordinal to an ISO date for comparing with target_date.
+    
+    Args:
+        ordinal: Day ordinal, or None
+        default: Value to use for None
+        
+    Returns:
+        YYYY-MM-DD string, or default
+    """
+    return default if ordinal is None else date.fromordinal(ordinal).isoformat()
@@ -1,28 +1,149 @@
 """Storage module - Event data persistence (P1: JSON)."""
 
+import functools
 import json
 import os
+import threading
+from bisect import bisect_left, bisect_right, insort
+from contextlib import ExitStack, contextmanager
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
+
+from .recurrence import next_occurrence
+from .search import NameIndex
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to msvcrt byte-range locks
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+
+# Listings at least this large compute countdowns with NumPy (if installed)
+VECTORIZE_THRESHOLD = 4096
+
+# Sort orders supported by get_page()
+SORTS = ("date", "name", "remaining")
+
+
+@functools.lru_cache(maxsize=None)
+def _numpy():
+    """
+    NumPy if it is installed, imported on first use.
+    
+    Importing NumPy takes longer than a whole CLI command, so it is
+    only loaded once a listing is large enough to be vectorized.
+    """
+    try:
+        import numpy
+    except ImportError:  # Optional: batch countdowns fall back to plain Python
+        return None
+    return numpy
+
+
+def default_storage_dir() -> str:
+    """
+    Get the default data directory.
+    
+    Returns:
+        $COUNTDOWN_HOME if set, otherwise ~/.countdown
+    """
+    return os.environ.get("COUNTDOWN_HOME") or os.path.expanduser("~/.countdown")
+
+
+class StorageError(RuntimeError):
+    """Raised when stored event data cannot be read."""
+
+
+def synchronized(method):
+    """
+    Run a Storage method while holding the instance's thread lock.
+    
+    Readers walk the shared in-memory index and sorted indexes, so in a
+    multi-threaded server they must not overlap a writer (writers hold
+    the same lock through _locked()).
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._thread_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+@contextmanager
+def file_lock(path) -> Iterator[None]:
+    """
+    Hold an exclusive advisory lock on a file, creating it if missing.
+    
+    Uses flock() on POSIX and msvcrt.locking() on Windows. The lock is
+    only honoured by processes that take it too.
+    
+    Args:
+        path: Path of the lock file
+    """
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
 
 
 class Storage:
-    """Manages event data storage (JSON for P1)."""
+    """
+    Manages event data storage (JSON for P1).
+    
+    Several processes (API workers, the CLI) may share one storage
+    directory. Writers serialize on an advisory lock on events.lock and
+    replace events.json atomically, so readers never need the lock and
+    always see a complete file.
+    
+    Within a process, one instance may be shared by several threads:
+    public methods serialize on a per-instance thread lock.
+    """
 
-    def __init__(self, storage_dir: Optional[str] = None):
+    def __init__(self, storage_dir: Optional[str] = None, cache: bool = False):
         """
         Initialize storage.
         
         Args:
             storage_dir: Directory for storing events.json. 
-                        Defaults to ~/.countdown
+                        Defaults to $COUNTDOWN_HOME or ~/.countdown
+            cache: Keep a name-keyed index in memory and only re-read
+                   events.json when its mtime/size/inode changes
         """
         if storage_dir is None:
-            storage_dir = os.path.expanduser("~/.countdown")
+            storage_dir = default_storage_dir()
         
         self.storage_dir = Path(storage_dir)
         self.events_file = self.storage_dir / "events.json"
+        self.lock_file = self.storage_dir / "events.lock"
+        # Day statuses were last rolled to (see roll_statuses())
+        self.rollover_file = self.storage_dir / "rollover"
+        self.cache = cache
+        self._index: Optional[Dict] = None
+        self._fingerprint: Optional[Tuple[int, int, int]] = None
+        self._date_index: Optional[List[Tuple[int, str]]] = None
+        self._name_index: Optional[List[str]] = None
+        self._search_index: Optional[NameIndex] = None
+        self._version = 0
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+        self._lock_stack: Optional[ExitStack] = None
         self._ensure_storage_dir()
 
     def _ensure_storage_dir(self) -> None:
@@ -37,26 +158,241 @@ class Storage:
             Dictionary of events {name: event_data}
             
         Returns empty dict if file doesn't exist.
-        """
-        if not self.events_file.exists():
-            return {}
         
-        with open(self.events_file, "r") as f:
-            try:
+        Raises:
+            StorageError: If events.json exists but is not valid JSON.
+                          Returning {} here would let the next save wipe
+                          the data.
+        """
+        try:
+            with open(self.events_file, "r") as f:
                 return json.load(f)
-            except json.JSONDecodeError:
-                return {}
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            raise StorageError(f"Corrupt events file {self.events_file}: {e}") from e
 
     def save_events(self, events: Dict) -> None:
         """
         Save events to storage (NFR-006: persistence).
         
+        The file is replaced atomically under the write lock, and its
+        fingerprint is taken under the same lock so it cannot belong to
+        another process's later write.
+        
         Args:
             events: Dictionary of events to save
         """
-        with open(self.events_file, "w") as f:
-            json.dump(events, f, indent=2)
+        try:
+            with self._locked():
+                self._write_atomic(events, indent=2)
+                self._version += 1
+                self._fingerprint = self._file_fingerprint()
+                if self.cache:
+                    if events is not self._index:
+                        self._drop_indexes()
+                    self._index = events
+        except BaseException:
+            self._index = None
+            raise
+
+    @contextmanager
+    def transaction(self) -> Iterator[Dict]:
+        """
+        Read-modify-write the events under the cross-process write lock.
+        
+        Yields a copy of the current events; it is saved back when the
+        block exits normally and discarded if it raises. Other writers
+        wait until the block is done.
+        
+        Example:
+            with storage.transaction() as events:
+                events.pop("生日", None)
+                
+        Yields:
+            Dictionary of events {name: event_data}
+        """
+        with self._locked():
+            events = {name: dict(e) for name, e in self._events().items()}
+            yield events
+            self.save_events(events)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """
+        Hold the write lock (reentrant within this instance).
+        
+        The outermost holder takes the thread lock and the file lock on
+        events.lock; nested calls only count depth.
+        """
+        with self._thread_lock:
+            if self._lock_depth == 0:
+                stack = ExitStack()
+                stack.enter_context(file_lock(self.lock_file))
+                self._lock_stack = stack
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    self._lock_stack.close()
+                    self._lock_stack = None
+
+    def _write_atomic(self, events: Dict, **dump_options) -> None:
+        """
+        Write events.json via a temporary file, fsync and os.replace().
+        
+        Args:
+            events: Dictionary of events to write
+            **dump_options: Formatting options for json.dump()
+        """
+        tmp_file = self.events_file.with_name(f".{self.events_file.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump(events, f, **dump_options)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.events_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    @property
+    @synchronized
+    def version(self) -> int:
+        """
+        Change counter of the stored events.
+        
+        Bumped by every mutation made through this instance and whenever
+        events.json is found changed by someone else. Checking it only
+        stats the file.
+        
+        Returns:
+            Current version number
+        """
+        self._check_fingerprint()
+        return self._version
+
+    @property
+    @synchronized
+    def revision(self) -> str:
+        """
+        Identify the stored events across processes and restarts.
+        
+        Unlike version, which counts changes seen by this instance, the
+        revision is derived from events.json itself (inode, size, mtime),
+        so every process reading the same file gets the same value.
+        
+        Returns:
+            Opaque revision string ("0" if there is no file yet)
+        """
+        fingerprint = self._file_fingerprint()
+        if fingerprint is None:
+            return "0"
+        return "-".join(f"{part:x}" for part in fingerprint)
+
+    def _check_fingerprint(self) -> None:
+        """Detect external changes to events.json and drop the cached index."""
+        fingerprint = self._file_fingerprint()
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            self._version += 1
+            self._index = None
+
+    def _file_fingerprint(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Identify the current version of events.json on disk.
+        
+        Returns:
+            (inode, size, mtime_ns) tuple, or None if the file is missing
+        """
+        try:
+            st = os.stat(self.events_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _events(self) -> Dict:
+        """
+        Get the current events dictionary.
+        
+        In cache mode this is the in-memory index, reloaded only when
+        events.json was changed by someone else. Callers must not mutate
+        it without saving it back through save_events().
+        
+        Returns:
+            Dictionary of events {name: event_data}
+        """
+        # Stat before reading: a concurrent write makes the next call reload again
+        self._check_fingerprint()
+        if not self.cache:
+            return self.load_events()
+        
+        if self._index is None:
+            self._index = self.load_events()
+            self._drop_indexes()
+        
+        return self._index
+
+    def _indexed(self) -> Tuple[Dict, List[Tuple[int, str]]]:
+        """
+        Get the events together with their date-sorted index.
+        
+        The index is a sorted list of (target_ordinal, name) pairs. In
+        cache mode it is built once per reload and then kept up to date
+        by add_event/delete_event.
+        
+        Returns:
+            (events dictionary, date index)
+        """
+        events = self._events()
+        if self._date_index is None or not self.cache:
+            self._date_index = sorted(
+                (self._target_ordinal(e), name) for name, e in events.items()
+            )
+        return events, self._date_index
+
+    def _sorted_names(self, events: Dict) -> List[str]:
+        """
+        Get the event names in sorted order.
+        
+        Like the date index, it is kept up to date by add/delete in
+        cache mode and rebuilt on every call otherwise.
+        
+        Args:
+            events: Current events dictionary (from _events())
+            
+        Returns:
+            Sorted list of names
+        """
+        if self._name_index is None or not self.cache:
+            self._name_index = sorted(events)
+        return self._name_index
+
+    def _drop_indexes(self) -> None:
+        """Forget the sorted indexes after the events were replaced."""
+        self._date_index = None
+        self._name_index = None
+        self._search_index = None
+
+    def _date_range(self, start: Optional[int], end: Optional[int]) -> Tuple[Dict, List, int, int]:
+        """
+        Locate an inclusive target ordinal range in the date index.
+        
+        Args:
+            start: First ordinal to include, or None for unbounded
+            end: Last ordinal to include, or None for unbounded
+            
+        Returns:
+            (events dictionary, date index, start position, end position)
+        """
+        events, index = self._indexed()
+        lo = 0 if start is None else bisect_left(index, (start,))
+        hi = len(index) if end is None else bisect_left(index, (end + 1,))
+        return events, index, lo, max(lo, hi)
 
+    @synchronized
     def event_exists(self, name: str) -> bool:
         """
         Check if event with given name exists (FR-008a: reject duplicates).
@@ -67,16 +403,16 @@ class Storage:
         Returns:
             True if event exists, False otherwise
         """
-        events = self.load_events()
-        return name in events
+        return name in self._events()
 
-    def add_event(self, name: str, target_date: str) -> Dict:
+    def add_event(self, name: str, target_date: str, recurrence: Optional[str] = None) -> Dict:
         """
         Add new event to storage (FR-001: create event).
         
         Args:
             name: Event name (unique)
             target_date: Target date (YYYY-MM-DD)
+            recurrence: Normalized recurrence rule, or None
             
         Returns:
             Created event data
@@ -84,59 +420,105 @@ class Storage:
         Raises:
             ValueError: If event already exists
         """
-        if self.event_exists(name):
+        created = self.add_events([(name, target_date, recurrence)])[0]
+        if created is None:
             raise ValueError(f"Event '{name}' already exists")
+        return created
+
+    def add_events(self, items: Iterable[Tuple]) -> List[Optional[Dict]]:
+        """
+        Add many events with a single write.
         
-        events = self.load_events()
-        event_data = {
-            "name": name,
-            "target_date": target_date,
-            "created_at": datetime.now().isoformat(),
-            "status": self._calculate_status(target_date),
-        }
-        
-        events[name] = event_data
-        self.save_events(events)
+        Args:
+            items: (name, target_date) pairs or
+                   (name, target_date, recurrence) triples
+                   
+        Returns:
+            Created event data per item, in order; None for names that
+            already exist (in storage or earlier in the batch)
+        """
+        with self._locked():
+            # Re-read under the lock so another writer's events are kept
+            events = self._events()
+            results: List[Optional[Dict]] = []
+            batch: Dict[str, Dict] = {}
+            for name, target_date, *recurrence in items:
+                if name in events or name in batch:
+                    results.append(None)
+                    continue
+                batch[name] = self._new_event(name, target_date, *recurrence)
+                results.append(batch[name])
+            
+            if batch:
+                self._write_events(events, list(batch.values()))
+                if self.cache and self._date_index is not None:
+                    self._index_insert(self._date_index, [(e["target_ordinal"], n) for n, e in batch.items()])
+                if self.cache and self._name_index is not None:
+                    self._index_insert(self._name_index, list(batch))
+                if self.cache and self._search_index is not None:
+                    for name in batch:
+                        self._search_index.add(name)
         
-        return event_data
+        return [None if e is None else e.copy() for e in results]
 
-    def get_event(self, name: str) -> Optional[Dict]:
+    @synchronized
+    def get_event(self, name: str, today: Optional[int] = None) -> Optional[Dict]:
         """
         Get single event (FR-003: query event).
         
         Args:
             name: Event name
+            today: Today's ordinal. Defaults to date.today()
             
         Returns:
             Event data with remaining_days, or None if not found
         """
-        events = self.load_events()
+        events = self._events()
         if name not in events:
             return None
         
-        event = events[name]
-        event["remaining_days"] = self._calculate_remaining_days(event["target_date"])
-        event["status"] = self._calculate_status(event["target_date"])
-        
-        return event
+        return self._with_countdowns([events[name].copy()], today)[0]
 
-    def get_all_events(self) -> List[Dict]:
+    @synchronized
+    def get_all_events(self, today: Optional[int] = None) -> List[Dict]:
         """
         Get all events (FR-003: query all events).
         
+        Args:
+            today: Today's ordinal. Defaults to date.today()
+            
         Returns:
             List of all events with remaining_days calculated
         """
-        events = self.load_events()
-        result = []
+        events = self._events()
+        return self._with_countdowns([e.copy() for e in events.values()], today)
+
+    def iter_events(self, chunk_size: int = 1000, today: Optional[int] = None) -> Iterator[List[Dict]]:
+        """
+        Iterate over all events in chunks, in insertion order.
         
-        for name, event_data in events.items():
-            event = event_data.copy()
-            event["remaining_days"] = self._calculate_remaining_days(event["target_date"])
-            event["status"] = self._calculate_status(event["target_date"])
-            result.append(event)
+        Copies and countdowns are made one chunk at a time, so a caller
+        streaming events out holds at most one chunk of them. Events
+        deleted while iterating are skipped.
         
-        return result
+        Args:
+            chunk_size: Maximum number of events per chunk
+            today: Today's ordinal. Defaults to date.today()
+            
+        Yields:
+            Lists of events with remaining_days calculated
+        """
+        with self._thread_lock:
+            events = self._events()
+            names = list(events)
+        if today is None:
+            today = date.today().toordinal()
+        for start in range(0, len(names), chunk_size):
+            # Lock per chunk only: never hold it while the caller has control
+            with self._thread_lock:
+                chunk = [events[n].copy() for n in names[start:start + chunk_size] if n in events]
+            if chunk:
+                yield self._with_countdowns(chunk, today)
 
     def delete_event(self, name: str) -> bool:
         """
@@ -148,15 +530,641 @@ class Storage:
         Returns:
             True if deleted, False if not found
         """
-        events = self.load_events()
-        if name not in events:
-            return False
+        return self.delete_events([name])[0] is not None
+
+    def delete_events(self, names: Iterable[str]) -> List[Optional[Dict]]:
+        """
+        Delete many events with a single write.
+        
+        Args:
+            names: Names of the events to delete
+            
+        Returns:
+            Deleted event data per name, in order; None if not found
+        """
+        with self._locked():
+            events = self._events()
+            results: List[Optional[Dict]] = []
+            removed: Dict[str, Dict] = {}
+            for name in names:
+                event = events.get(name) if name not in removed else None
+                if event is not None:
+                    removed[name] = event
+                results.append(event)
+            
+            if removed:
+                keys = [(self._target_ordinal(e), n) for n, e in removed.items()]
+                self._remove_events(events, list(removed))
+                if self.cache and self._date_index is not None:
+                    self._index_remove(self._date_index, keys)
+                if self.cache and self._name_index is not None:
+                    self._index_remove(self._name_index, list(removed))
+                if self.cache and self._search_index is not None:
+                    for name in removed:
+                        self._search_index.remove(name)
+        
+        return [None if e is None else e.copy() for e in results]
+
+    def set_reminders(self, name: str, reminders: List[Dict]) -> Optional[Dict]:
+        """
+        Replace the reminder rules stored with an event (FR-013).
+        
+        Args:
+            name: Event name
+            reminders: Rules as {"days_before", "notification_type"};
+                       empty to remove all reminders
+                       
+        Returns:
+            Updated event data, or None if not found
+        """
+        with self._locked():
+            events = self._events()
+            if name not in events:
+                return None
+            
+            updated = {k: v for k, v in events[name].items() if k != "reminders"}
+            if reminders:
+                updated["reminders"] = [dict(rule) for rule in reminders]
+            # Same name and date, so the indexes stay valid
+            self._write_events(events, [updated])
+        
+        return dict(updated)
+
+    def update_event(
+        self, name: str, target_date: str, recurrence: Optional[str] = None
+    ) -> Optional[Tuple[Dict, Dict]]:
+        """
+        Move an event to a new date with a single write.
+        
+        Date, status, recurrence and start_date are rebuilt as for a new
+        event; created_at and the reminder rules are kept.
+        
+        Args:
+            name: Event name
+            target_date: New target date (YYYY-MM-DD)
+            recurrence: Normalized recurrence rule, or None
+            
+        Returns:
+            (previous, updated) event data, or None if not found
+        """
+        with self._locked():
+            events = self._events()
+            previous = events.get(name)
+            if previous is None:
+                return None
+            
+            updated = self._new_event(name, target_date, recurrence)
+            updated["created_at"] = previous.get("created_at", updated["created_at"])
+            if previous.get("reminders"):
+                updated["reminders"] = [dict(rule) for rule in previous["reminders"]]
+            old_key = (self._target_ordinal(previous), name)
+            self._write_events(events, [updated])
+            # Same name; only the date key can change
+            if self.cache and self._date_index is not None and old_key[0] != updated["target_ordinal"]:
+                self._index_remove(self._date_index, [old_key])
+                self._index_insert(self._date_index, [(updated["target_ordinal"], name)])
+        
+        return dict(previous), dict(updated)
+
+    @synchronized
+    def get_events_by_status(self, status: str, today: Optional[int] = None) -> List[Dict]:
+        """
+        Get events with the given status (FR-008b).
+        
+        Args:
+            status: Status to filter (ACTIVE/CURRENT/EXPIRED)
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            List of matching events with remaining_days calculated
+        """
+        if today is None:
+            today = date.today().toordinal()
+        if status not in ("ACTIVE", "CURRENT", "EXPIRED"):
+            return []
+        
+        events, index, lo, hi = self._date_range(*self._status_range(status, today))
+        return self._with_countdowns([events[name].copy() for _, name in index[lo:hi]], today)
+
+    @synchronized
+    def count_events(self, status: Optional[str] = None, today: Optional[int] = None) -> int:
+        """
+        Count events, optionally only those with the given status.
         
-        del events[name]
+        Args:
+            status: Status to count (ACTIVE/CURRENT/EXPIRED), or None for all
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Number of matching events
+        """
+        if status is None:
+            return len(self._events())
+        if status not in ("ACTIVE", "CURRENT", "EXPIRED"):
+            return 0
+        if today is None:
+            today = date.today().toordinal()
+        
+        _, _, lo, hi = self._date_range(*self._status_range(status, today))
+        return hi - lo
+
+    def get_next_event(self, today: Optional[int] = None) -> Optional[Dict]:
+        """
+        Get the nearest event that has not expired yet.
+        
+        Args:
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Event data with remaining_days, or None if there is none
+        """
+        upcoming = self.get_upcoming_events(limit=1, today=today)
+        return upcoming[0] if upcoming else None
+
+    def get_upcoming_events(self, limit: Optional[int] = None, today: Optional[int] = None) -> List[Dict]:
+        """
+        Get the next events from today on, nearest first.
+        
+        Args:
+            limit: Maximum number of events, or None for all
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            List of events with remaining_days calculated
+        """
+        if today is None:
+            today = date.today().toordinal()
+        return self.get_events_between(date.fromordinal(today).isoformat(), None, limit, today)
+
+    @synchronized
+    def get_events_between(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        today: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Get events whose target date lies in [start, end], by date.
+        
+        Args:
+            start: First target date to include (YYYY-MM-DD), or None
+            end: Last target date to include (YYYY-MM-DD), or None
+            limit: Maximum number of events, or None for all
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            List of events with remaining_days calculated
+        """
+        events, index, lo, hi = self._date_range(
+            None if start is None else date.fromisoformat(start).toordinal(),
+            None if end is None else date.fromisoformat(end).toordinal(),
+        )
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        return self._with_countdowns([events[name].copy() for _, name in index[lo:hi]], today)
+
+    @synchronized
+    def search_events(self, query: str, limit: int = 50, today: Optional[int] = None) -> List[Dict]:
+        """
+        Find events whose name contains the query (case-insensitive).
+        
+        Served by a NameIndex (sorted names for prefixes, n-grams for
+        substrings) that cache mode keeps up to date, so a search does
+        not scan all events.
+        
+        Args:
+            query: Text to look for in event names
+            limit: Maximum number of events
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            Events whose name starts with the query, then other matches,
+            each group in name order, with remaining_days calculated
+        """
+        events = self._events()
+        if self._search_index is None or not self.cache:
+            self._search_index = NameIndex(events)
+        names = self._search_index.search(query, limit)
+        return self._with_countdowns([events[name].copy() for name in names], today)
+
+    @synchronized
+    def get_page(
+        self,
+        sort: str = "date",
+        after: Optional[Tuple[int, str]] = None,
+        limit: int = 50,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        today: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        Get one page of events in sort order (keyset pagination).
+        
+        Pages are sliced straight out of the sorted indexes; only the
+        events on the page are copied.
+        
+        Sort orders:
+        - date: target date, then name
+        - name: name
+        - remaining: today's and upcoming events soonest first, then
+          expired events most recently expired first
+          
+        Args:
+            sort: date, name or remaining
+            after: (target_ordinal, name) of the previous page's last
+                   event, or None for the first page
+            limit: Maximum number of events
+            start: First target ordinal to include, or None for unbounded
+            end: Last target ordinal to include, or None for unbounded
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            List of events with remaining_days calculated
+            
+        Raises:
+            ValueError: If sort is not supported
+        """
+        if sort not in SORTS:
+            raise ValueError(f"Unsupported sort: {sort}. Expected one of {', '.join(SORTS)}")
+        
+        if today is None:
+            today = date.today().toordinal()
+        if sort == "name":
+            events = self._events()
+            names = self._sorted_names(events)
+            position = 0 if after is None else bisect_right(names, after[1])
+            page = []
+            while position < len(names) and len(page) < limit:
+                name = names[position]
+                position += 1
+                ordinal = self._target_ordinal(events[name])
+                if (start is None or ordinal >= start) and (end is None or ordinal <= end):
+                    page.append(name)
+        else:
+            events, index, lo, hi = self._date_range(start, end)
+            page = [name for _, name in self._page_keys(sort, index, lo, hi, after, limit, today)]
+        
+        return self._with_countdowns([events[name].copy() for name in page], today)
+
+    @staticmethod
+    def _page_keys(
+        sort: str,
+        index: List[Tuple[int, str]],
+        lo: int,
+        hi: int,
+        after: Optional[Tuple[int, str]],
+        limit: int,
+        today: int,
+    ) -> List[Tuple[int, str]]:
+        """
+        Slice one page of keys out of the date index.
+        
+        Args:
+            sort: date or remaining
+            index: Date index
+            lo: First position of the filtered range
+            hi: End position of the filtered range
+            after: Last key of the previous page, or None
+            limit: Maximum number of keys
+            today: Today's ordinal
+            
+        Returns:
+            (target_ordinal, name) keys in page order
+        """
+        if sort == "date":
+            position = lo if after is None else max(lo, bisect_right(index, after))
+            return index[position:min(hi, position + limit)]
+        
+        # remaining: ascending from today, then the expired part descending
+        split = max(lo, min(hi, bisect_left(index, (today,))))
+        if after is None or after[0] >= today:
+            position = split if after is None else max(split, bisect_right(index, after))
+            keys = index[position:min(hi, position + limit)]
+            descend_from = split
+        else:
+            keys = []
+            descend_from = min(split, bisect_left(index, after))
+        
+        left = limit - len(keys)
+        if left > 0:
+            keys += index[max(lo, descend_from - left):descend_from][::-1]
+        return keys
+
+    @synchronized
+    def count_between(self, start: Optional[int], end: Optional[int]) -> int:
+        """
+        Count events whose target ordinal lies in [start, end].
+        
+        Args:
+            start: First ordinal to include, or None for unbounded
+            end: Last ordinal to include, or None for unbounded
+            
+        Returns:
+            Number of events in the range
+        """
+        _, _, lo, hi = self._date_range(start, end)
+        return hi - lo
+
+    def roll_statuses(self, today: int, since: Optional[int] = None) -> List[Dict]:
+        """
+        Persist the status changes caused by the day moving to today.
+        
+        Only events dated between since and today can change status, so
+        only that slice of the date index is examined; all changed events
+        are written back in one batch.
+        
+        Args:
+            today: Today's ordinal
+            since: Ordinal of the day statuses were last rolled to, or None
+                   to check every event dated up to today
+                   
+        Recurring events whose occurrence has passed move on to their
+        next occurrence instead of expiring; their change also carries
+        "old_target_date". today is recorded as rolled_day under the
+        same lock.
+        
+        Returns:
+            Changed events as {"name", "target_date", "old_status", "status"}
+        """
+        lo = None if since is None else min(since, today)
+        hi = today if since is None else max(since, today)
+        
+        with self._locked():
+            events, index, start, end = self._date_range(lo, hi)
+            batch = []
+            changes = []
+            moved = []
+            for ordinal, name in index[start:end]:
+                event = events[name]
+                updated = dict(event)
+                if ordinal < today and event.get("recurrence") and self._advance(updated, today):
+                    moved.append(((ordinal, name), (updated["target_ordinal"], name)))
+                
+                status = self._status_for_days(updated["target_ordinal"] - today)
+                if event.get("status") != status or updated["target_ordinal"] != ordinal:
+                    batch.append({**updated, "status": status})
+                    change = {
+                        "name": name,
+                        "target_date": updated["target_date"],
+                        "old_status": event.get("status"),
+                        "status": status,
+                    }
+                    if updated["target_ordinal"] != ordinal:
+                        change["old_target_date"] = event["target_date"]
+                    changes.append(change)
+            
+            if batch:
+                self._write_events(events, batch)
+            # Same names; only moved recurring events change their date key
+            if moved and self.cache and self._date_index is not None:
+                self._index_remove(self._date_index, [old for old, _ in moved])
+                self._index_insert(self._date_index, [new for _, new in moved])
+            self._save_rolled_day(today)
+        
+        return changes
+
+    @property
+    def rolled_day(self) -> Optional[int]:
+        """
+        Day statuses were last rolled to, by any process (see roll_statuses()).
+        
+        Returns:
+            Date ordinal, or None if statuses were never rolled
+        """
+        try:
+            return date.fromisoformat(self.rollover_file.read_text().strip()).toordinal()
+        except (OSError, ValueError):
+            return None
+
+    def _save_rolled_day(self, today: int) -> None:
+        """
+        Record the day statuses were rolled to (write lock held).
+        
+        Kept out of events.json, so it changes neither the version nor
+        the revision of the events.
+        
+        Args:
+            today: Today's ordinal
+        """
+        tmp_file = self.rollover_file.with_name(f".{self.rollover_file.name}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_text(date.fromordinal(today).isoformat())
+            os.replace(tmp_file, self.rollover_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    def clear_all(self) -> None:
+        """Delete all events."""
+        self.save_events({})
+
+    def _write_events(self, events: Dict, batch: List[Dict]) -> None:
+        """
+        Persist new or replaced events with one write.
+        
+        Subclasses with a different on-disk layout override this and
+        _remove_events() instead of the public methods.
+        
+        Args:
+            events: Current events dictionary (from _events())
+            batch: Events to store under their names
+        """
+        for event_data in batch:
+            events[event_data["name"]] = event_data
         self.save_events(events)
+
+    def _remove_events(self, events: Dict, names: List[str]) -> None:
+        """
+        Persist removal of existing events with one write.
         
+        Args:
+            events: Current events dictionary (from _events())
+            names: Names of the events to remove
+        """
+        for name in names:
+            del events[name]
+        self.save_events(events)
+
+    @staticmethod
+    def _index_insert(index: List, keys: List) -> None:
+        """
+        Insert keys into a sorted index in place.
+        
+        Args:
+            index: Sorted list
+            keys: Keys to insert
+        """
+        if len(keys) == 1:
+            insort(index, keys[0])
+        else:
+            index.extend(keys)
+            index.sort()
+
+    @staticmethod
+    def _index_remove(index: List, keys: List) -> None:
+        """
+        Remove keys from a sorted index in place (missing keys are ignored).
+        
+        Args:
+            index: Sorted list
+            keys: Keys to remove
+        """
+        for key in keys:
+            position = bisect_left(index, key)
+            if position < len(index) and index[position] == key:
+                del index[position]
+
+    @classmethod
+    def _new_event(cls, name: str, target_date: str, recurrence: Optional[str] = None) -> Dict:
+        """
+        Build the stored data of a new event.
+        
+        A recurring event keeps its first date as start_date and is
+        stored at its next occurrence from today, so date-indexed
+        queries treat it like any other event.
+        
+        Args:
+            name: Event name
+            target_date: Target date (YYYY-MM-DD)
+            recurrence: Normalized recurrence rule, or None
+            
+        Returns:
+            Event dictionary
+        """
+        event = {
+            "name": name,
+            "target_date": target_date,
+            "target_ordinal": date.fromisoformat(target_date).toordinal(),
+            "created_at": datetime.now().isoformat(),
+        }
+        if recurrence is not None:
+            event["recurrence"] = recurrence
+            event["start_date"] = target_date
+            cls._advance(event, date.today().toordinal())
+        event["status"] = cls._calculate_status(event["target_date"])
+        return event
+
+    @staticmethod
+    def _advance(event: Dict, today: int) -> bool:
+        """
+        Move a recurring event to its next occurrence from today on.
+        
+        Args:
+            event: Event dictionary with recurrence and start_date
+            today: Today's ordinal
+            
+        Returns:
+            True if target_date changed, False if it is already the next
+            occurrence or the rule has ended
+        """
+        start = date.fromisoformat(event["start_date"]).toordinal()
+        occurrence = next_occurrence(event["recurrence"], start, today)
+        if occurrence is None or occurrence == event.get("target_ordinal"):
+            return False
+        event["target_date"] = date.fromordinal(occurrence).isoformat()
+        event["target_ordinal"] = occurrence
         return True
 
+    @staticmethod
+    def _target_ordinal(event: Dict) -> int:
+        """
+        Get the event's target date as a day ordinal.
+        
+        Events written before target_ordinal was stored get it computed
+        once and remembered in their dictionary.
+        
+        Args:
+            event: Event dictionary
+            
+        Returns:
+            date.toordinal() of the target date
+        """
+        ordinal = event.get("target_ordinal")
+        if ordinal is None:
+            ordinal = date.fromisoformat(event["target_date"]).toordinal()
+            event["target_ordinal"] = ordinal
+        return ordinal
+
+    @staticmethod
+    def _status_range(status: str, today: int) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Get the inclusive target ordinal range of a status.
+        
+        Args:
+            status: ACTIVE, CURRENT or EXPIRED
+            today: Today's ordinal
+            
+        Returns:
+            (start, end) ordinals, None meaning unbounded
+        """
+        return {
+            "ACTIVE": (today + 1, None),
+            "CURRENT": (today, today),
+            "EXPIRED": (None, today - 1),
+        }[status]
+
+    @staticmethod
+    def _status_for_days(days: int) -> str:
+        """
+        Map signed days until the target date to a status (FR-008b).
+        
+        Args:
+            days: Target ordinal minus today's ordinal
+            
+        Returns:
+            ACTIVE, CURRENT or EXPIRED
+        """
+        if days > 0:
+            return "ACTIVE"
+        elif days == 0:
+            return "CURRENT"
+        else:
+            return "EXPIRED"
+
+    @classmethod
+    def _with_countdowns(cls, events: List[Dict], today: Optional[int] = None) -> List[Dict]:
+        """
+        Fill in remaining_days and status for a batch of events.
+        
+        Today's ordinal is read once for the whole batch, and each event
+        costs one integer subtraction; large batches are vectorized.
+        Recurring events whose stored occurrence has passed show their
+        next occurrence (computed once per occurrence, see recurrence).
+        
+        Args:
+            events: Event dictionaries to update in place
+            today: Today's ordinal. Defaults to date.today()
+            
+        Returns:
+            The same list of events
+        """
+        if today is None:
+            today = date.today().toordinal()
+        
+        ordinals = [cls._target_ordinal(e) for e in events]
+        np = _numpy() if len(events) >= VECTORIZE_THRESHOLD else None
+        if np is not None:
+            days = np.fromiter(ordinals, dtype=np.int64, count=len(ordinals)) - today
+            remaining = np.maximum(days, 0).tolist()
+            signs = np.sign(days).tolist()
+        else:
+            days = [o - today for o in ordinals]
+            remaining = [d if d > 0 else 0 for d in days]
+            signs = [(d > 0) - (d < 0) for d in days]
+        
+        statuses = {1: "ACTIVE", 0: "CURRENT", -1: "EXPIRED"}
+        for event, left, sign in zip(events, remaining, signs):
+            if sign < 0 and event.get("recurrence") and cls._advance(event, today):
+                # Passed occurrence not rolled over yet (e.g. a zone ahead of the server)
+                days = event["target_ordinal"] - today
+                left, sign = max(days, 0), (days > 0) - (days < 0)
+            # FR-006: Never negative, display 0 for today onwards
+            event["remaining_days"] = left
+            event["status"] = statuses[sign]
+        
+        return events
+
     @staticmethod
     def _calculate_remaining_days(target_date_str: str) -> int:
         """
@@ -168,9 +1176,7 @@ class Storage:
         Returns:
             Remaining days (0 if today or past, not negative)
         """
-        today = date.today()
-        target = datetime.fromisoformat(target_date_str).date()
-        remaining = (target - today).days
+        remaining = date.fromisoformat(target_date_str).toordinal() - date.today().toordinal()
         
         # FR-006: Never return negative, display 0 for today onwards
         return max(0, remaining)
@@ -191,13 +1197,5 @@ class Storage:
         Returns:
             Event status
         """
-        today = date.today()
-        target = datetime.fromisoformat(target_date_str).date()
-        remaining = (target - today).days
-        
-        if remaining > 0:
-            return "ACTIVE"
-        elif remaining == 0:
-            return "CURRENT"
-        else:
-            return "EXPIRED"
+        remaining = date.fromisoformat(target_date_str).toordinal() - date.today().toordinal()
+        return Storage._status_for_days(remaining)
@@ -0,0 +1,226 @@
+"""Tenants module - Per-tenant sharded storage with an LRU of open stores."""
+
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Generic, Iterator, List, Optional, TypeVar
+
+from .event_manager import EventManager
+from .storage import Storage, default_storage_dir
+
+
+T = TypeVar("T")
+
+# Tenant IDs become directory names, so only allow a safe subset
+TENANT_ID_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]{0,63}")
+
+
+def validate_tenant_id(tenant_id: str) -> str:
+    """
+    Check that a tenant ID is safe to use as a directory name.
+    
+    Args:
+        tenant_id: Tenant ID (1-64 letters, digits, "_", "." or "-",
+                   starting with a letter or digit)
+                   
+    Returns:
+        The tenant ID
+        
+    Raises:
+        ValueError: If the tenant ID is invalid
+    """
+    if not isinstance(tenant_id, str) or not TENANT_ID_PATTERN.fullmatch(tenant_id):
+        raise ValueError(f"Invalid tenant ID: {tenant_id!r}")
+    return tenant_id
+
+
+def _open_manager(path: Path) -> EventManager:
+    """Open a tenant's events with the default JSON storage."""
+    return EventManager(Storage(storage_dir=str(path), cache=True))
+
+
+def _close_manager(manager: EventManager) -> None:
+    """Release a tenant's storage handles, if the backend holds any."""
+    close = getattr(manager.storage, "close", None)
+    if close is not None:
+        close()
+
+
+class TenantRegistry(Generic[T]):
+    """
+    Opens each tenant's store on demand, one directory per tenant.
+    
+    Every tenant's events live under <base_dir>/tenants/<tenant_id>/,
+    so one tenant's writes never take another tenant's lock or grow
+    another tenant's file. At most max_open stores stay open: opening
+    one more closes the least recently used store that no request is
+    currently using. Stores in use are never closed, so the bound is
+    exceeded while more than max_open tenants are busy at once.
+    
+    Example:
+        tenants = TenantRegistry()
+        with tenants.lease("alice") as manager:
+            manager.create_event("生日", "2026-03-15")
+    """
+
+    def __init__(
+        self,
+        base_dir: Optional[str] = None,
+        max_open: int = 64,
+        open_tenant: Callable[[Path], T] = _open_manager,
+        close_tenant: Optional[Callable[[T], None]] = _close_manager,
+    ):
+        """
+        Initialize registry.
+        
+        Args:
+            base_dir: Directory containing tenants/.
+                      Defaults to $COUNTDOWN_HOME or ~/.countdown
+            max_open: Maximum number of idle stores kept open
+            open_tenant: Builds a tenant's store from its directory.
+                         Defaults to an EventManager over cached JSON storage
+            close_tenant: Releases an evicted store, or None
+        """
+        self.base_dir = Path(base_dir or default_storage_dir())
+        self.max_open = max_open
+        self.open_tenant = open_tenant
+        self.close_tenant = close_tenant
+        self._lock = threading.Lock()
+        self._open: "OrderedDict[str, T]" = OrderedDict()
+        self._leases: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._open)
+
+    def __contains__(self, tenant_id: str) -> bool:
+        return tenant_id in self._open
+
+    def tenant_dir(self, tenant_id: str) -> Path:
+        """
+        Get the directory holding a tenant's events.
+        
+        Args:
+            tenant_id: Tenant ID
+            
+        Returns:
+            <base_dir>/tenants/<tenant_id>
+            
+        Raises:
+            ValueError: If the tenant ID is invalid
+        """
+        return self.base_dir / "tenants" / validate_tenant_id(tenant_id)
+
+    def acquire(self, tenant_id: str) -> T:
+        """
+        Get a tenant's store, opening it if needed, and mark it in use.
+        
+        Every acquire() must be paired with a release().
+        
+        Args:
+            tenant_id: Tenant ID
+            
+        Returns:
+            The tenant's store
+            
+        Raises:
+            ValueError: If the tenant ID is invalid
+        """
+        path = self.tenant_dir(tenant_id)
+        with self._lock:
+            store = self._open.get(tenant_id)
+            if store is not None:
+                self._open.move_to_end(tenant_id)
+                self._leases[tenant_id] = self._leases.get(tenant_id, 0) + 1
+                return store
+        
+        # Open outside the lock so a slow open never delays other tenants
+        opened = self.open_tenant(path)
+        with self._lock:
+            store = self._open.get(tenant_id)
+            if store is None:
+                store, opened = opened, None
+                self._open[tenant_id] = store
+            self._open.move_to_end(tenant_id)
+            self._leases[tenant_id] = self._leases.get(tenant_id, 0) + 1
+            evicted = self._evict()
+        
+        # Another thread opened the same tenant first
+        if opened is not None:
+            evicted.append(opened)
+        self._close(evicted)
+        return store
+
+    def release(self, tenant_id: str) -> None:
+        """
+        Mark one use of a tenant's store as finished.
+        
+        Args:
+            tenant_id: Tenant ID passed to acquire()
+        """
+        with self._lock:
+            leases = self._leases.get(tenant_id, 0) - 1
+            if leases > 0:
+                self._leases[tenant_id] = leases
+            else:
+                self._leases.pop(tenant_id, None)
+            evicted = self._evict()
+        
+        self._close(evicted)
+
+    @contextmanager
+    def lease(self, tenant_id: str) -> Iterator[T]:
+        """
+        Use a tenant's store for the duration of a block.
+        
+        Args:
+            tenant_id: Tenant ID
+            
+        Yields:
+            The tenant's store
+            
+        Raises:
+            ValueError: If the tenant ID is invalid
+        """
+        store = self.acquire(tenant_id)
+        try:
+            yield store
+        finally:
+            self.release(tenant_id)
+
+    def close(self) -> None:
+        """Close every open store that is not in use."""
+        with self._lock:
+            idle = [tenant_id for tenant_id in self._open if tenant_id not in self._leases]
+            evicted = [self._open.pop(tenant_id) for tenant_id in idle]
+        
+        self._close(evicted)
+
+    def _evict(self) -> List[T]:
+        """
+        Drop idle stores, least recently used first, down to max_open.
+        
+        Must be called with the registry lock held.
+        
+        Returns:
+            Stores to close once the lock is released
+        """
+        evicted: List[T] = []
+        excess = len(self._open) - self.max_open
+        if excess <= 0:
+            return evicted
+        
+        for tenant_id in list(self._open):
+            if excess == 0:
+                break
+            if tenant_id not in self._leases:
+                evicted.append(self._open.pop(tenant_id))
+                excess -= 1
+        return evicted
+
+    def _close(self, stores: List[T]) -> None:
+        """Close evicted stores (outside the registry lock)."""
+        if self.close_tenant is not None:
+            for store in stores:
+                self.close_tenant(store)
@@ -0,0 +1,263 @@
+"""Transfer module - Streaming NDJSON/CSV import and export."""
+
+import csv
+import io
+import json
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:  # Only for annotations: the CLI imports this module at startup
+    from .event_manager import EventManager
+
+
+FORMATS = ("ndjson", "csv")
+
+# Columns written by export; import only needs name and date
+EXPORT_FIELDS = ("name", "date", "status", "days_remaining")
+
+# Extra fields of recurring events (NDJSON export; read by import in both formats)
+RECURRENCE_FIELDS = ("recurrence", "start_date")
+
+
+def detect_format(filename: Optional[str], default: str = "ndjson") -> str:
+    """
+    Guess the transfer format from a file name.
+    
+    Args:
+        filename: File name or path, or None
+        default: Format to use when the extension is not recognized
+        
+    Returns:
+        "csv" for *.csv files, otherwise default
+    """
+    if filename and filename.lower().endswith(".csv"):
+        return "csv"
+    return default
+
+
+def export_events(
+    manager: "EventManager",
+    fmt: str = "ndjson",
+    chunk_size: int = 1000,
+    today: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Stream all events as NDJSON or CSV text.
+    
+    Events are read from storage one chunk at a time and each chunk is
+    yielded as soon as it is encoded, so memory stays bounded by the
+    chunk size and output starts before the scan finishes.
+    
+    Args:
+        manager: Event manager to read from
+        fmt: "ndjson" or "csv"
+        chunk_size: Events per storage read and per yielded string
+        today: Today's ordinal for status and remaining_days. Defaults to date.today()
+        
+    Yields:
+        Encoded text, one chunk of lines at a time
+        
+    Raises:
+        ValueError: If fmt is not supported
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported format: {fmt}. Expected one of {', '.join(FORMATS)}")
+    
+    if fmt == "csv":
+        yield _csv_line(EXPORT_FIELDS)
+    
+    for chunk in manager.iter_events(chunk_size, today):
+        rows = [
+            (e["name"], e["target_date"], e["status"], e["remaining_days"])
+            for e in chunk
+        ]
+        if fmt == "csv":
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator="\n").writerows(rows)
+            yield buffer.getvalue()
+        else:
+            yield "".join(
+                json.dumps(_record(event, row), ensure_ascii=False) + "\n"
+                for event, row in zip(chunk, rows)
+            )
+
+
+class EventImporter:
+    """
+    Import events from NDJSON or CSV lines in constant memory.
+    
+    Lines can be fed in any number of pieces (a file, or a request body
+    as it arrives). Parsed events are buffered until chunk_size of them
+    are pending and then validated and committed with a single
+    EventManager.create_events() call.
+    
+    NDJSON lines are objects with "name" and "date" (or "target_date"),
+    and for recurring events "recurrence" and optionally "start_date"
+    (the first date, used instead of "date"). CSV input starts with a
+    header row naming the same columns; other columns, such as those
+    written by export_events(), are ignored.
+    
+    Example:
+        importer = EventImporter(manager, "csv")
+        with open("events.csv") as f:
+            importer.feed(f)
+        summary = importer.finish()
+    """
+
+    def __init__(
+        self,
+        manager: "EventManager",
+        fmt: str = "ndjson",
+        chunk_size: int = 1000,
+        max_errors: int = 100,
+    ):
+        """
+        Initialize importer.
+        
+        Args:
+            manager: Event manager to create events through
+            fmt: "ndjson" or "csv"
+            chunk_size: Events validated and committed per batch
+            max_errors: Failed items kept in the summary (all are counted)
+            
+        Raises:
+            ValueError: If fmt is not supported
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}. Expected one of {', '.join(FORMATS)}")
+        
+        self.manager = manager
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[Dict] = []
+        self._line = 0
+        self._columns: Optional[Dict[str, int]] = None
+        self._pending: List[Tuple[int, str, str, Optional[str]]] = []
+
+    def feed(self, lines: Iterable[str]) -> None:
+        """
+        Parse lines and commit every full chunk of events.
+        
+        Args:
+            lines: Complete input lines (with or without line endings)
+        """
+        for line in lines:
+            self._line += 1
+            if not line.strip():
+                continue
+            
+            try:
+                item = self._parse(line)
+            except ValueError as e:
+                self._fail(self._line, None, str(e))
+                continue
+            
+            if item is not None:
+                self._pending.append((self._line, *item))
+                if len(self._pending) >= self.chunk_size:
+                    self._flush()
+
+    def finish(self) -> Dict:
+        """
+        Commit the remaining events and summarize the import.
+        
+        Returns:
+            Dictionary with imported and failed counts and the first
+            max_errors failures as {"line", "name", "error"}
+        """
+        self._flush()
+        return {"imported": self.imported, "failed": self.failed, "errors": self.errors}
+
+    def _parse(self, line: str) -> Optional[Tuple[str, str, Optional[str]]]:
+        """
+        Parse one input line.
+        
+        Args:
+            line: Input line
+            
+        Returns:
+            (name, date, recurrence), or None for the CSV header
+            
+        Raises:
+            ValueError: If the line is malformed
+        """
+        if self.fmt == "csv":
+            row = next(csv.reader([line]))
+            if self._columns is None:
+                # Tolerate the byte order mark spreadsheet programs put first
+                self._columns = {column.strip().lstrip("\ufeff"): i for i, column in enumerate(row)}
+                if "name" not in self._columns or not {"date", "target_date"} & set(self._columns):
+                    raise ValueError("CSV header must contain name and date columns")
+                return None
+            record = {column: row[i] for column, i in self._columns.items() if i < len(row)}
+        else:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON: {e.msg}") from e
+            if not isinstance(record, dict):
+                raise ValueError("Expected a JSON object")
+        
+        name = record.get("name")
+        target_date = record.get("date", record.get("target_date"))
+        if not isinstance(name, str) or not isinstance(target_date, str):
+            raise ValueError("Missing name or date")
+        
+        recurrence = record.get("recurrence") or None
+        if recurrence is not None and not isinstance(recurrence, str):
+            raise ValueError("Recurrence must be a string")
+        if recurrence is not None and isinstance(record.get("start_date"), str) and record["start_date"]:
+            target_date = record["start_date"]
+        return name, target_date, recurrence
+
+    def _flush(self) -> None:
+        """
+        Validate and commit the pending events as one batch.
+        
+        If storage still refuses the batch as a whole, the events are
+        retried one at a time so only the offending lines fail.
+        """
+        if not self._pending:
+            return
+        
+        pending, self._pending = self._pending, []
+        try:
+            results = self.manager.create_events(item[1:] for item in pending)
+        except ValueError:
+            results = [self._create_one(item[1:]) for item in pending]
+        for (line, name, *_), result in zip(pending, results):
+            if result["ok"]:
+                self.imported += 1
+            else:
+                self._fail(line, name, result["error"])
+
+    def _create_one(self, item: Tuple) -> Dict:
+        """Create a single event, turning a failure into its result."""
+        try:
+            return self.manager.create_events([item])[0]
+        except ValueError as e:
+            return {"name": item[0], "ok": False, "error": str(e)}
+
+    def _fail(self, line: int, name: Optional[str], error: str) -> None:
+        """Record one failed item."""
+        self.failed += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append({"line": line, "name": name, "error": error})
+
+
+def _record(event: Dict, row: Tuple) -> Dict:
+    """NDJSON export record of one event."""
+    record = dict(zip(EXPORT_FIELDS, row))
+    if event.get("recurrence"):
+        for field in RECURRENCE_FIELDS:
+            record[field] = event[field]
+    return record
+
+
+def _csv_line(values: Iterable) -> str:
+    """Encode one CSV row."""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="\n").writerow(values)
+    return buffer.getvalue()
@@ -1,6 +1,29 @@
 """Validator module - Input validation for events."""
 
-from datetime import datetime, date
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+from .recurrence import next_occurrence, normalize_rule
+
+
+# Channels a reminder can be sent through (FR-013)
+NOTIFICATION_TYPES = ("PUSH", "EMAIL", "SMS")
+
+
+def _parse_date(date_string: str) -> date:
+    """
+    Parse a strict ISO date (YYYY-MM-DD, zero padded).
+    
+    Storage parses target dates with date.fromisoformat, so anything it
+    would reject (or read differently, like 20270105) is refused here.
+    
+    Raises:
+        ValueError: If date_string is not exactly YYYY-MM-DD
+    """
+    parsed = date.fromisoformat(date_string)
+    if parsed.isoformat() != date_string:
+        raise ValueError(f"not in YYYY-MM-DD form: {date_string}")
+    return parsed
 
 
 class Validator:
@@ -21,7 +44,7 @@ class Validator:
             ValueError: If date format is invalid
         """
         try:
-            datetime.strptime(date_string, "%Y-%m-%d")
+            _parse_date(date_string)
             return True
         except ValueError as e:
             raise ValueError(f"Invalid date format: {date_string}. Expected YYYY-MM-DD") from e
@@ -41,7 +64,7 @@ class Validator:
             ValueError: If date is invalid (e.g., 2026-13-01)
         """
         try:
-            datetime.strptime(date_string, "%Y-%m-%d").date()
+            _parse_date(date_string)
             return True
         except ValueError as e:
             raise ValueError(f"Invalid calendar date: {date_string}") from e
@@ -95,3 +118,59 @@ class Validator:
         Validator.validate_date_format(target_date_str)
         Validator.validate_date_value(target_date_str)
         return True
+
+    @staticmethod
+    def validate_recurrence(rule: Optional[str], target_date_str: str) -> Optional[str]:
+        """
+        Validate a recurrence rule for an event starting on a date.
+        
+        Args:
+            rule: Rule text (see recurrence.normalize_rule()), or None
+            target_date_str: First occurrence (YYYY-MM-DD), may be in the past
+            
+        Returns:
+            Normalized rule, or None for a one-off event
+            
+        Raises:
+            ValueError: If the rule is invalid or has no occurrence from today on
+        """
+        rule = normalize_rule(rule)
+        if rule is None:
+            return None
+        
+        start = date.fromisoformat(target_date_str).toordinal()
+        if next_occurrence(rule, start, date.today().toordinal()) is None:
+            raise ValueError(f"Recurrence '{rule}' has no occurrence from today on")
+        return rule
+
+    @staticmethod
+    def validate_reminders(days_before: Iterable[int], notification_type: str = "PUSH") -> List[Dict]:
+        """
+        Validate reminder rules (FR-013: notify "生日" 7,3,1).
+        
+        Args:
+            days_before: Days before the event to remind (positive integers)
+            notification_type: PUSH, EMAIL or SMS
+            
+        Returns:
+            Rules as {"days_before", "notification_type"}, furthest first,
+            without duplicates
+            
+        Raises:
+            ValueError: If a day count or the notification type is invalid
+        """
+        if notification_type not in NOTIFICATION_TYPES:
+            raise ValueError(
+                f"Invalid notification type: {notification_type}. "
+                f"Expected one of {', '.join(NOTIFICATION_TYPES)}"
+            )
+        
+        days = set()
+        for value in days_before:
+            if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+                raise ValueError(f"days_before must be a positive integer, got {value!r}")
+            days.add(value)
+        return [
+            {"days_before": value, "notification_type": notification_type}
+            for value in sorted(days, reverse=True)
+        ]
@@ -1,8 +1,32 @@
 /* Event Countdown Tool - 前端应用逻辑 */
 
 const API_BASE = '/api';
+
+// 浏览器所在时区: 服务器按它计算剩余天数和状态 (不支持时使用服务器时区)
+const TIME_ZONE = (window.Intl && Intl.DateTimeFormat().resolvedOptions().timeZone) || null;
 let currentEvents = [];
 let editingEventName = null;
+let eventSource = null;
+let pollTimer = null;
+
+// 分页状态: 每页从服务器排序索引中取出，滚动到底部时加载下一页
+let currentSort = 'date';
+let currentFilter = null;
+let nextCursor = null;
+let pageLoading = false;
+let listGeneration = 0;
+
+// 轮询间隔 (仅在无法使用事件流时)
+const POLL_INTERVAL = 5000;
+
+// 每页事件数
+const PAGE_SIZE = 50;
+
+// 服务器端搜索: 输入停止后延迟发送，最多返回的结果数
+const SEARCH_DELAY = 200;
+const SEARCH_LIMIT = 100;
+let searchTimer = null;
+let searchGeneration = 0;
 
 // ==================== 初始化 ====================
 
@@ -12,62 +36,202 @@ document.addEventListener('DOMContentLoaded', function() {
     loadEvents();
     loadStats();
     
-    // 设置实时更新 (每 5 秒更新一次统计信息)
-    setInterval(loadStats, 5000);
+    // 订阅实时更新 (服务器推送，轮询仅作后备)
+    subscribeUpdates();
     
     // 搜索功能
     document.getElementById('search-input').addEventListener('input', handleSearch);
+    
+    // 无限滚动
+    if (window.IntersectionObserver) {
+        const observer = new IntersectionObserver(entries => {
+            if (entries[0].isIntersecting) {
+                loadMoreEvents();
+            }
+        }, { rootMargin: '200px' });
+        observer.observe(document.getElementById('events-sentinel'));
+    }
 });
 
 // ==================== 事件加载 ====================
 
+function withTimeZone(params) {
+    // 读接口带上时区参数，剩余天数按用户的今天计算
+    if (TIME_ZONE) {
+        params.set('tz', TIME_ZONE);
+    }
+    return params;
+}
+
 async function loadEvents(filterStatus = null) {
+    // 从第一页重新加载
+    currentFilter = filterStatus;
+    nextCursor = null;
+    listGeneration++;
+    await fetchPage(true);
+}
+
+async function loadMoreEvents() {
+    if (nextCursor && !pageLoading) {
+        await fetchPage(false);
+    }
+}
+
+async function fetchPage(reset) {
+    const generation = listGeneration;
+    const params = withTimeZone(new URLSearchParams({ limit: PAGE_SIZE, sort: currentSort }));
+    if (currentFilter) {
+        params.set('status', currentFilter);
+    }
+    if (!reset && nextCursor) {
+        params.set('cursor', nextCursor);
+    }
+    
+    pageLoading = true;
     try {
-        const url = filterStatus 
-            ? `${API_BASE}/events?status=${filterStatus}`
-            : `${API_BASE}/events`;
-        
-        const response = await fetch(url);
+        const response = await fetch(`${API_BASE}/events?${params}`);
         
         if (!response.ok) {
             throw new Error('无法加载事件');
         }
         
         const data = await response.json();
-        currentEvents = data.events;
+        if (generation !== listGeneration) {
+            // 加载期间列表已重置，丢弃过期的结果
+            return;
+        }
         
-        renderEvents(currentEvents);
+        nextCursor = data.next_cursor;
+        currentEvents = reset ? data.events : currentEvents.concat(data.events);
+        
+        if (currentSearchTerm()) {
+            // 正在显示搜索结果，列表在清空搜索框后再显示
+        } else if (reset) {
+            renderEvents(currentEvents);
+        } else {
+            appendEvents(data.events);
+        }
     } catch (error) {
         console.error('加载事件失败:', error);
         showNotification('加载事件失败', 'error');
+    } finally {
+        pageLoading = false;
     }
 }
 
+function changeSort(sort) {
+    currentSort = sort;
+    loadEvents(currentFilter);
+}
+
+function compareEvents(a, b) {
+    // 与服务器端排序一致 (date / name / remaining)
+    const byName = a.name < b.name ? -1 : (a.name > b.name ? 1 : 0);
+    const byDate = a.date < b.date ? -1 : (a.date > b.date ? 1 : byName);
+    
+    if (currentSort === 'name') {
+        return byName;
+    }
+    if (currentSort === 'remaining') {
+        // 今天及以后的事件按日期升序，已过期的按日期降序排在后面
+        const expiredA = a.status === 'EXPIRED' ? 1 : 0;
+        const expiredB = b.status === 'EXPIRED' ? 1 : 0;
+        if (expiredA !== expiredB) {
+            return expiredA - expiredB;
+        }
+        return expiredA ? -byDate : byDate;
+    }
+    return byDate;
+}
+
 async function loadStats() {
     try {
-        const response = await fetch(`${API_BASE}/stats`);
+        const response = await fetch(`${API_BASE}/stats?${withTimeZone(new URLSearchParams())}`);
         
         if (!response.ok) {
             throw new Error('无法加载统计数据');
         }
         
-        const stats = await response.json();
-        
-        document.getElementById('stat-total').textContent = stats.total_events;
-        document.getElementById('stat-active').textContent = stats.active_events;
-        document.getElementById('stat-expired').textContent = stats.expired_events;
-        
-        if (stats.next_event) {
-            document.getElementById('stat-next').textContent = 
-                `${stats.next_event} (${stats.next_event_days} 天)`;
-        } else {
-            document.getElementById('stat-next').textContent = '无';
-        }
+        renderStats(await response.json());
     } catch (error) {
         console.error('加载统计数据失败:', error);
     }
 }
 
+function renderStats(stats) {
+    document.getElementById('stat-total').textContent = stats.total_events;
+    document.getElementById('stat-active').textContent = stats.active_events;
+    document.getElementById('stat-expired').textContent = stats.expired_events;
+    
+    if (stats.next_event) {
+        document.getElementById('stat-next').textContent = 
+            `${stats.next_event} (${stats.next_event_days} 天)`;
+    } else {
+        document.getElementById('stat-next').textContent = '无';
+    }
+}
+
+// ==================== 实时更新 ====================
+
+function subscribeUpdates() {
+    if (!window.EventSource) {
+        startPolling();
+        return;
+    }
+    
+    eventSource = new EventSource(`${API_BASE}/stream?${withTimeZone(new URLSearchParams())}`);
+    
+    eventSource.addEventListener('stats', e => renderStats(JSON.parse(e.data)));
+    eventSource.addEventListener('event', e => applyChange(JSON.parse(e.data)));
+    eventSource.addEventListener('refresh', () => loadEvents());
+    
+    eventSource.onopen = function() {
+        // 连接 (或重连) 成功: 停止轮询，并重新加载断线期间可能错过的变更
+        if (pollTimer) {
+            stopPolling();
+            loadEvents();
+        }
+    };
+    
+    eventSource.onerror = function() {
+        // 浏览器会自动重连，期间先回退到轮询
+        startPolling();
+    };
+}
+
+function startPolling() {
+    if (!pollTimer) {
+        pollTimer = setInterval(loadStats, POLL_INTERVAL);
+    }
+}
+
+function stopPolling() {
+    clearInterval(pollTimer);
+    pollTimer = null;
+}
+
+function isStreaming() {
+    return eventSource !== null && eventSource.readyState === EventSource.OPEN;
+}
+
+function applyChange(change) {
+    // 其他页面或本页面的写操作: 只更新变化的那一个事件
+    const name = change.op === 'deleted' ? change.name : change.event.name;
+    currentEvents = currentEvents.filter(e => e.name !== name);
+    
+    if (change.op !== 'deleted' && (!currentFilter || change.event.status === currentFilter)) {
+        // 按当前排序插入；排在已加载部分之后的事件留给后续页面
+        const index = currentEvents.findIndex(e => compareEvents(change.event, e) < 0);
+        if (index >= 0) {
+            currentEvents.splice(index, 0, change.event);
+        } else if (!nextCursor) {
+            currentEvents.push(change.event);
+        }
+    }
+    
+    renderCurrentView();
+}
+
 // ==================== 事件渲染 ====================
 
 function renderEvents(events) {
@@ -85,6 +249,16 @@ function renderEvents(events) {
     container.innerHTML = events.map(event => createEventCard(event)).join('');
 }
 
+function appendEvents(events) {
+    if (events.length === 0) {
+        return;
+    }
+    
+    document.getElementById('empty-state').style.display = 'none';
+    document.getElementById('events-container')
+        .insertAdjacentHTML('beforeend', events.map(event => createEventCard(event)).join(''));
+}
+
 function createEventCard(event) {
     const daysRemaining = event.days_remaining;
     const isExpired = event.status === 'EXPIRED';
@@ -106,7 +280,7 @@ function createEventCard(event) {
                 <h3 class="event-name">${escapeHtml(event.name)}</h3>
                 <span class="event-status ${statusClass}">${statusText}</span>
             </div>
-            <div class="event-date">📅 ${formatDate(event.date)}</div>
+            <div class="event-date">📅 ${formatDate(event.date)}${formatRecurrence(event.recurrence)}</div>
             <div class="event-countdown">
                 <div>
                     <div class="countdown-value ${countdownClass}">${daysRemaining}</div>
@@ -123,19 +297,52 @@ function createEventCard(event) {
 
 // ==================== 搜索功能 ====================
 
+function currentSearchTerm() {
+    return document.getElementById('search-input').value.trim();
+}
+
 function handleSearch(event) {
-    const searchTerm = event.target.value.toLowerCase();
+    clearTimeout(searchTimer);
+    const searchTerm = event.target.value.trim();
     
     if (!searchTerm) {
+        searchGeneration++;
         renderEvents(currentEvents);
         return;
     }
     
-    const filtered = currentEvents.filter(event => 
-        event.name.toLowerCase().includes(searchTerm)
-    );
+    searchTimer = setTimeout(() => runSearch(searchTerm), SEARCH_DELAY);
+}
+
+async function runSearch(searchTerm) {
+    // 由服务器端名称索引搜索，无需先下载全部事件
+    const generation = ++searchGeneration;
+    const params = withTimeZone(new URLSearchParams({ q: searchTerm, limit: SEARCH_LIMIT }));
     
-    renderEvents(filtered);
+    try {
+        const response = await fetch(`${API_BASE}/events/search?${params}`);
+        
+        if (!response.ok) {
+            throw new Error('搜索失败');
+        }
+        
+        const data = await response.json();
+        if (generation === searchGeneration) {
+            renderEvents(data.events);
+        }
+    } catch (error) {
+        console.error('搜索失败:', error);
+        showNotification('搜索失败', 'error');
+    }
+}
+
+function renderCurrentView() {
+    const searchTerm = currentSearchTerm();
+    if (searchTerm) {
+        runSearch(searchTerm);
+    } else {
+        renderEvents(currentEvents);
+    }
 }
 
 // ==================== 新建事件 ====================
@@ -160,6 +367,7 @@ async function handleAddEvent(event) {
     
     const name = document.getElementById('event-name').value.trim();
     const dateStr = document.getElementById('event-date').value;
+    const recurrence = document.getElementById('event-recurrence').value || null;
     
     if (!name || !dateStr) {
         showNotification('请输入事件名称和日期', 'warning');
@@ -174,7 +382,8 @@ async function handleAddEvent(event) {
             },
             body: JSON.stringify({
                 name: name,
-                date: dateStr
+                date: dateStr,
+                recurrence: recurrence
             })
         });
         
@@ -187,7 +396,9 @@ async function handleAddEvent(event) {
         closeAddModal();
         showNotification(`✅ 事件 "${name}" 已创建`, 'success');
         await loadEvents();
-        await loadStats();
+        if (!isStreaming()) {
+            await loadStats();
+        }
     } catch (error) {
         console.error('创建事件失败:', error);
         showNotification(error.message || '创建事件失败', 'error');
@@ -238,7 +449,9 @@ async function handleEditEvent(event) {
         closeEditModal();
         showNotification(`✅ 事件 "${editingEventName}" 已更新`, 'success');
         await loadEvents();
-        await loadStats();
+        if (!isStreaming()) {
+            await loadStats();
+        }
     } catch (error) {
         console.error('更新事件失败:', error);
         showNotification(error.message || '更新事件失败', 'error');
@@ -278,7 +491,9 @@ async function confirmDelete() {
         closeDeleteModal();
         showNotification(`✅ 事件 "${editingEventName}" 已删除`, 'success');
         await loadEvents();
-        await loadStats();
+        if (!isStreaming()) {
+            await loadStats();
+        }
     } catch (error) {
         console.error('删除事件失败:', error);
         showNotification(error.message || '删除事件失败', 'error');
@@ -309,6 +524,17 @@ function formatDate(dateStr) {
     }
 }
 
+function formatRecurrence(rule) {
+    // 重复事件显示的日期是下一次日期
+    if (!rule) {
+        return '';
+    }
+    const labels = { yearly: '每年', monthly: '每月' };
+    const days = /^every (\d+) days?$/.exec(rule);
+    const label = labels[rule] || (days ? `每 ${days[1]} 天` : '重复');
+    return ` · 🔁 ${label}`;
+}
+
 function escapeHtml(text) {
     const map = {
         '&': '&amp;',
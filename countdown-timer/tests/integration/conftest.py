@@ -3,6 +3,10 @@
 import pytest
 import os
 import sys
+import tempfile
 
 # 添加项目根目录到 Python 路径
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+
+# API 模块在导入时创建存储，使用临时目录避免污染 ~/.countdown
+os.environ["COUNTDOWN_HOME"] = tempfile.mkdtemp(prefix="countdown-test-")
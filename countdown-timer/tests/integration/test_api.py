@@ -17,8 +17,7 @@ def client():
 def cleanup():
     """在每个测试前后清理数据"""
     # 清理之前的数据
-    from src.countdown_timer.storage import EventStorage
-    storage = EventStorage()
+    from src.countdown_timer.api.routes import storage
     storage.clear_all()
     
     yield
@@ -239,3 +238,585 @@ class TestFiltering:
         data = response.json()
         assert data["total"] == 1
         assert data["events"][0]["name"] == "未来"
+
+
+class TestDateRange:
+    """日期范围查询测试"""
+    
+    def test_range_and_limit(self, client):
+        """测试 from/to/limit 参数"""
+        today = date.today()
+        for name, offset in [("远", 20), ("近", 2), ("中", 10), ("过去", -5)]:
+            client.post(
+                "/api/events",
+                json={"name": name, "date": (today + timedelta(days=offset)).isoformat()}
+            )
+        
+        response = client.get(f"/api/events?from={today.isoformat()}&limit=2")
+        assert response.status_code == 200
+        assert [e["name"] for e in response.json()["events"]] == ["近", "中"]
+        
+        upper = (today + timedelta(days=10)).isoformat()
+        response = client.get(f"/api/events?to={upper}")
+        assert [e["name"] for e in response.json()["events"]] == ["过去", "近", "中"]
+    
+    def test_invalid_limit(self, client):
+        """测试非法 limit"""
+        response = client.get("/api/events?limit=0")
+        assert response.status_code == 422
+
+
+class TestStream:
+    """实时推送测试"""
+    
+    def test_mutations_are_pushed(self, client):
+        """测试写操作推送变更和统计数据"""
+        import asyncio
+        from src.countdown_timer.api.routes import stream
+        
+        async def scenario():
+            frames = stream.subscribe()
+            received = [await frames.__anext__()]
+            
+            tomorrow = (date.today() + timedelta(days=1)).isoformat()
+            await asyncio.to_thread(
+                client.post, "/api/events", json={"name": "生日", "date": tomorrow}
+            )
+            await asyncio.to_thread(client.delete, "/api/events/生日")
+            for _ in range(4):
+                received.append(await asyncio.wait_for(frames.__anext__(), 2))
+            await frames.aclose()
+            return received
+        
+        frames = asyncio.run(scenario())
+        kinds = [f.split("\n")[0] for f in frames]
+        assert kinds == ["event: stats", "event: event", "event: stats", "event: event", "event: stats"]
+        assert '"op":"created"' in frames[1]
+        assert '"total_events":1' in frames[2]
+        assert '"op":"deleted"' in frames[3]
+        assert stream.subscriber_count == 0
+    
+    def test_external_change_triggers_refresh(self):
+        """测试其他进程的写入触发 refresh"""
+        import asyncio
+        from src.countdown_timer.api.routes import storage, stream
+        from src.countdown_timer.sqlite_storage import SQLiteStorage
+        
+        async def scenario():
+            frames = stream.subscribe()
+            await frames.__anext__()
+            assert not await stream.check()
+            
+            other = SQLiteStorage(storage_dir=str(storage.storage_dir))
+            other.add_event("外部", (date.today() + timedelta(days=3)).isoformat())
+            other.close()
+            
+            assert await stream.check()
+            received = [await frames.__anext__(), await frames.__anext__()]
+            await frames.aclose()
+            return received
+        
+        refresh, stats = asyncio.run(scenario())
+        assert refresh.startswith("event: refresh")
+        assert '"active_events":1' in stats
+
+
+class TestConditionalRequests:
+    """ETag / Last-Modified 测试"""
+    
+    @pytest.mark.parametrize("path", ["/api/events", "/api/stats", "/api/events/生日"])
+    def test_etag_not_modified(self, client, path):
+        """测试 If-None-Match 命中返回 304"""
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        client.post("/api/events", json={"name": "生日", "date": tomorrow})
+        
+        response = client.get(path)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert response.headers["last-modified"]
+        
+        response = client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+    
+    def test_etag_shared_across_workers(self, client):
+        """测试另一个 worker 进程 (独立的存储实例) 生成相同的 ETag，并按租户设置 Vary"""
+        import asyncio
+        from src.countdown_timer.api.conditional import CacheValidators
+        from src.countdown_timer.api.routes import storage
+        from src.countdown_timer.async_manager import AsyncEventManager
+        from src.countdown_timer.event_manager import EventManager
+        
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        client.post("/api/events", json={"name": "生日", "date": tomorrow})
+        response = client.get("/api/stats")
+        assert response.headers["vary"] == "X-Tenant-ID"
+        
+        worker = AsyncEventManager(EventManager(type(storage)(storage_dir=str(storage.storage_dir))))
+        try:
+            etag, _ = asyncio.run(CacheValidators(worker).current())
+        finally:
+            worker.close()
+        assert etag == response.headers["etag"]
+    
+    def test_etag_changes_on_mutation(self, client):
+        """测试写操作后 ETag 失效"""
+        etag = client.get("/api/stats").headers["etag"]
+        
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        client.post("/api/events", json={"name": "生日", "date": tomorrow})
+        
+        response = client.get("/api/stats", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["total_events"] == 1
+    
+    def test_etag_changes_on_new_day(self, client, monkeypatch):
+        """测试跨天后 ETag 失效"""
+        import src.countdown_timer.api.conditional as conditional
+        
+        etag = client.get("/api/stats").headers["etag"]
+        
+        class Tomorrow(date):
+            @classmethod
+            def today(cls):
+                return date.fromordinal(date.today().toordinal() + 1)
+        
+        monkeypatch.setattr(conditional, "date", Tomorrow)
+        response = client.get("/api/stats", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+    
+    def test_if_modified_since(self, client):
+        """测试 If-Modified-Since"""
+        last_modified = client.get("/api/events").headers["last-modified"]
+        
+        response = client.get("/api/events", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+        
+        response = client.get(
+            "/api/events", headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+        )
+        assert response.status_code == 200
+
+
+class TestBatch:
+    """批量操作测试"""
+    
+    def test_batch_create(self, client):
+        """测试批量创建返回逐项结果"""
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        response = client.post(
+            "/api/events:batch",
+            json={"events": [
+                {"name": "生日", "date": tomorrow},
+                {"name": "坏日期", "date": "2026-02-30"},
+                {"name": "生日", "date": tomorrow},
+            ]}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["succeeded"], data["failed"]) == (1, 2)
+        assert data["results"][0]["event"]["status"] == "ACTIVE"
+        assert data["results"][1]["error"]
+        assert client.get("/api/stats").json()["total_events"] == 1
+    
+    def test_batch_create_with_non_padded_date(self, client):
+        """测试非补零日期只让对应项失败，其余事件照常创建"""
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        response = client.post(
+            "/api/events:batch",
+            json={"events": [
+                {"name": "a", "date": tomorrow},
+                {"name": "b", "date": "2027-1-5"},
+                {"name": "c", "date": tomorrow},
+            ]}
+        )
+        assert response.status_code == 200
+        assert [r["ok"] for r in response.json()["results"]] == [True, False, True]
+        assert [e["name"] for e in client.get("/api/events").json()["events"]] == ["a", "c"]
+    
+    def test_batch_delete(self, client):
+        """测试批量删除"""
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        client.post("/api/events:batch", json={"events": [
+            {"name": "a", "date": tomorrow}, {"name": "b", "date": tomorrow},
+        ]})
+        
+        response = client.request("DELETE", "/api/events:batch", json={"names": ["a", "x"]})
+        assert response.status_code == 200
+        assert [r["ok"] for r in response.json()["results"]] == [True, False]
+        assert [e["name"] for e in client.get("/api/events").json()["events"]] == ["b"]
+
+
+class TestTransfer:
+    """导入导出测试"""
+    
+    def test_import_and_export(self, client):
+        """测试流式导入后再导出"""
+        body = "".join(
+            json.dumps({"name": f"事件{i}", "date": "2026-03-15"}, ensure_ascii=False) + "\n"
+            for i in range(30)
+        ) + '{"name": "坏"}'
+        
+        response = client.post("/api/events/import?chunk_size=7", content=body.encode("utf-8"))
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["imported"], data["failed"]) == (30, 1)
+        assert data["errors"][0]["line"] == 31
+        
+        response = client.get("/api/events/export")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert len(response.text.splitlines()) == 30
+    
+    def test_import_csv(self, client):
+        """测试根据 Content-Type 识别 CSV"""
+        response = client.post(
+            "/api/events/import",
+            content="name,date\n生日,2026-03-15\n".encode("utf-8"),
+            headers={"Content-Type": "text/csv"},
+        )
+        assert response.json()["imported"] == 1
+        
+        response = client.get("/api/events/export?format=csv")
+        assert response.text.splitlines() == ["name,date,status,days_remaining", response.text.splitlines()[1]]
+        assert response.text.splitlines()[1].startswith("生日,2026-03-15,")
+
+
+class TestPagination:
+    """分页测试"""
+    
+    def test_cursor_pages(self, client):
+        """测试按游标逐页获取"""
+        today = date.today()
+        client.post("/api/events:batch", json={"events": [
+            {"name": f"事件{i:02d}", "date": (today + timedelta(days=i % 7)).isoformat()}
+            for i in range(12)
+        ]})
+        
+        names, cursor = [], None
+        while True:
+            url = "/api/events?sort=name&limit=5" + (f"&cursor={cursor}" if cursor else "")
+            data = client.get(url).json()
+            names += [e["name"] for e in data["events"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+        
+        assert names == [f"事件{i:02d}" for i in range(12)]
+    
+    def test_invalid_cursor(self, client):
+        """测试无效游标和排序不一致"""
+        assert client.get("/api/events?cursor=not-a-cursor").status_code == 400
+        
+        client.post("/api/events", json={"name": "a", "date": "2026-03-15"})
+        client.post("/api/events", json={"name": "b", "date": "2026-03-16"})
+        cursor = client.get("/api/events?sort=name&limit=1").json()["next_cursor"]
+        assert client.get(f"/api/events?sort=date&cursor={cursor}").status_code == 400
+        assert client.get(f"/api/events?cursor={cursor}").json()["events"][0]["name"] == "b"
+
+
+class TestSearch:
+    """搜索测试"""
+    
+    def test_search(self, client):
+        """测试前缀和包含匹配"""
+        client.post("/api/events:batch", json={"events": [
+            {"name": "妈妈生日", "date": "2026-05-01"},
+            {"name": "生日", "date": "2026-03-15"},
+            {"name": "会议", "date": "2026-04-01"},
+        ]})
+        
+        response = client.get("/api/events/search?q=生日")
+        assert response.status_code == 200
+        assert [e["name"] for e in response.json()["events"]] == ["生日", "妈妈生日"]
+        
+        assert client.get("/api/events/search?q=").status_code == 422
+
+
+class TestTenants:
+    """多租户测试"""
+    
+    @pytest.fixture(autouse=True)
+    def tenant_cleanup(self):
+        """清理测试租户的数据"""
+        from src.countdown_timer.api.routes import tenants
+        
+        def clear():
+            for tenant_id in ("alice", "bob"):
+                with tenants.lease(tenant_id) as tenant:
+                    tenant.storage.clear_all()
+        
+        clear()
+        yield
+        clear()
+    
+    def test_tenants_are_isolated(self, client):
+        """测试不同租户和默认数据互不可见"""
+        alice = {"X-Tenant-ID": "alice"}
+        bob = {"X-Tenant-ID": "bob"}
+        client.post("/api/events", json={"name": "生日", "date": "2026-03-15"}, headers=alice)
+        client.post("/api/events", json={"name": "会议", "date": "2026-04-01"}, headers=bob)
+        
+        assert [e["name"] for e in client.get("/api/events", headers=alice).json()["events"]] == ["生日"]
+        assert [e["name"] for e in client.get("/api/events", headers=bob).json()["events"]] == ["会议"]
+        assert client.get("/api/events").json()["total"] == 0
+        assert client.get("/api/events/生日", headers=bob).status_code == 404
+        assert client.get("/api/stats", headers=alice).json()["total_events"] == 1
+    
+    def test_tenant_storage_is_sharded(self, client):
+        """测试每个租户的数据位于独立目录"""
+        from src.countdown_timer.api.routes import tenants
+        
+        client.post("/api/events", json={"name": "生日", "date": "2026-03-15"}, headers={"X-Tenant-ID": "alice"})
+        assert (tenants.tenant_dir("alice") / "events.db").exists()
+    
+    def test_release_runs_off_event_loop(self, client, monkeypatch):
+        """测试释放租户 (可能关闭并等待其线程池) 不在事件循环线程中执行"""
+        import asyncio
+        from src.countdown_timer.api.routes import tenants
+        
+        threads = []
+        release = tenants.release
+        
+        def recording_release(tenant_id):
+            try:
+                asyncio.get_running_loop()
+                threads.append("loop")
+            except RuntimeError:
+                threads.append("worker")
+            return release(tenant_id)
+        
+        monkeypatch.setattr(tenants, "release", recording_release)
+        assert client.get("/api/stats", headers={"X-Tenant-ID": "alice"}).status_code == 200
+        assert threads == ["worker"]
+    
+    def test_invalid_tenant(self, client):
+        """测试非法租户 ID"""
+        response = client.get("/api/events", headers={"X-Tenant-ID": "../etc"})
+        assert response.status_code == 400
+
+
+class TestTimezones:
+    """时区测试"""
+    
+    EAST = "Pacific/Kiritimati"
+    WEST = "Pacific/Pago_Pago"
+    
+    def _zone_today(self, tz):
+        from datetime import datetime
+        from zoneinfo import ZoneInfo
+        return datetime.now(ZoneInfo(tz)).date()
+    
+    def test_remaining_days_follow_tz(self, client):
+        """测试剩余天数和状态按请求的时区计算"""
+        east_today = self._zone_today(self.EAST)
+        west_today = self._zone_today(self.WEST)
+        client.post("/api/events", json={"name": "新年", "date": east_today.isoformat()})
+        
+        east = client.get(f"/api/events/新年?tz={self.EAST}").json()
+        west = client.get(f"/api/events/新年?tz={self.WEST}").json()
+        assert (east["status"], east["days_remaining"]) == ("CURRENT", 0)
+        assert (west["status"], west["days_remaining"]) == ("ACTIVE", (east_today - west_today).days)
+        
+        assert client.get(f"/api/stats?tz={self.EAST}").json()["current_events"] == 1
+        assert client.get(f"/api/stats?tz={self.WEST}").json()["active_events"] == 1
+        
+        response = client.get(f"/api/events?status=CURRENT&tz={self.EAST}")
+        assert [e["name"] for e in response.json()["events"]] == ["新年"]
+        response = client.get(f"/api/events?status=CURRENT&limit=10&tz={self.WEST}")
+        assert response.json()["events"] == []
+    
+    def test_stream_stats_per_tz(self, client):
+        """测试事件流按订阅者的时区推送统计数据"""
+        import asyncio
+        from src.countdown_timer.api.routes import stream
+        
+        east_today = self._zone_today(self.EAST)
+        
+        async def scenario():
+            east = stream.subscribe(self.EAST)
+            west = stream.subscribe(self.WEST)
+            await east.__anext__()
+            await west.__anext__()
+            
+            await asyncio.to_thread(
+                client.post, "/api/events", json={"name": "新年", "date": east_today.isoformat()}
+            )
+            frames = {}
+            for name, frames_of in (("east", east), ("west", west)):
+                await frames_of.__anext__()
+                frames[name] = await asyncio.wait_for(frames_of.__anext__(), 2)
+                await frames_of.aclose()
+            return frames
+        
+        frames = asyncio.run(scenario())
+        assert '"current_events":1' in frames["east"]
+        assert '"active_events":1' in frames["west"]
+        assert stream.subscriber_count == 0
+    
+    def test_etag_per_tz(self, client):
+        """测试不同日期的时区使用不同的 ETag"""
+        east = client.get(f"/api/stats?tz={self.EAST}").headers["etag"]
+        west = client.get(f"/api/stats?tz={self.WEST}").headers["etag"]
+        assert east != west
+        
+        response = client.get(f"/api/stats?tz={self.WEST}", headers={"If-None-Match": east})
+        assert response.status_code == 200
+        response = client.get(f"/api/stats?tz={self.EAST}", headers={"If-None-Match": east})
+        assert response.status_code == 304
+    
+    def test_invalid_tz(self, client):
+        """测试未知时区"""
+        response = client.get("/api/events?tz=Mars/Olympus_Mons")
+        assert response.status_code == 400
+        assert "Unknown timezone" in response.json()["detail"]
+
+
+class TestRecurrence:
+    """重复事件测试"""
+    
+    def test_create_recurring_event(self, client):
+        """测试过去日期的每年事件显示下一次日期"""
+        tomorrow = date.today() + timedelta(days=1)
+        response = client.post("/api/events", json={
+            "name": "生日", "date": tomorrow.replace(year=1992).isoformat(), "recurrence": "yearly",
+        })
+        assert response.status_code == 201
+        data = response.json()
+        assert (data["date"], data["status"], data["days_remaining"]) == (tomorrow.isoformat(), "ACTIVE", 1)
+        assert data["recurrence"] == "yearly"
+        
+        # 只修改重复规则时保持首次日期
+        response = client.put("/api/events/生日", json={"recurrence": "every 365 days"})
+        assert response.json()["recurrence"] == "every 365 days"
+        assert client.get("/api/stats").json()["expired_events"] == 0
+    
+    def test_reminders_follow_recurring_event(self, client):
+        """测试提醒规则随事件保存并由租户的提醒调度器排期"""
+        from src.countdown_timer.api.routes import default_tenant
+        
+        target = date.today() + timedelta(days=30)
+        client.post("/api/events", json={"name": "生日", "date": target.isoformat(), "recurrence": "yearly"})
+        response = client.put("/api/events/生日/reminders", json={"days_before": [7, 1]})
+        assert response.status_code == 200
+        assert response.json()["reminders"] == [
+            {"days_before": 7, "notification_type": "PUSH"},
+            {"days_before": 1, "notification_type": "PUSH"},
+        ]
+        assert client.get("/api/events/生日").json()["reminders"] == response.json()["reminders"]
+        assert len(default_tenant.reminders) == 2
+        
+        response = client.put("/api/events/生日/reminders", json={"days_before": [7], "notification_type": "FAX"})
+        assert response.status_code == 400
+        assert client.put("/api/events/不存在/reminders", json={"days_before": [7]}).status_code == 404
+        
+        client.delete("/api/events/生日")
+        assert len(default_tenant.reminders) == 0
+    
+    def test_invalid_recurrence(self, client):
+        """测试不支持的重复规则"""
+        response = client.post("/api/events", json={"name": "会议", "date": "2026-03-15", "recurrence": "hourly"})
+        assert response.status_code == 400
+        
+        response = client.post("/api/events:batch", json={"events": [
+            {"name": "会议", "date": "2026-03-15", "recurrence": "FREQ=SECONDLY"},
+        ]})
+        assert response.json()["failed"] == 1
+
+
+class TestWidget:
+    """小组件接口测试"""
+    
+    def test_upcoming_events(self, client):
+        """测试只返回最近几个未过期事件"""
+        today = date.today()
+        for name, offset in (("昨天", -1), ("今天", 0), ("下周", 7), ("明天", 1)):
+            client.post("/api/events", json={"name": name, "date": (today + timedelta(days=offset)).isoformat()})
+        
+        response = client.get("/api/widget?limit=2")
+        assert response.status_code == 200
+        assert response.json() == {
+            "date": today.isoformat(),
+            "events": [
+                {"name": "今天", "date": today.isoformat(), "days": 0},
+                {"name": "明天", "date": (today + timedelta(days=1)).isoformat(), "days": 1},
+            ],
+        }
+    
+    def test_cache_headers(self, client):
+        """测试 max-age 持续到零点，ETag 在写操作后变化"""
+        response = client.get("/api/widget")
+        max_age = int(response.headers["cache-control"].removeprefix("max-age="))
+        assert 0 < max_age <= 25 * 3600
+        etag = response.headers["etag"]
+        
+        assert client.get("/api/widget", headers={"If-None-Match": etag}).status_code == 304
+        
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        client.post("/api/events", json={"name": "生日", "date": tomorrow})
+        response = client.get("/api/widget", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert [e["name"] for e in response.json()["events"]] == ["生日"]
+    
+    def test_regenerated_only_on_change(self, client, monkeypatch):
+        """测试没有写操作时不重新读取事件"""
+        from src.countdown_timer.api.routes import async_manager
+        
+        first = client.get("/api/widget").content
+        reads = []
+        original = async_manager.upcoming_events
+        monkeypatch.setattr(async_manager, "upcoming_events", lambda *args: reads.append(args) or original(*args))
+        
+        assert client.get("/api/widget").content == first
+        assert reads == []
+        
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        client.post("/api/events", json={"name": "生日", "date": tomorrow})
+        client.get("/api/widget")
+        assert len(reads) == 1
+    
+    def test_binary_encoding(self, client):
+        """测试按 Accept 返回 MessagePack"""
+        msgpack = pytest.importorskip("msgpack")
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        client.post("/api/events", json={"name": "生日", "date": tomorrow})
+        
+        response = client.get("/api/widget", headers={"Accept": "application/msgpack"})
+        assert response.headers["content-type"] == "application/msgpack"
+        assert msgpack.unpackb(response.content)["events"][0]["name"] == "生日"
+    
+    def test_etag_per_encoding(self, client, monkeypatch):
+        """测试 ETag 区分编码，且另一个 worker 生成相同的 ETag"""
+        import asyncio
+        from src.countdown_timer.api import widget
+        from src.countdown_timer.api.routes import storage
+        from src.countdown_timer.async_manager import AsyncEventManager
+        from src.countdown_timer.event_manager import EventManager
+        
+        monkeypatch.setitem(widget.ENCODERS, "application/cbor", lambda payload: b"\xa0")
+        json_etag = client.get("/api/widget").headers["etag"]
+        assert json_etag.endswith('-json"')
+        
+        # JSON 的 ETag 不能验证 CBOR 表示
+        response = client.get("/api/widget", headers={"Accept": "application/cbor", "If-None-Match": json_etag})
+        assert response.status_code == 200
+        cbor_etag = response.headers["etag"]
+        assert cbor_etag.endswith('-cbor"') and cbor_etag != json_etag
+        assert response.headers["vary"] == "Accept, X-Tenant-ID"
+        headers = {"Accept": "application/cbor", "If-None-Match": cbor_etag}
+        assert client.get("/api/widget", headers=headers).status_code == 304
+        
+        worker = AsyncEventManager(EventManager(type(storage)(storage_dir=str(storage.storage_dir))))
+        try:
+            payload = asyncio.run(widget.WidgetCache(worker).get(3))
+        finally:
+            worker.close()
+        assert payload.etag(widget.JSON_TYPE) == json_etag
+    
+    def test_unsupported_encoding_falls_back_to_json(self, client):
+        """测试不支持的编码返回 JSON"""
+        response = client.get("/api/widget", headers={"Accept": "application/x-unknown, */*"})
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()["events"] == []
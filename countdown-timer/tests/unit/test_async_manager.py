@@ -0,0 +1,102 @@
+"""Unit tests for AsyncEventManager module."""
+
+import asyncio
+import threading
+
+import pytest
+from datetime import date, timedelta
+from src.countdown_timer.async_manager import AsyncEventManager
+from src.countdown_timer.event_manager import EventManager
+from src.countdown_timer.storage import Storage
+
+
+@pytest.fixture
+def async_manager(temp_storage_dir):
+    """Async manager over a cached JSON storage."""
+    manager = AsyncEventManager(EventManager(Storage(storage_dir=temp_storage_dir, cache=True)))
+    yield manager
+    manager.close()
+
+
+class TestAsyncEventManager:
+    """Test awaitable access to the event manager."""
+
+    @pytest.mark.unit
+    def test_create_and_query(self, async_manager):
+        """Calls should return the wrapped manager's results."""
+        async def scenario():
+            await async_manager.create_event("生日", "2026-03-15")
+            return await async_manager.get_event("生日"), await async_manager.list_events()
+        
+        event, events = asyncio.run(scenario())
+        assert event["target_date"] == "2026-03-15"
+        assert [e["name"] for e in events] == ["生日"]
+
+    @pytest.mark.unit
+    def test_errors_propagate(self, async_manager):
+        """Exceptions raised in the pool should reach the caller."""
+        async def scenario():
+            await async_manager.create_event("生日", "2026-03-15")
+            await async_manager.create_event("生日", "2026-03-16")
+        
+        with pytest.raises(ValueError, match="already exists"):
+            asyncio.run(scenario())
+
+    @pytest.mark.unit
+    def test_runs_off_loop(self, async_manager):
+        """A blocked storage call should not stall the event loop."""
+        release = threading.Event()
+
+        async def scenario():
+            blocked = asyncio.ensure_future(async_manager.run(release.wait, 5))
+            # The loop keeps running while the call waits in a worker thread
+            await asyncio.sleep(0.01)
+            assert not blocked.done()
+            release.set()
+            return await blocked, await async_manager.run(threading.current_thread)
+        
+        released, worker = asyncio.run(scenario())
+        assert released is True
+        assert worker is not threading.main_thread()
+
+    @pytest.mark.unit
+    def test_concurrent_writes_keep_counts(self, async_manager):
+        """Concurrent creates and deletes should keep the status counters exact."""
+        tomorrow = (date.today() + timedelta(days=1)).isoformat()
+        yesterday = (date.today() - timedelta(days=1)).isoformat()
+
+        async def scenario():
+            await async_manager.get_stats()
+            await asyncio.gather(*(
+                async_manager.create_event(f"事件{i}", tomorrow if i % 2 else yesterday)
+                for i in range(40)
+            ))
+            await asyncio.gather(*(async_manager.delete_event(f"事件{i}") for i in range(0, 40, 4)))
+            return await async_manager.get_stats()
+        
+        stats = asyncio.run(scenario())
+        assert stats["total"] == 30
+        assert stats["active"] == 20
+        assert stats["expired"] == 10
+        assert stats == async_manager.manager.get_stats()
+
+    @pytest.mark.unit
+    def test_iter_events(self, async_manager):
+        """Chunks should be read one at a time in the pool."""
+        async def scenario():
+            await async_manager.create_events((f"事件{i}", "2026-03-15") for i in range(5))
+            return [chunk async for chunk in async_manager.iter_events(chunk_size=2)]
+        
+        chunks = asyncio.run(scenario())
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+    @pytest.mark.unit
+    def test_stats_with_version(self, async_manager):
+        """The version should match the storage the stats were read from."""
+        async def scenario():
+            await async_manager.create_event("生日", "2026-03-15")
+            return await async_manager.stats_with_version(), await async_manager.version()
+        
+        (version, stats), current = asyncio.run(scenario())
+        assert version == current
+        assert stats["total"] == 1
@@ -0,0 +1,141 @@
+"""Unit tests for backends module."""
+
+import os
+import pytest
+from click.testing import CliRunner
+from src.countdown_timer import backends
+from src.countdown_timer.backends import BACKENDS, StorageBackend, backend_name, create_storage
+from src.countdown_timer.cli import cli
+from src.countdown_timer.event_manager import EventManager
+from src.countdown_timer.memory_storage import MemoryStorage
+from src.countdown_timer.sqlite_storage import SQLiteStorage
+from src.countdown_timer.storage import Storage
+
+
+class TestBackendSelection:
+    """Test resolving and opening backends by name."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", sorted(BACKENDS))
+    def test_every_backend_implements_protocol(self, name, temp_storage_dir):
+        """Every registered backend should satisfy StorageBackend and work behind the manager."""
+        storage = create_storage(name, temp_storage_dir)
+        assert isinstance(storage, StorageBackend)
+        
+        manager = EventManager(storage)
+        manager.create_event("生日", "2030-03-15")
+        assert [e["name"] for e in manager.list_events()] == ["生日"]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", sorted(BACKENDS))
+    def test_update_keeps_created_at(self, name, temp_storage_dir):
+        """Moving an event should keep created_at and reminders and rebuild its date fields."""
+        manager = EventManager(create_storage(name, temp_storage_dir))
+        created = manager.create_event("生日", "2030-03-15")
+        manager.set_reminders("生日", [3])
+        
+        updated = manager.update_event("生日", "2031-03-15", "yearly")
+        
+        stored = manager.get_event("生日")
+        assert updated["created_at"] == stored["created_at"] == created["created_at"]
+        assert stored["target_date"] == "2031-03-15"
+        assert stored["recurrence"] == "yearly"
+        assert [r["days_before"] for r in stored["reminders"]] == [3]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", ["json", "journal", "sqlite"])
+    def test_revision_shared_between_instances(self, name, temp_storage_dir):
+        """Instances on the same files (other workers, restarts) should report the same revision."""
+        storage = create_storage(name, temp_storage_dir)
+        storage.add_event("生日", "2030-03-15")
+        revision = storage.revision
+        
+        other = create_storage(name, temp_storage_dir)
+        assert other.revision == revision
+        
+        other.add_event("会议", "2030-04-01")
+        assert storage.revision == other.revision != revision
+
+    @pytest.mark.unit
+    def test_environment_selects_backend(self, monkeypatch, temp_storage_dir):
+        """$COUNTDOWN_STORAGE should pick the backend unless a name is given."""
+        monkeypatch.delenv("COUNTDOWN_STORAGE", raising=False)
+        assert backend_name() == "sqlite"
+        
+        monkeypatch.setenv("COUNTDOWN_STORAGE", " JSON ")
+        assert backend_name() == "json"
+        assert type(create_storage(storage_dir=temp_storage_dir)) is Storage
+        assert isinstance(create_storage("sqlite", temp_storage_dir), SQLiteStorage)
+
+    @pytest.mark.unit
+    def test_default_backend_keeps_json_events(self, monkeypatch, temp_storage_dir):
+        """Upgrading with $COUNTDOWN_STORAGE unset should carry events.json over to SQLite."""
+        monkeypatch.delenv("COUNTDOWN_STORAGE", raising=False)
+        monkeypatch.setenv("COUNTDOWN_HOME", temp_storage_dir)
+        old = Storage(storage_dir=temp_storage_dir)
+        old.add_event("生日", "2030-03-15")
+        old.add_event("周会", "2026-01-05", "every 7 days")
+        
+        result = CliRunner().invoke(cli, ["list"])
+        assert result.exit_code == 0
+        assert "生日" in result.output and "周会" in result.output
+        
+        storage = create_storage(storage_dir=temp_storage_dir)
+        assert isinstance(storage, SQLiteStorage)
+        assert storage.get_event("周会")["recurrence"] == "every 7 days"
+        assert storage.count_events() == 2
+
+    @pytest.mark.unit
+    def test_unknown_backend(self, monkeypatch):
+        """Unregistered names should raise ValueError listing the choices."""
+        monkeypatch.setenv("COUNTDOWN_STORAGE", "redis")
+        with pytest.raises(ValueError, match="journal, json, memory, sqlite"):
+            create_storage()
+
+    @pytest.mark.unit
+    def test_register_backend(self, monkeypatch):
+        """Registered factories should be selectable by name."""
+        monkeypatch.setitem(BACKENDS, "scratch", lambda storage_dir: MemoryStorage())
+        assert isinstance(backends.create_storage("scratch"), MemoryStorage)
+
+    @pytest.mark.unit
+    def test_cli_storage_option(self, monkeypatch, temp_storage_dir):
+        """The CLI --storage option should choose where events are written."""
+        monkeypatch.setenv("COUNTDOWN_HOME", temp_storage_dir)
+        runner = CliRunner()
+        
+        assert runner.invoke(cli, ["--storage", "json", "add", "生日", "2030-03-15"]).exit_code == 0
+        assert os.path.exists(os.path.join(temp_storage_dir, "events.json"))
+        assert not os.path.exists(os.path.join(temp_storage_dir, "events.db"))
+        
+        result = runner.invoke(cli, ["list"], env={"COUNTDOWN_STORAGE": "json"})
+        assert "生日" in result.output
+
+
+class TestMemoryStorage:
+    """Test the process-local backend."""
+
+    @pytest.mark.unit
+    def test_no_files(self, tmp_path):
+        """Nothing should be written to the storage directory."""
+        storage = MemoryStorage(storage_dir=str(tmp_path / "unused"))
+        storage.add_event("生日", "2030-03-15")
+        
+        assert not (tmp_path / "unused").exists()
+        assert storage.get_event("生日")["target_date"] == "2030-03-15"
+
+    @pytest.mark.unit
+    def test_versions_and_copies(self):
+        """Mutations should bump the version and load_events() should return a copy."""
+        storage = MemoryStorage()
+        version = storage.version
+        storage.add_events([("生日", "2030-03-15"), ("会议", "2030-04-01")])
+        assert storage.version == version + 1
+        
+        events = storage.load_events()
+        events["生日"]["target_date"] = "2000-01-01"
+        assert storage.get_event("生日")["target_date"] == "2030-03-15"
+        
+        assert storage.delete_event("会议")
+        assert [e["name"] for e in storage.get_upcoming_events()] == ["生日"]
+        assert storage.version == version + 2
@@ -92,6 +92,33 @@ class TestCLIShow:
         assert result.exit_code != 0
 
 
+class TestCLINotify:
+    """Test 'notify' command."""
+
+    @pytest.mark.unit
+    def test_notify_sets_and_clears_reminders(self, cli_runner):
+        """Reminder rules should be stored with the event and shown by 'show'."""
+        cli_runner.invoke(cli, ["add", "生日", "2030-03-15"])
+        result = cli_runner.invoke(cli, ["notify", "生日", "7,3,1", "--type", "email"])
+        assert result.exit_code == 0
+        assert "提前 7、3、1 天提醒 (EMAIL)" in result.output
+        
+        result = cli_runner.invoke(cli, ["show", "生日"])
+        assert "提前 7、3、1 天提醒 (EMAIL)" in result.output
+        
+        result = cli_runner.invoke(cli, ["notify", "生日", "none"])
+        assert result.exit_code == 0
+        assert "提醒" not in cli_runner.invoke(cli, ["show", "生日"]).output
+
+    @pytest.mark.unit
+    def test_notify_invalid(self, cli_runner):
+        """Bad day lists and unknown events should fail."""
+        cli_runner.invoke(cli, ["add", "生日", "2030-03-15"])
+        assert cli_runner.invoke(cli, ["notify", "生日", "7,x"]).exit_code != 0
+        assert cli_runner.invoke(cli, ["notify", "生日", "-1"]).exit_code != 0
+        assert cli_runner.invoke(cli, ["notify", "不存在", "7"]).exit_code != 0
+
+
 class TestCLIDelete:
     """Test 'delete' command."""
 
@@ -163,3 +190,58 @@ class TestCLIWorkflow:
         # Verify deleted
         final_list = cli_runner.invoke(cli, ["list"])
         assert "生日" not in final_list.output or final_list.exit_code == 0
+
+
+class TestCLITransfer:
+    """Test 'import' and 'export' commands."""
+
+    @pytest.mark.unit
+    def test_export_then_import(self, cli_runner, tmp_path):
+        """Exported events should import into another storage."""
+        import os
+        
+        cli_runner.invoke(cli, ["add", "生日", "2026-03-15"])
+        cli_runner.invoke(cli, ["add", "会议", "2026-04-01"])
+        
+        export_file = tmp_path / "events.csv"
+        result = cli_runner.invoke(cli, ["export", "-o", str(export_file)])
+        assert result.exit_code == 0
+        assert export_file.read_text(encoding="utf-8").startswith("name,date")
+        
+        os.environ["COUNTDOWN_HOME"] = str(tmp_path / "other")
+        result = cli_runner.invoke(cli, ["import", str(export_file)])
+        
+        assert result.exit_code == 0
+        assert "已导入 2 个事件" in result.output
+
+    @pytest.mark.unit
+    def test_import_reports_failures(self, cli_runner):
+        """Bad lines should be reported and make the command fail."""
+        data = '{"name": "生日", "date": "2026-03-15"}\n{"name": "坏", "date": "x"}\n'
+        result = cli_runner.invoke(cli, ["import", "-"], input=data)
+        
+        assert result.exit_code == 1
+        assert "第 2 行" in result.output
+        assert "已导入 1 个事件" in result.output
+
+
+class TestCLIShell:
+    """Test 'shell' command."""
+
+    @pytest.mark.unit
+    def test_shell_runs_commands_on_one_manager(self, cli_runner, monkeypatch):
+        """Commands in the shell should share one storage instance."""
+        import src.countdown_timer.cli as cli_module
+        opened = []
+        original = cli_module.create_storage
+        monkeypatch.setattr(cli_module, "create_storage", lambda *args: opened.append(args) or original(*args))
+        
+        commands = 'add 生日 2026-03-15\nlist\nshow "生日"\nshow 无\nfoo\nexit\nlist\n'
+        result = cli_runner.invoke(cli, ["shell"], input=commands)
+        
+        assert result.exit_code == 0
+        assert "生日 已创建" in result.output
+        assert "事件 '无' 不存在" in result.output
+        assert "No such command 'foo'" in result.output
+        assert result.output.count("1. 生日") == 1
+        assert len(opened) == 1
@@ -0,0 +1,70 @@
+"""Unit tests for clock module."""
+
+import pytest
+from datetime import date, datetime, timezone
+from src.countdown_timer import clock
+
+
+# 2026-03-01 12:00 UTC: already 03-02 at UTC+14, still 03-01 at UTC-11
+NOON_UTC = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc).timestamp()
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start every test without cached days."""
+    clock._days.clear()
+    yield
+    clock._days.clear()
+
+
+class TestZoneDay:
+    """Test per-zone today and its cache."""
+
+    @pytest.mark.unit
+    def test_zones_on_different_days(self):
+        """The same instant should fall on different dates across zones."""
+        assert clock.zone_day("Pacific/Kiritimati", NOON_UTC)[0] == date(2026, 3, 2).toordinal()
+        assert clock.zone_day("Pacific/Pago_Pago", NOON_UTC)[0] == date(2026, 3, 1).toordinal()
+        assert clock.zone_day("UTC", NOON_UTC) == (
+            date(2026, 3, 1).toordinal(),
+            datetime(2026, 3, 1, tzinfo=timezone.utc).timestamp(),
+        )
+
+    @pytest.mark.unit
+    def test_cached_until_midnight(self, monkeypatch):
+        """Conversions should only happen again after the zone's midnight."""
+        lookups = []
+        original = clock.get_zone
+        monkeypatch.setattr(clock, "get_zone", lambda name: lookups.append(name) or original(name))
+        
+        first = clock.zone_day("Asia/Shanghai", NOON_UTC)
+        # 23:59 in Shanghai is 15:59 UTC
+        assert clock.zone_day("Asia/Shanghai", NOON_UTC + 3 * 3600 + 59 * 60) == first
+        assert len(lookups) == 1
+        
+        assert clock.zone_day("Asia/Shanghai", NOON_UTC + 4 * 3600)[0] == first[0] + 1
+        assert len(lookups) == 2
+
+    @pytest.mark.unit
+    def test_midnight_skipped_by_dst(self):
+        """A day starting at 01:00 (no local midnight) should still be cached sanely."""
+        # Santiago skips 2026-09-06 00:00-01:00; 04:30 UTC is 01:30 local
+        now = datetime(2026, 9, 6, 4, 30, tzinfo=timezone.utc).timestamp()
+        ordinal, start = clock.zone_day("America/Santiago", now)
+        
+        assert ordinal == date(2026, 9, 6).toordinal()
+        assert start <= now
+        assert clock.zone_day("America/Santiago", now + 60)[0] == ordinal
+
+    @pytest.mark.unit
+    def test_unknown_zone(self):
+        """Unknown or malformed zone names should raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown timezone"):
+            clock.zone_day("Mars/Olympus_Mons")
+        with pytest.raises(ValueError):
+            clock.get_zone("../etc/passwd")
+
+    @pytest.mark.unit
+    def test_today_ordinal_defaults_to_server_day(self):
+        """Without a zone today_ordinal() should use the server's date."""
+        assert clock.today_ordinal() == date.today().toordinal()
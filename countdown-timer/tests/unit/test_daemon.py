@@ -0,0 +1,83 @@
+"""Unit tests for daemon module."""
+
+import threading
+import pytest
+from click.testing import CliRunner
+from src.countdown_timer.cli import Session, cli, daemon_handler
+from src.countdown_timer.daemon import CommandDaemon, default_socket_path, send_request
+
+
+@pytest.fixture
+def home(temp_storage_dir, monkeypatch):
+    """Data directory shared by the daemon and the CLI, memory backend."""
+    monkeypatch.setenv("COUNTDOWN_HOME", temp_storage_dir)
+    monkeypatch.setenv("COUNTDOWN_STORAGE", "memory")
+    monkeypatch.delenv("COUNTDOWN_SOCKET", raising=False)
+    return temp_storage_dir
+
+
+@pytest.fixture
+def daemon(home):
+    """CLI daemon serving from a background thread."""
+    session = Session(forward=False)
+    server = CommandDaemon(default_socket_path(), daemon_handler(session))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield session
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+class TestCommandDaemon:
+    """Test the socket server and client."""
+
+    @pytest.mark.unit
+    def test_no_daemon(self, home):
+        """Without a socket there should be no response."""
+        assert send_request(default_socket_path(), {"ping": True}) is None
+
+    @pytest.mark.unit
+    def test_ping_and_single_instance(self, daemon):
+        """A running daemon should answer pings and refuse a second instance."""
+        path = default_socket_path()
+        assert send_request(path, {"ping": True}) == {"ok": True}
+        with pytest.raises(RuntimeError, match="already listening"):
+            CommandDaemon(path, lambda request: {})
+
+    @pytest.mark.unit
+    def test_stale_socket_is_replaced(self, home):
+        """A socket left by a crashed daemon should not block a new one."""
+        path = default_socket_path()
+        CommandDaemon(path, lambda request: {}).socket.close()
+        
+        server = CommandDaemon(path, lambda request: {})
+        server.server_close()
+
+
+class TestForwarding:
+    """Test CLI commands forwarded to the daemon."""
+
+    @pytest.mark.unit
+    def test_commands_run_in_daemon(self, daemon):
+        """Separate CLI invocations should share the daemon's in-memory store."""
+        runner = CliRunner()
+        
+        result = runner.invoke(cli, ["add", "生日", "2030-03-15"])
+        assert result.exit_code == 0
+        assert "生日 已创建" in result.output
+        assert "1. 生日" in runner.invoke(cli, ["list"]).output
+        
+        result = runner.invoke(cli, ["show", "无"])
+        assert result.exit_code == 1
+        assert "事件 '无' 不存在" in result.output
+        
+        assert [e["name"] for e in daemon.manager.list_events()] == ["生日"]
+
+    @pytest.mark.unit
+    def test_other_backend_runs_locally(self, daemon):
+        """Requests for another backend should not be served by the daemon."""
+        result = CliRunner().invoke(cli, ["--storage", "json", "add", "生日", "2030-03-15"])
+        
+        assert result.exit_code == 0
+        assert daemon.manager.list_events() == []
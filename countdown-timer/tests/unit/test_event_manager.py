@@ -141,3 +141,270 @@ class TestEventManagerFilter:
         """Getting events with non-matching status should return empty list."""
         events = event_manager.get_event_by_status("NONEXISTENT")
         assert events == []
+
+
+class TestEventManagerDateQueries:
+    """Test date-ordered queries."""
+
+    @pytest.mark.unit
+    def test_upcoming_events(self, event_manager):
+        """Upcoming events should skip expired ones and respect the limit."""
+        today = date.today()
+        event_manager.create_event("过期", (today - timedelta(days=1)).isoformat())
+        event_manager.create_event("远", (today + timedelta(days=30)).isoformat())
+        event_manager.create_event("近", (today + timedelta(days=2)).isoformat())
+        
+        assert [e["name"] for e in event_manager.upcoming_events(limit=1)] == ["近"]
+        assert [e["name"] for e in event_manager.upcoming_events()] == ["近", "远"]
+
+    @pytest.mark.unit
+    def test_events_between_invalid_bound(self, event_manager):
+        """Invalid range bounds should raise error."""
+        with pytest.raises(ValueError):
+            event_manager.events_between("2026-02-30", None)
+
+
+class TestEventManagerStats:
+    """Test incrementally maintained status counters."""
+
+    @pytest.mark.unit
+    def test_stats_counts(self, event_manager):
+        """Stats should count events per status and find the next one."""
+        today = date.today()
+        event_manager.create_event("过期", (today - timedelta(days=1)).isoformat())
+        event_manager.create_event("今天", today.isoformat())
+        event_manager.create_event("未来", (today + timedelta(days=3)).isoformat())
+        
+        stats = event_manager.get_stats()
+        assert (stats["total"], stats["active"], stats["current"], stats["expired"]) == (3, 1, 1, 1)
+        assert stats["next_event"]["name"] == "今天"
+
+    @pytest.mark.unit
+    def test_counters_updated_without_recount(self, event_manager, monkeypatch):
+        """Create/update/delete should adjust counters instead of recounting."""
+        today = date.today()
+        event_manager.create_event("未来", (today + timedelta(days=3)).isoformat())
+        event_manager.status_counts()
+        
+        calls = []
+        original = event_manager.storage.count_between
+        monkeypatch.setattr(
+            event_manager.storage, "count_between", lambda *a: calls.append(a) or original(*a)
+        )
+        
+        event_manager.create_event("过期", (today - timedelta(days=1)).isoformat())
+        event_manager.update_event("未来", today.isoformat())
+        event_manager.delete_event("过期")
+        
+        assert event_manager.status_counts() == {"ACTIVE": 0, "CURRENT": 1, "EXPIRED": 0}
+        assert calls == []
+
+    @pytest.mark.unit
+    def test_external_change_triggers_recount(self, event_manager, storage):
+        """Events written by another manager should show up in the counts."""
+        event_manager.status_counts()
+        
+        other = EventManager(storage=type(storage)(storage_dir=str(storage.storage_dir)))
+        other.create_event("未来", (date.today() + timedelta(days=3)).isoformat())
+        
+        assert event_manager.status_counts()["ACTIVE"] == 1
+
+    @pytest.mark.unit
+    def test_day_rollover(self, event_manager, monkeypatch):
+        """Crossing midnight should move events between counters in one batch."""
+        import src.countdown_timer.event_manager as manager_module
+        
+        today = date.today()
+        for offset in (-1, 0, 1, 2, 5):
+            event_manager.create_event(f"e{offset}", (today + timedelta(days=offset)).isoformat())
+        event_manager.status_counts()
+
+        class Later(date):
+            @classmethod
+            def today(cls):
+                return today + timedelta(days=2)
+        
+        monkeypatch.setattr(manager_module, "date", Later)
+        
+        assert event_manager.status_counts() == {"ACTIVE": 1, "CURRENT": 1, "EXPIRED": 3}
+
+    @pytest.mark.unit
+    def test_counters_survive_day_change(self, event_manager, monkeypatch):
+        """The rollover's changes should move the counters without a recount."""
+        import src.countdown_timer.event_manager as manager_module
+        
+        today = date.today()
+        for offset in (-1, 0, 1, 2, 5):
+            event_manager.create_event(f"e{offset}", (today + timedelta(days=offset)).isoformat())
+        event_manager.status_counts()
+        
+        calls = []
+        original = event_manager.storage.count_between
+        monkeypatch.setattr(
+            event_manager.storage, "count_between", lambda *a: calls.append(a) or original(*a)
+        )
+
+        class Later(date):
+            @classmethod
+            def today(cls):
+                return today + timedelta(days=2)
+        
+        monkeypatch.setattr(manager_module, "date", Later)
+        
+        # The first write of the new day rolls statuses over first
+        event_manager.create_event("新", (today + timedelta(days=9)).isoformat())
+        assert event_manager.status_counts() == {"ACTIVE": 2, "CURRENT": 1, "EXPIRED": 3}
+        assert calls == []
+
+    @pytest.mark.unit
+    def test_update_nonexistent_event(self, event_manager):
+        """Updating a missing event should return None."""
+        assert event_manager.update_event("不存在", "2026-03-15") is None
+
+    @pytest.mark.unit
+    def test_update_replaces_in_one_write(self, event_manager, monkeypatch):
+        """Updating should keep created_at and never delete the event."""
+        today = date.today()
+        created = event_manager.create_event("生日", (today + timedelta(days=3)).isoformat())
+        event_manager.status_counts()
+        monkeypatch.setattr(event_manager.storage, "delete_events", None)
+        
+        updated = event_manager.update_event("生日", today.isoformat())
+        
+        assert updated["created_at"] == created["created_at"]
+        assert event_manager.get_event("生日")["created_at"] == created["created_at"]
+        assert event_manager.status_counts() == {"ACTIVE": 0, "CURRENT": 1, "EXPIRED": 0}
+
+
+class TestEventManagerBatch:
+    """Test batch create/delete."""
+
+    @pytest.mark.unit
+    def test_create_events_per_item_results(self, event_manager):
+        """Invalid items and duplicates should fail alone."""
+        event_manager.create_event("已有", "2026-03-15")
+        
+        results = event_manager.create_events([
+            ("生日", "2026-03-15"),
+            ("", "2026-03-15"),
+            ("坏日期", "2026-13-01"),
+            ("已有", "2026-04-01"),
+            ("生日", "2026-05-01"),
+            ("会议", "2026-04-01"),
+        ])
+        
+        assert [r["ok"] for r in results] == [True, False, False, False, False, True]
+        assert "already exists" in results[3]["error"]
+        assert "already exists" in results[4]["error"]
+        assert "remaining_days" in results[0]["event"]
+        assert event_manager.count_events() == 3
+
+    @pytest.mark.unit
+    def test_create_events_writes_once(self, event_manager, monkeypatch):
+        """A batch should be persisted with a single save."""
+        saves = []
+        original = event_manager.storage.save_events
+        monkeypatch.setattr(event_manager.storage, "save_events", lambda e: saves.append(1) or original(e))
+        
+        event_manager.create_events((f"事件{i}", "2026-03-15") for i in range(50))
+        
+        assert len(saves) == 1
+        assert event_manager.count_events() == 50
+
+    @pytest.mark.unit
+    def test_delete_events(self, event_manager):
+        """Batch delete should report missing names."""
+        event_manager.create_events([("a", "2026-03-15"), ("b", "2026-03-16")])
+        
+        results = event_manager.delete_events(["a", "missing", "b", "a"])
+        
+        assert [r["ok"] for r in results] == [True, False, True, False]
+        assert event_manager.count_events() == 0
+
+    @pytest.mark.unit
+    def test_batch_keeps_counters(self, event_manager, monkeypatch):
+        """Batches should adjust the status counters without recounting."""
+        today = date.today()
+        event_manager.status_counts()
+        
+        calls = []
+        original = event_manager.storage.count_between
+        monkeypatch.setattr(
+            event_manager.storage, "count_between", lambda *a: calls.append(a) or original(*a)
+        )
+        
+        event_manager.create_events([
+            ("过期", (today - timedelta(days=2)).isoformat()),
+            ("今天", today.isoformat()),
+            ("未来", (today + timedelta(days=2)).isoformat()),
+        ])
+        event_manager.delete_events(["今天"])
+        
+        assert event_manager.status_counts() == {"ACTIVE": 1, "CURRENT": 0, "EXPIRED": 1}
+        assert calls == []
+
+
+class TestEventManagerPages:
+    """Test paginated listing."""
+
+    @pytest.mark.unit
+    def test_pages_with_status(self, event_manager):
+        """Pages should be filtered by status and end with no next key."""
+        today = date.today()
+        for i in range(5):
+            event_manager.create_event(f"未来{i}", (today + timedelta(days=i + 1)).isoformat())
+        event_manager.create_event("过期", (today - timedelta(days=1)).isoformat())
+        
+        page, after = event_manager.events_page("date", None, 3, status="ACTIVE")
+        assert [e["name"] for e in page] == ["未来0", "未来1", "未来2"]
+        
+        page, after = event_manager.events_page("date", after, 3, status="ACTIVE")
+        assert [e["name"] for e in page] == ["未来3", "未来4"]
+        assert after is None
+
+    @pytest.mark.unit
+    def test_invalid_status(self, event_manager):
+        """Unknown statuses should be rejected."""
+        with pytest.raises(ValueError):
+            event_manager.events_page(status="DELETED")
+
+
+class TestEventManagerRecurrence:
+    """Test recurring events."""
+
+    @pytest.mark.unit
+    def test_recurring_event_starts_at_next_occurrence(self, event_manager):
+        """A yearly event from the past should be stored at its next date."""
+        tomorrow = date.today() + timedelta(days=1)
+        # 1992 is a leap year, so tomorrow's month and day always exist
+        start = tomorrow.replace(year=1992)
+        event = event_manager.create_event("生日", start.isoformat(), "Yearly")
+        
+        assert event["recurrence"] == "yearly"
+        assert event["start_date"] == start.isoformat()
+        assert (event["target_date"], event["status"], event["remaining_days"]) == (tomorrow.isoformat(), "ACTIVE", 1)
+        assert event_manager.get_next_event()["name"] == "生日"
+        assert event_manager.get_stats()["expired"] == 0
+
+    @pytest.mark.unit
+    def test_invalid_recurrence(self, event_manager):
+        """Unsupported or ended rules should be rejected per item."""
+        with pytest.raises(ValueError):
+            event_manager.create_event("生日", "2026-03-15", "hourly")
+        
+        results = event_manager.create_events([
+            ("月报", "2026-01-31", "monthly"),
+            ("旧课", "2000-01-01", "RRULE:FREQ=DAILY;COUNT=2"),
+        ])
+        assert [r["ok"] for r in results] == [True, False]
+        assert "no occurrence" in results[1]["error"]
+
+    @pytest.mark.unit
+    def test_update_keeps_or_clears_recurrence(self, event_manager):
+        """Updating the date keeps the rule unless "none" is given."""
+        future = (date.today() + timedelta(days=20)).isoformat()
+        event_manager.create_event("周会", future, "weekly")
+        
+        moved = (date.today() + timedelta(days=21)).isoformat()
+        assert event_manager.update_event("周会", moved)["recurrence"] == "every 7 days"
+        assert "recurrence" not in event_manager.update_event("周会", moved, "none")
@@ -0,0 +1,188 @@
+"""Unit tests for JournalStorage module."""
+
+import json
+import pytest
+from src.countdown_timer.journal_storage import JournalStorage
+from src.countdown_timer.storage import Storage, StorageError
+from src.countdown_timer.event_manager import EventManager
+
+
+def _add_one(storage_dir, name):
+    JournalStorage(storage_dir=storage_dir).add_event(name, "2026-04-01")
+
+
+@pytest.fixture
+def journal_storage(temp_storage_dir):
+    """JournalStorage instance with temporary directory."""
+    return JournalStorage(storage_dir=temp_storage_dir)
+
+
+class TestJournalWrites:
+    """Test append-only mutations."""
+
+    @pytest.mark.unit
+    def test_add_appends_to_journal(self, journal_storage):
+        """Adding event should append a record, not rewrite the snapshot."""
+        journal_storage.add_event("生日", "2026-03-15")
+        
+        assert not journal_storage.events_file.exists()
+        lines = journal_storage.journal_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["op"] == "put"
+
+    @pytest.mark.unit
+    def test_delete_appends_to_journal(self, journal_storage):
+        """Deleting event should append a del record."""
+        journal_storage.add_event("生日", "2026-03-15")
+        
+        assert journal_storage.delete_event("生日")
+        assert not journal_storage.event_exists("生日")
+        lines = journal_storage.journal_file.read_text(encoding="utf-8").splitlines()
+        assert json.loads(lines[-1]) == {"op": "del", "name": "生日"}
+
+    @pytest.mark.unit
+    def test_works_behind_event_manager(self, journal_storage):
+        """EventManager should work unchanged on top of JournalStorage."""
+        manager = EventManager(storage=journal_storage)
+        manager.create_event("生日", "2026-03-15")
+        
+        with pytest.raises(ValueError, match="already exists"):
+            manager.create_event("生日", "2026-04-10")
+        assert [e["name"] for e in manager.list_events()] == ["生日"]
+
+
+class TestJournalRecovery:
+    """Test startup recovery and compaction."""
+
+    @pytest.mark.unit
+    def test_recovery_replays_journal(self, journal_storage, temp_storage_dir):
+        """A new instance should see events that only exist in the journal."""
+        journal_storage.add_event("生日", "2026-03-15")
+        journal_storage.add_event("假期", "2026-02-01")
+        journal_storage.delete_event("假期")
+        
+        recovered = JournalStorage(storage_dir=temp_storage_dir)
+        assert recovered.event_exists("生日")
+        assert not recovered.event_exists("假期")
+
+    @pytest.mark.unit
+    def test_torn_tail_is_ignored(self, journal_storage, temp_storage_dir):
+        """A partially written last record should not break recovery."""
+        journal_storage.add_event("生日", "2026-03-15")
+        with open(journal_storage.journal_file, "ab") as f:
+            f.write(b'{"op":"put","event":{"na')
+        
+        recovered = JournalStorage(storage_dir=temp_storage_dir)
+        assert [e["name"] for e in recovered.get_all_events()] == ["生日"]
+
+    @pytest.mark.unit
+    def test_append_after_torn_tail_is_kept(self, journal_storage, temp_storage_dir):
+        """Recovery should cut off a torn record so the next append is not glued onto it."""
+        journal_storage.add_event("a", "2026-03-15")
+        with open(journal_storage.journal_file, "ab") as f:
+            f.write(b'{"op":"put","event":{"na')
+        
+        JournalStorage(storage_dir=temp_storage_dir).add_event("b", "2026-03-16")
+        
+        recovered = JournalStorage(storage_dir=temp_storage_dir)
+        assert recovered.event_exists("a")
+        assert recovered.event_exists("b")
+
+    @pytest.mark.unit
+    def test_corrupt_record_raises(self, journal_storage, temp_storage_dir):
+        """A complete record that is not valid JSON should raise instead of being skipped."""
+        journal_storage.add_event("a", "2026-03-15")
+        with open(journal_storage.journal_file, "ab") as f:
+            f.write(b'{"op":"put",garbage}\n')
+        
+        with pytest.raises(StorageError):
+            JournalStorage(storage_dir=temp_storage_dir)
+
+    @pytest.mark.unit
+    def test_reads_journal_tail_from_other_writer(self, journal_storage, temp_storage_dir):
+        """Records appended by another instance should be picked up."""
+        journal_storage.add_event("生日", "2026-03-15")
+        
+        other = JournalStorage(storage_dir=temp_storage_dir)
+        other.add_event("假期", "2026-02-01")
+        
+        assert journal_storage.event_exists("假期")
+
+    @pytest.mark.unit
+    def test_threshold_compaction(self, temp_storage_dir):
+        """Reaching the threshold should fold the journal into the snapshot."""
+        storage = JournalStorage(storage_dir=temp_storage_dir, compact_threshold=3)
+        storage.add_event("a", "2026-03-15")
+        storage.add_event("b", "2026-03-16")
+        storage.add_event("c", "2026-03-17")
+        
+        assert storage.journal_file.stat().st_size == 0
+        assert set(Storage(storage_dir=temp_storage_dir).load_events()) == {"a", "b", "c"}
+        assert JournalStorage(storage_dir=temp_storage_dir).event_exists("c")
+
+    @pytest.mark.unit
+    def test_append_during_compaction_is_kept(self, temp_storage_dir):
+        """A record another process appends while we compact should survive."""
+        import multiprocessing
+        
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("needs fork")
+        
+        context = multiprocessing.get_context("fork")
+        storage = JournalStorage(storage_dir=temp_storage_dir)
+        storage.add_event("x", "2026-03-15")
+        
+        writers = []
+        read = storage._events
+
+        def read_then_append():
+            events = read()
+            if not writers:
+                # The other writer appends right after our read (or waits for our lock)
+                writer = context.Process(target=_add_one, args=(temp_storage_dir, "y"))
+                writer.start()
+                writer.join(timeout=1.0)
+                writers.append(writer)
+            return events
+        
+        storage._events = read_then_append
+        storage.compact()
+        writers[0].join()
+        
+        assert writers[0].exitcode == 0
+        assert set(JournalStorage(storage_dir=temp_storage_dir).load_events()) == {"x", "y"}
+
+    @pytest.mark.unit
+    def test_reads_do_not_compact(self, temp_storage_dir):
+        """Opening and reading a long journal should leave it for the next writer."""
+        storage = JournalStorage(storage_dir=temp_storage_dir, compact_threshold=100)
+        storage.add_events([(f"e{i}", "2026-03-15") for i in range(3)])
+        
+        reader = JournalStorage(storage_dir=temp_storage_dir, compact_threshold=2)
+        assert reader.count_events() == 3
+        assert not reader.events_file.exists()
+        
+        reader.add_event("e3", "2026-03-15")
+        assert reader.journal_file.stat().st_size == 0
+        assert set(Storage(storage_dir=temp_storage_dir).load_events()) == {"e0", "e1", "e2", "e3"}
+
+    @pytest.mark.unit
+    def test_reads_existing_json_storage(self, temp_storage_dir):
+        """Data written by the JSON Storage should be readable as a snapshot."""
+        Storage(storage_dir=temp_storage_dir).add_event("生日", "2026-03-15")
+        
+        assert JournalStorage(storage_dir=temp_storage_dir).event_exists("生日")
+
+
+class TestJournalBatch:
+    """Test batch writes."""
+
+    @pytest.mark.unit
+    def test_batch_appends_records(self, journal_storage, temp_storage_dir):
+        """A batch should append one record per event."""
+        journal_storage.add_events([("a", "2026-03-15"), ("b", "2026-03-16")])
+        journal_storage.delete_events(["a", "missing"])
+        
+        lines = journal_storage.journal_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["op"] for line in lines] == ["put", "put", "del"]
+        assert set(JournalStorage(storage_dir=temp_storage_dir).load_events()) == {"b"}
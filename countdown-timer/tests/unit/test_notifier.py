@@ -0,0 +1,227 @@
+"""Unit tests for notifier module."""
+
+import threading
+
+import pytest
+from datetime import date, datetime, time as dt_time, timedelta
+from src.countdown_timer.backends import create_storage
+from src.countdown_timer.event_manager import EventManager
+from src.countdown_timer.notifier import LogSink, MemorySink, ReminderScheduler
+
+
+class FakeClock:
+    """Settable clock."""
+
+    def __init__(self, when: datetime):
+        self.now = when.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def set(self, when: datetime) -> float:
+        self.now = when.timestamp()
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Clock at 2026-03-01 08:00."""
+    return FakeClock(datetime(2026, 3, 1, 8, 0))
+
+
+@pytest.fixture
+def sink():
+    """Sink recording sent reminders."""
+    return MemorySink()
+
+
+@pytest.fixture
+def scheduler(clock, sink):
+    """Scheduler sending at 09:00 to the memory sink."""
+    return ReminderScheduler([sink], fire_time=dt_time(9, 0), clock=clock)
+
+
+class TestReminderScheduler:
+    """Test scheduling, cancelling and dispatching reminders."""
+
+    @pytest.mark.unit
+    def test_fires_days_before(self, scheduler, clock, sink):
+        """notify "生日" 7,3,1 should fire on 03-08, 03-12 and 03-14 at 09:00."""
+        assert scheduler.schedule_event("生日", "2026-03-15", [7, 3, 1]) == 3
+        assert scheduler.next_due() == datetime(2026, 3, 8, 9, 0).timestamp()
+        
+        assert scheduler.run_pending(clock.set(datetime(2026, 3, 8, 8, 59))) == []
+        sent = scheduler.run_pending(clock.set(datetime(2026, 3, 12, 9, 0)))
+        assert [r["days_before"] for r in sent] == [7, 3]
+        assert sent[0] == {
+            "event_name": "生日",
+            "target_date": "2026-03-15",
+            "days_before": 7,
+            "notification_type": "PUSH",
+            "due_at": "2026-03-08T09:00:00",
+        }
+        assert sink.sent == sent
+        assert len(scheduler) == 1
+
+    @pytest.mark.unit
+    def test_passed_days_are_skipped(self, scheduler):
+        """Reminders whose day has passed should not be scheduled."""
+        assert scheduler.schedule_event("生日", "2026-03-03", [7, 3, 2, 1]) == 2
+        assert scheduler.schedule("生日", "2026-03-03", 2) == datetime(2026, 3, 1, 9, 0).timestamp()
+
+    @pytest.mark.unit
+    def test_cancel(self, scheduler, clock, sink):
+        """Cancelled reminders should never fire."""
+        scheduler.schedule_event("生日", "2026-03-15", [7, 3])
+        scheduler.schedule("会议", "2026-03-20", 1, "EMAIL")
+        
+        assert scheduler.cancel("生日", 7)
+        assert not scheduler.cancel("生日", 7)
+        assert scheduler.cancel_event("会议") == 1
+        
+        scheduler.run_pending(clock.set(datetime(2026, 4, 1)))
+        assert [(r["event_name"], r["days_before"]) for r in sink.sent] == [("生日", 3)]
+
+    @pytest.mark.unit
+    def test_reschedule_event(self, scheduler, clock, sink):
+        """Moving an event should move its reminders."""
+        scheduler.schedule_event("生日", "2026-03-15", [3, 1], "SMS")
+        assert scheduler.reschedule_event("生日", "2026-03-25") == 2
+        assert scheduler.next_due() == datetime(2026, 3, 22, 9, 0).timestamp()
+        
+        scheduler.run_pending(clock.set(datetime(2026, 4, 1)))
+        assert [r["target_date"] for r in sink.sent] == ["2026-03-25", "2026-03-25"]
+
+    @pytest.mark.unit
+    def test_invalid_rules(self, scheduler):
+        """days_before must be positive and the type known."""
+        with pytest.raises(ValueError):
+            scheduler.schedule("生日", "2026-03-15", 0)
+        with pytest.raises(ValueError):
+            scheduler.schedule("生日", "2026-03-15", 1, "FAX")
+
+    @pytest.mark.unit
+    def test_failing_sink_does_not_stop_others(self, clock, sink):
+        """A sink raising should not keep the reminder from other sinks."""
+        class Broken:
+            def send(self, reminder):
+                raise RuntimeError("down")
+        
+        scheduler = ReminderScheduler([Broken(), sink], clock=clock)
+        scheduler.schedule("生日", "2026-03-15", 1)
+        scheduler.run_pending(clock.set(datetime(2026, 3, 14, 10, 0)))
+        assert len(sink.sent) == 1
+
+    @pytest.mark.unit
+    def test_cancelled_entries_are_compacted(self, scheduler):
+        """The heap should not keep growing with cancelled reminders."""
+        for i in range(5000):
+            scheduler.schedule(f"事件{i}", "2026-06-01", 1)
+            scheduler.cancel(f"事件{i}", 1)
+        
+        assert len(scheduler) == 0
+        assert len(scheduler._heap) <= 64
+        assert scheduler.next_due() is None
+
+    @pytest.mark.unit
+    def test_log_sink(self, caplog):
+        """LogSink should log one line per reminder."""
+        with caplog.at_level("INFO"):
+            LogSink().send({
+                "event_name": "生日",
+                "target_date": "2026-03-15",
+                "days_before": 3,
+                "notification_type": "PUSH",
+                "due_at": "2026-03-12T09:00:00",
+            })
+        assert "[PUSH] 生日 in 3 day(s) (2026-03-15)" in caplog.text
+
+    @pytest.mark.unit
+    def test_background_thread_wakes_when_due(self, clock):
+        """The runner should sleep until a newly added reminder is due."""
+        delivered = threading.Event()
+
+        class Signal:
+            def send(self, reminder):
+                delivered.set()
+        
+        scheduler = ReminderScheduler([Signal()], fire_time=dt_time(8, 0), clock=clock)
+        scheduler.start()
+        try:
+            # Due today at 08:00, i.e. right now: the sleeping runner must wake
+            scheduler.schedule("生日", "2026-03-02", 1)
+            assert delivered.wait(2)
+            assert len(scheduler) == 0
+        finally:
+            scheduler.stop(2)
+
+
+def _due(target: date, days_before: int) -> float:
+    """Due timestamp of a reminder days_before target at 09:00."""
+    return datetime.combine(target - timedelta(days=days_before), dt_time(9, 0)).timestamp()
+
+
+class TestManagerReminders:
+    """Test reminders following the event lifecycle through EventManager."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("name", ["json", "journal", "sqlite"])
+    def test_rules_survive_restart(self, name, temp_storage_dir):
+        """Rules set through one manager should be scheduled by the next process's manager."""
+        target = date.today() + timedelta(days=30)
+        manager = EventManager(create_storage(name, temp_storage_dir))
+        manager.create_event("生日", target.isoformat())
+        event = manager.set_reminders("生日", [1, 7, 3, 7])
+        assert [rule["days_before"] for rule in event["reminders"]] == [7, 3, 1]
+        
+        scheduler = ReminderScheduler([MemorySink()])
+        restarted = EventManager(create_storage(name, temp_storage_dir), scheduler=scheduler)
+        assert len(scheduler) == 3
+        assert scheduler.next_due() == _due(target, 7)
+        assert restarted.get_event("生日")["reminders"] == event["reminders"]
+
+    @pytest.mark.unit
+    def test_update_and_delete_follow_event(self, storage):
+        """Moving an event should move its reminders; deleting it should cancel them."""
+        scheduler = ReminderScheduler([MemorySink()])
+        manager = EventManager(storage, scheduler=scheduler)
+        target = date.today() + timedelta(days=30)
+        manager.create_event("生日", target.isoformat())
+        manager.set_reminders("生日", [7], "EMAIL")
+        assert scheduler.next_due() == _due(target, 7)
+        
+        moved = target + timedelta(days=10)
+        event = manager.update_event("生日", moved.isoformat())
+        assert event["reminders"] == [{"days_before": 7, "notification_type": "EMAIL"}]
+        assert scheduler.next_due() == _due(moved, 7)
+        
+        manager.set_reminders("生日", [])
+        assert len(scheduler) == 0 and "reminders" not in storage.get_event("生日")
+        manager.set_reminders("生日", [3])
+        assert manager.delete_event("生日")
+        assert len(scheduler) == 0
+
+    @pytest.mark.unit
+    def test_recurring_event_rearmed_on_rollover(self, storage):
+        """A recurring event moving on to its next date should get its reminders again."""
+        scheduler = ReminderScheduler([MemorySink()])
+        manager = EventManager(storage, scheduler=scheduler)
+        today = date.today()
+        manager.create_event("周会", today.isoformat(), "every 7 days")
+        manager.set_reminders("周会", [3])
+        assert len(scheduler) == 0  # 3 days before today has passed
+        
+        # The next day's rollover moves the event to today + 7
+        changes = manager.rollover.check(today.toordinal() + 1)
+        assert changes[0]["old_target_date"] == today.isoformat()
+        assert scheduler.next_due() == _due(today + timedelta(days=7), 3)
+
+    @pytest.mark.unit
+    def test_invalid_rules_and_missing_event(self, event_manager):
+        """Invalid rules should raise; a missing event should return None."""
+        event_manager.create_event("生日", "2030-03-15")
+        with pytest.raises(ValueError):
+            event_manager.set_reminders("生日", [0])
+        with pytest.raises(ValueError):
+            event_manager.set_reminders("生日", [7], "FAX")
+        assert event_manager.set_reminders("不存在", [7]) is None
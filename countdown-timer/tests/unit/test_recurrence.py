@@ -0,0 +1,88 @@
+"""Unit tests for recurrence module."""
+
+import pytest
+from datetime import date
+from src.countdown_timer.recurrence import next_occurrence, normalize_rule
+
+
+def _ordinal(text: str) -> int:
+    return date.fromisoformat(text).toordinal()
+
+
+def _next(rule: str, start: str, today: str) -> str:
+    occurrence = next_occurrence(normalize_rule(rule), _ordinal(start), _ordinal(today))
+    return None if occurrence is None else date.fromordinal(occurrence).isoformat()
+
+
+class TestNormalizeRule:
+    """Test rule validation and stored forms."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("rule, expected", [
+        ("yearly", "yearly"),
+        (" Monthly ", "monthly"),
+        ("every 10 days", "every 10 days"),
+        ("EVERY 1 DAY", "every 1 day"),
+        ("weekly", "every 7 days"),
+        ("freq=monthly;count=3", "RRULE:FREQ=MONTHLY;COUNT=3"),
+        ("RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=4TH", "RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=4TH"),
+        ("none", None),
+        ("", None),
+        (None, None),
+    ])
+    def test_accepted(self, rule, expected):
+        """Supported rules should be brought to one stored form."""
+        assert normalize_rule(rule) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("rule", [
+        "hourly",
+        "every 0 days",
+        "RRULE:FREQ=HOURLY",
+        "FREQ=DAILY;BYHOUR=9",
+        "FREQ=DAILY;UNTIL=20301231T000000Z",
+        "FREQ=DAILY;INTERVAL=x",
+    ])
+    def test_rejected(self, rule):
+        """Other rules, time-of-day parts and bad values should raise ValueError."""
+        with pytest.raises(ValueError):
+            normalize_rule(rule)
+
+
+class TestNextOccurrence:
+    """Test computing the next occurrence from today."""
+
+    @pytest.mark.unit
+    def test_yearly_birthday(self):
+        """A birthday from decades ago should land on this or next year's date."""
+        assert _next("yearly", "1990-05-01", "2026-03-01") == "2026-05-01"
+        assert _next("yearly", "1990-05-01", "2026-05-01") == "2026-05-01"
+        assert _next("yearly", "1990-05-01", "2026-05-02") == "2027-05-01"
+
+    @pytest.mark.unit
+    def test_future_start_is_first_occurrence(self):
+        """Before the start date the start itself should be next."""
+        assert _next("monthly", "2026-06-15", "2026-03-01") == "2026-06-15"
+        assert _next("every 3 days", "2026-06-15", "2026-03-01") == "2026-06-15"
+
+    @pytest.mark.unit
+    def test_month_end_is_clamped_without_drift(self):
+        """Jan 31 monthly should give Feb 28 and then Mar 31 again."""
+        assert _next("monthly", "2026-01-31", "2026-02-01") == "2026-02-28"
+        assert _next("monthly", "2026-01-31", "2026-03-01") == "2026-03-31"
+        assert _next("yearly", "2024-02-29", "2025-01-01") == "2025-02-28"
+        assert _next("yearly", "2024-02-29", "2027-03-01") == "2028-02-29"
+
+    @pytest.mark.unit
+    def test_every_n_days(self):
+        """Day rules should step from the start date."""
+        assert _next("every 10 days", "2026-10-01", "2026-10-18") == "2026-10-21"
+        assert _next("every 10 days", "2026-10-01", "2026-10-21") == "2026-10-21"
+
+    @pytest.mark.unit
+    def test_rrule(self):
+        """RRULE rules should be evaluated by dateutil and may end."""
+        assert _next("RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=4TH", "2020-01-01", "2026-10-18") == "2026-11-26"
+        assert _next("RRULE:FREQ=MONTHLY;COUNT=3", "2026-01-10", "2026-03-10") == "2026-03-10"
+        assert _next("RRULE:FREQ=MONTHLY;COUNT=3", "2026-01-10", "2026-03-11") is None
+        assert _next("RRULE:FREQ=DAILY;UNTIL=20260105", "2026-01-01", "2026-01-06") is None
@@ -0,0 +1,182 @@
+"""Unit tests for rollover module."""
+
+import pytest
+from datetime import date, timedelta
+from src.countdown_timer.event_manager import EventManager
+from src.countdown_timer.journal_storage import JournalStorage
+from src.countdown_timer.rollover import StatusRollover
+from src.countdown_timer.sqlite_storage import SQLiteStorage
+from src.countdown_timer.storage import Storage
+
+
+BACKENDS = {
+    "json": lambda path: Storage(storage_dir=path),
+    "json-cache": lambda path: Storage(storage_dir=path, cache=True),
+    "journal": lambda path: JournalStorage(storage_dir=path),
+    "sqlite": lambda path: SQLiteStorage(storage_dir=path),
+}
+
+TODAY = date.today()
+
+
+def _event(name: str, offset: int, status: str) -> dict:
+    """Stored event dated offset days from today with a given (stale) status."""
+    target = TODAY + timedelta(days=offset)
+    return {
+        "name": name,
+        "target_date": target.isoformat(),
+        "target_ordinal": target.toordinal(),
+        "created_at": "2026-01-01T00:00:00",
+        "status": status,
+    }
+
+
+@pytest.fixture(params=sorted(BACKENDS))
+def storage(request, temp_storage_dir):
+    """Storage of every backend holding statuses written a few days ago."""
+    storage = BACKENDS[request.param](temp_storage_dir)
+    storage.save_events({e["name"]: e for e in [
+        _event("前天", -2, "CURRENT"),
+        _event("昨天", -1, "ACTIVE"),
+        _event("今天", 0, "ACTIVE"),
+        _event("明天", 1, "ACTIVE"),
+        _event("去年", -365, "EXPIRED"),
+    ]})
+    return storage
+
+
+def _statuses(storage) -> dict:
+    return {name: e["status"] for name, e in storage.load_events().items()}
+
+
+class TestStatusRollover:
+    """Test persisted daily status transitions."""
+
+    @pytest.mark.unit
+    def test_first_check_repairs_stale_statuses(self, storage):
+        """The first check should persist every stale status in one write."""
+        version = storage.version
+        changes = StatusRollover(storage).check(TODAY.toordinal())
+        
+        assert {c["name"]: (c["old_status"], c["status"]) for c in changes} == {
+            "前天": ("CURRENT", "EXPIRED"),
+            "昨天": ("ACTIVE", "EXPIRED"),
+            "今天": ("ACTIVE", "CURRENT"),
+        }
+        assert storage.version == version + 1
+        assert _statuses(storage) == {
+            "前天": "EXPIRED", "昨天": "EXPIRED", "今天": "CURRENT", "明天": "ACTIVE", "去年": "EXPIRED",
+        }
+
+    @pytest.mark.unit
+    def test_runs_once_per_day(self, storage):
+        """Later checks on the same day should not touch storage."""
+        rollover = StatusRollover(storage)
+        rollover.check(TODAY.toordinal())
+        version = storage.version
+        
+        assert rollover.check(TODAY.toordinal()) == []
+        assert storage.version == version
+
+    @pytest.mark.unit
+    def test_next_day_changes_only_the_boundary(self, storage):
+        """On the next day only today's and tomorrow's events should move."""
+        rollover = StatusRollover(storage)
+        rollover.check(TODAY.toordinal())
+        received = []
+        rollover.add_listener(received.append)
+        
+        changes = rollover.check(TODAY.toordinal() + 1)
+        assert [(c["name"], c["status"]) for c in changes] == [("今天", "EXPIRED"), ("明天", "CURRENT")]
+        assert received == [changes]
+        assert _statuses(storage)["明天"] == "CURRENT"
+
+    @pytest.mark.unit
+    def test_no_changes_no_write(self, storage):
+        """A day without transitions should not write or call listeners."""
+        rollover = StatusRollover(storage)
+        rollover.check(TODAY.toordinal() + 10)
+        received = []
+        rollover.add_listener(received.append)
+        version = storage.version
+        
+        assert rollover.check(TODAY.toordinal() + 11) == []
+        assert storage.version == version
+        assert received == []
+
+    @pytest.mark.unit
+    def test_new_process_starts_from_persisted_day(self, storage, temp_storage_dir, monkeypatch):
+        """Another process should roll from the persisted day instead of scanning every event."""
+        StatusRollover(storage).check(TODAY.toordinal())
+        reopened = type(storage)(storage_dir=temp_storage_dir)
+        assert reopened.rolled_day == TODAY.toordinal()
+        
+        calls = []
+        roll = reopened.roll_statuses
+        monkeypatch.setattr(reopened, "roll_statuses", lambda today, since=None: calls.append(since) or roll(today, since))
+        rollover = StatusRollover(reopened)
+        assert rollover.check(TODAY.toordinal()) == []
+        assert calls == []
+        
+        rollover.check(TODAY.toordinal() + 1)
+        assert calls == [TODAY.toordinal()]
+        assert storage.rolled_day == TODAY.toordinal() + 1
+
+
+class TestEventManagerRollover:
+    """Test rollover triggered by the first access of a day."""
+
+    @pytest.mark.unit
+    def test_read_persists_statuses(self, storage):
+        """The first read should roll statuses over and keep stats right."""
+        manager = EventManager(storage)
+        stats = manager.get_stats()
+        
+        assert (stats["active"], stats["current"], stats["expired"]) == (1, 1, 3)
+        assert _statuses(storage)["今天"] == "CURRENT"
+        assert manager.rollover.day == TODAY.toordinal()
+
+
+class TestRecurringRollover:
+    """Test recurring events moving on instead of expiring."""
+
+    @pytest.fixture
+    def weekly(self, storage):
+        """Storage with a weekly event started two weeks ago, still at last week's date."""
+        event = _event("周会", -7, "CURRENT")
+        event["recurrence"] = "every 7 days"
+        event["start_date"] = (TODAY - timedelta(days=14)).isoformat()
+        storage.save_events({**storage.load_events(), "周会": event})
+        return storage
+
+    @pytest.mark.unit
+    def test_passed_occurrence_moves_on(self, weekly):
+        """The rollover should store the next occurrence and keep the date index right."""
+        rollover = StatusRollover(weekly)
+        changes = {c["name"]: c for c in rollover.check(TODAY.toordinal())}
+        
+        assert changes["周会"] == {
+            "name": "周会",
+            "target_date": TODAY.isoformat(),
+            "old_status": "CURRENT",
+            "status": "CURRENT",
+            "old_target_date": (TODAY - timedelta(days=7)).isoformat(),
+        }
+        
+        changes = rollover.check(TODAY.toordinal() + 1)
+        next_week = (TODAY + timedelta(days=7)).isoformat()
+        assert [(c["name"], c["target_date"]) for c in changes if c["name"] == "周会"] == [("周会", next_week)]
+        assert weekly.load_events()["周会"]["target_date"] == next_week
+        assert [e["name"] for e in weekly.get_events_between(next_week, next_week)] == ["周会"]
+
+    @pytest.mark.unit
+    def test_reads_show_next_occurrence_before_rollover(self, weekly):
+        """Reading before the rollover ran should already show the next occurrence."""
+        event = weekly.get_event("周会", TODAY.toordinal())
+        assert (event["target_date"], event["status"], event["remaining_days"]) == (TODAY.isoformat(), "CURRENT", 0)
+
+    @pytest.mark.unit
+    def test_manager_counts_moved_events(self, weekly):
+        """Stats should count the recurring event at its new date, not as expired."""
+        stats = EventManager(weekly).get_stats()
+        assert (stats["active"], stats["current"], stats["expired"]) == (1, 2, 3)
@@ -0,0 +1,48 @@
+"""Unit tests for search module."""
+
+import pytest
+from src.countdown_timer.search import NameIndex
+
+
+@pytest.fixture
+def index():
+    """Index over a few mixed names."""
+    return NameIndex(["生日", "妈妈生日", "Birthday Party", "birth", "Meeting", "生日聚会"])
+
+
+class TestNameIndex:
+    """Test prefix and substring search."""
+
+    @pytest.mark.unit
+    def test_prefix_before_substring(self, index):
+        """Prefix matches should come first, each group sorted."""
+        assert index.search("生日") == ["生日", "生日聚会", "妈妈生日"]
+
+    @pytest.mark.unit
+    def test_case_insensitive(self, index):
+        """Queries should match regardless of case."""
+        assert index.search("BIRTH") == ["birth", "Birthday Party"]
+        assert index.search("party") == ["Birthday Party"]
+
+    @pytest.mark.unit
+    def test_single_character(self, index):
+        """One-character queries should use the unigram postings."""
+        assert index.search("聚") == ["生日聚会"]
+        assert index.search("t") == ["birth", "Birthday Party", "Meeting"]
+
+    @pytest.mark.unit
+    def test_no_match_and_limit(self, index):
+        """Missing grams should return nothing; limit should cap results."""
+        assert index.search("xyz") == []
+        assert index.search("") == []
+        assert index.search("生日", limit=2) == ["生日", "生日聚会"]
+
+    @pytest.mark.unit
+    def test_add_and_remove(self, index):
+        """Updates should be visible to both prefix and substring search."""
+        index.add("老爸生日")
+        index.remove("生日")
+        index.remove("不存在")
+        
+        assert index.search("生日") == ["生日聚会", "妈妈生日", "老爸生日"]
+        assert len(index) == 6
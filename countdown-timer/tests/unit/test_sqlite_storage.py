@@ -0,0 +1,257 @@
+"""Unit tests for SQLiteStorage module."""
+
+import pytest
+from datetime import date, timedelta
+from pathlib import Path
+from src.countdown_timer.journal_storage import JournalStorage
+from src.countdown_timer.sqlite_storage import SQLiteStorage
+from src.countdown_timer.storage import Storage, StorageError
+from src.countdown_timer.event_manager import EventManager
+
+
+@pytest.fixture
+def sqlite_storage(temp_storage_dir):
+    """SQLiteStorage instance with temporary directory."""
+    storage = SQLiteStorage(storage_dir=temp_storage_dir)
+    yield storage
+    storage.close()
+
+
+def _days(n):
+    """ISO date n days from today."""
+    return (date.today() + timedelta(days=n)).isoformat()
+
+
+class TestSQLiteBasics:
+    """Test the Storage interface on SQLite."""
+
+    @pytest.mark.unit
+    def test_add_and_get_event(self, sqlite_storage):
+        """Added event should be readable with remaining_days."""
+        sqlite_storage.add_event("生日", _days(10))
+        
+        event = sqlite_storage.get_event("生日")
+        assert event["target_date"] == _days(10)
+        assert event["remaining_days"] == 10
+        assert event["status"] == "ACTIVE"
+
+    @pytest.mark.unit
+    def test_add_duplicate_event_fails(self, sqlite_storage):
+        """Adding duplicate event should raise ValueError."""
+        sqlite_storage.add_event("生日", "2026-03-15")
+        
+        with pytest.raises(ValueError, match="already exists"):
+            sqlite_storage.add_event("生日", "2026-04-10")
+
+    @pytest.mark.unit
+    def test_delete_event(self, sqlite_storage):
+        """Deleting should remove the event and report whether it existed."""
+        sqlite_storage.add_event("生日", "2026-03-15")
+        
+        assert sqlite_storage.delete_event("生日")
+        assert not sqlite_storage.delete_event("生日")
+        assert sqlite_storage.get_event("生日") is None
+
+    @pytest.mark.unit
+    def test_delete_event_keeps_search_index(self, sqlite_storage):
+        """A single delete should take the batch path and update the search index in place."""
+        sqlite_storage.add_events([("生日", _days(1)), ("妈妈生日", _days(2))])
+        sqlite_storage.search_events("生日")
+        index = sqlite_storage._search_index
+        
+        assert sqlite_storage.delete_event("生日")
+        assert sqlite_storage._search_index is index
+        assert sqlite_storage._search_current()
+        assert [e["name"] for e in sqlite_storage.search_events("生日")] == ["妈妈生日"]
+
+    @pytest.mark.unit
+    def test_wal_mode(self, sqlite_storage):
+        """Database should use write-ahead logging."""
+        mode = sqlite_storage._conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    @pytest.mark.unit
+    def test_works_behind_event_manager(self, sqlite_storage):
+        """EventManager should work unchanged on top of SQLiteStorage."""
+        manager = EventManager(storage=sqlite_storage)
+        event = manager.create_event("生日", _days(3))
+        
+        assert event["remaining_days"] == 3
+        with pytest.raises(ValueError, match="already exists"):
+            manager.create_event("生日", _days(4))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("sort", ["date", "name", "remaining"])
+    def test_pages_match_json_storage(self, sqlite_storage, temp_storage_dir, sort):
+        """Keyset pages should come in the same order as the JSON backend."""
+        json_storage = Storage(storage_dir=f"{temp_storage_dir}/json", cache=True)
+        for i, offset in enumerate([3, -2, 0, 3, -2, 7, -9, 0]):
+            for storage in (sqlite_storage, json_storage):
+                storage.add_event(f"e{i}", _days(offset))
+
+        def walk(storage):
+            names, after = [], None
+            while True:
+                page = storage.get_page(sort, after, 3)
+                names += [e["name"] for e in page]
+                if len(page) < 3:
+                    return names
+                after = (page[-1]["target_ordinal"], page[-1]["name"])
+        
+        assert walk(sqlite_storage) == walk(json_storage)
+        assert len(walk(sqlite_storage)) == 8
+
+    @pytest.mark.unit
+    def test_search(self, sqlite_storage, temp_storage_dir):
+        """Search should follow own writes and other connections' writes."""
+        sqlite_storage.add_events([("生日", _days(1)), ("妈妈生日", _days(2))])
+        assert [e["name"] for e in sqlite_storage.search_events("生日")] == ["生日", "妈妈生日"]
+        
+        sqlite_storage.delete_event("生日")
+        other = SQLiteStorage(storage_dir=temp_storage_dir)
+        other.add_event("生日聚会", _days(3))
+        other.close()
+        
+        results = sqlite_storage.search_events("生日")
+        assert [e["name"] for e in results] == ["生日聚会", "妈妈生日"]
+        assert results[0]["remaining_days"] == 3
+
+    @pytest.mark.unit
+    def test_batch_add_and_delete(self, sqlite_storage):
+        """Batches should report duplicates and missing names per item."""
+        sqlite_storage.add_event("已有", _days(1))
+        
+        created = sqlite_storage.add_events([("a", _days(2)), ("已有", _days(3)), ("a", _days(4))])
+        assert [e is not None for e in created] == [True, False, False]
+        
+        deleted = sqlite_storage.delete_events(["a", "missing"])
+        assert deleted[0]["target_date"] == _days(2)
+        assert deleted[1] is None
+        assert sqlite_storage.count_events() == 1
+
+
+class TestSQLiteQueries:
+    """Test indexed status and next-event queries."""
+
+    @pytest.fixture
+    def populated(self, sqlite_storage):
+        """Storage with one event per status."""
+        sqlite_storage.add_event("过去", _days(-1))
+        sqlite_storage.add_event("今天", _days(0))
+        sqlite_storage.add_event("未来", _days(5))
+        sqlite_storage.add_event("更远", _days(9))
+        return sqlite_storage
+
+    @pytest.mark.unit
+    def test_events_by_status(self, populated):
+        """Status filter should match date ranges."""
+        assert [e["name"] for e in populated.get_events_by_status("EXPIRED")] == ["过去"]
+        assert [e["name"] for e in populated.get_events_by_status("CURRENT")] == ["今天"]
+        assert [e["name"] for e in populated.get_events_by_status("ACTIVE")] == ["未来", "更远"]
+        assert populated.get_events_by_status("UNKNOWN") == []
+
+    @pytest.mark.unit
+    def test_count_events(self, populated):
+        """Counts should match the status ranges."""
+        assert populated.count_events() == 4
+        assert populated.count_events("ACTIVE") == 2
+        assert populated.count_events("EXPIRED") == 1
+
+    @pytest.mark.unit
+    def test_next_event(self, populated):
+        """Next event should be the earliest non-expired one."""
+        assert populated.get_next_event()["name"] == "今天"
+
+    @pytest.mark.unit
+    def test_next_event_uses_index(self, populated):
+        """Next-event lookup should be an index range scan."""
+        plan = populated._conn.execute(
+            "EXPLAIN QUERY PLAN SELECT name FROM events WHERE target_date >= ? "
+            "ORDER BY target_date, name LIMIT 1",
+            (_days(0),),
+        ).fetchall()
+        assert any("idx_events_target_date" in row[3] for row in plan)
+
+
+class TestSQLiteMigration:
+    """Test one-shot migration from events.json."""
+
+    @pytest.mark.unit
+    def test_migrates_existing_json(self, temp_storage_dir):
+        """A new database should import events.json from the same directory."""
+        json_storage = Storage(storage_dir=temp_storage_dir)
+        json_storage.add_event("生日", "2026-03-15")
+        json_storage.add_event("假期", "2026-02-01")
+        
+        storage = SQLiteStorage(storage_dir=temp_storage_dir)
+        assert storage.count_events() == 2
+        assert storage.get_event("生日")["created_at"] == json_storage.get_event("生日")["created_at"]
+        storage.close()
+
+    @pytest.mark.unit
+    def test_migration_runs_once(self, temp_storage_dir):
+        """Deleted events should not be re-imported on the next start."""
+        Storage(storage_dir=temp_storage_dir).add_event("生日", "2026-03-15")
+        
+        storage = SQLiteStorage(storage_dir=temp_storage_dir)
+        storage.delete_event("生日")
+        storage.close()
+        
+        reopened = SQLiteStorage(storage_dir=temp_storage_dir)
+        assert not reopened.event_exists("生日")
+        reopened.close()
+
+    @pytest.mark.unit
+    def test_corrupt_json_is_retried(self, temp_storage_dir):
+        """A corrupt events.json should fail loudly and be imported once it is fixed."""
+        json_file = Path(temp_storage_dir) / "events.json"
+        json_file.write_text("{not json")
+        with pytest.raises(StorageError):
+            SQLiteStorage(storage_dir=temp_storage_dir)
+        
+        json_file.unlink()
+        Storage(storage_dir=temp_storage_dir).add_event("生日", "2026-03-15")
+        storage = SQLiteStorage(storage_dir=temp_storage_dir)
+        assert storage.event_exists("生日")
+        storage.close()
+
+    @pytest.mark.unit
+    def test_migrates_journal(self, temp_storage_dir):
+        """Events still in events.journal should be imported with the snapshot."""
+        journal = JournalStorage(storage_dir=temp_storage_dir)
+        journal.add_event("生日", "2026-03-15")
+        journal.compact()
+        journal.add_event("假期", "2026-02-01")
+        journal.delete_event("生日")
+        
+        storage = SQLiteStorage(storage_dir=temp_storage_dir)
+        assert [e["name"] for e in storage.get_all_events()] == ["假期"]
+        storage.close()
+
+    @pytest.mark.unit
+    def test_upgrades_version_1_schema(self, temp_storage_dir):
+        """A version 1 database should gain backfilled target ordinals."""
+        import sqlite3
+        
+        conn = sqlite3.connect(f"{temp_storage_dir}/events.db")
+        conn.executescript("""
+            CREATE TABLE events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT UNIQUE NOT NULL,
+                target_date DATE NOT NULL,
+                created_at TIMESTAMP NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                status TEXT DEFAULT 'ACTIVE'
+            );
+            INSERT INTO events (name, target_date, created_at) VALUES ('生日', '2026-03-15', '2026-01-01');
+            PRAGMA user_version = 1;
+        """)
+        conn.close()
+        
+        storage = SQLiteStorage(storage_dir=temp_storage_dir)
+        assert storage.load_events()["生日"]["target_ordinal"] == date(2026, 3, 15).toordinal()
+        
+        revision = storage.revision
+        storage.add_event("会议", "2026-04-01")
+        assert storage.revision != revision
+        storage.close()
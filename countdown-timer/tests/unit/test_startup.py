@@ -0,0 +1,85 @@
+"""Startup checks for the CLI: which modules a cold start loads.
+
+Only the set of loaded modules is checked, so the results do not depend
+on the machine's speed; the import-time budget is an opt-in benchmark
+(benchmarks/test_bench_startup.py).
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Set
+
+import pytest
+
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Modules a plain CLI command must not load: the async/API stack and
+# optional dependencies only some events or commands need
+HEAVY_MODULES = ("asyncio", "concurrent.futures", "dateutil", "zoneinfo", "numpy", "fastapi", "pydantic")
+
+# Runs the CLI (or only imports it) in a fresh interpreter, then writes
+# sys.modules to the file named by the first argument
+PROBE = """
+import sys
+out, args = sys.argv[1], sys.argv[2:]
+try:
+    if args:
+        import runpy
+        sys.argv = ["countdown", *args]
+        runpy.run_module("countdown_timer.cli", run_name="__main__")
+    else:
+        import countdown_timer.cli
+finally:
+    with open(out, "w", encoding="utf-8") as f:
+        f.write("\\n".join(sys.modules))
+"""
+
+
+def _loaded_modules(home: str, *args: str) -> Set[str]:
+    """
+    Start a new interpreter and collect the modules it loaded.
+    
+    Args:
+        home: $COUNTDOWN_HOME for the run
+        *args: CLI arguments, or none to only import countdown_timer.cli
+        
+    Returns:
+        Names in sys.modules once the command finished
+    """
+    out = Path(home) / "modules.txt"
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR), "COUNTDOWN_HOME": home}
+    env.pop("COUNTDOWN_STORAGE", None)
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, str(out), *args],
+        env=env, capture_output=True, text=True, encoding="utf-8", timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    return set(out.read_text(encoding="utf-8").split("\n"))
+
+
+def _heavy(modules: Set[str]) -> Set[str]:
+    return {m for m in modules if m.startswith(HEAVY_MODULES)}
+
+
+class TestStartup:
+    """Keep CLI cold starts small."""
+
+    @pytest.mark.unit
+    def test_cli_import_is_light(self, temp_storage_dir):
+        """Importing the CLI should not load business logic, storage or the API stack."""
+        modules = _loaded_modules(temp_storage_dir)
+        
+        assert "countdown_timer.cli" in modules
+        assert not modules & {"countdown_timer.event_manager", "countdown_timer.storage", "sqlite3"}
+        assert not _heavy(modules)
+
+    @pytest.mark.unit
+    def test_show_skips_heavy_modules(self, temp_storage_dir):
+        """add and show should only load what they use."""
+        for command in (["add", "生日", "2030-03-15"], ["show", "生日"]):
+            modules = _loaded_modules(temp_storage_dir, *command)
+            assert "countdown_timer.event_manager" in modules
+            assert not _heavy(modules)
@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import date, datetime, timedelta
-from src.countdown_timer.storage import Storage
+from src.countdown_timer.storage import Storage, StorageError
 
 
 class TestStorageBasics:
@@ -149,3 +149,376 @@ class TestDeleteEvent:
         """Deleting non-existent event should return False."""
         result = storage.delete_event("不存在")
         assert not result
+
+
+class TestStorageCache:
+    """Test in-memory index mode."""
+
+    @pytest.fixture
+    def cached_storage(self, temp_storage_dir):
+        """Storage instance keeping an in-memory index."""
+        return Storage(storage_dir=temp_storage_dir, cache=True)
+
+    @pytest.mark.unit
+    def test_reads_parse_file_once(self, cached_storage, monkeypatch):
+        """Repeated reads should not re-parse an unchanged file."""
+        cached_storage.add_event("生日", "2026-03-15")
+        cached_storage._index = None
+        
+        calls = []
+        original = cached_storage.load_events
+        monkeypatch.setattr(cached_storage, "load_events", lambda: calls.append(1) or original())
+        
+        cached_storage.event_exists("生日")
+        cached_storage.get_event("生日")
+        cached_storage.get_all_events()
+        cached_storage.add_event("假期", "2026-02-01")
+        cached_storage.delete_event("假期")
+        
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    def test_reload_on_external_change(self, cached_storage, temp_storage_dir):
+        """Changes written by another Storage should be picked up."""
+        cached_storage.add_event("生日", "2026-03-15")
+        assert cached_storage.event_exists("生日")
+        
+        other = Storage(storage_dir=temp_storage_dir)
+        other.add_event("假期", "2026-02-01")
+        
+        assert cached_storage.event_exists("假期")
+        assert len(cached_storage.get_all_events()) == 2
+
+    @pytest.mark.unit
+    def test_returned_events_do_not_leak_into_index(self, cached_storage):
+        """Mutating returned data should not change the cached index."""
+        event = cached_storage.add_event("生日", "2026-03-15")
+        event["remaining_days"] = 999
+        
+        fetched = cached_storage.get_event("生日")
+        fetched["target_date"] = "2000-01-01"
+        
+        assert "remaining_days" not in cached_storage.load_events()["生日"]
+        assert cached_storage.get_event("生日")["target_date"] == "2026-03-15"
+
+
+class TestStatusQueries:
+    """Test status and next-event queries."""
+
+    @pytest.mark.unit
+    def test_status_queries(self, storage):
+        """Status filter, counts and next event should agree."""
+        today = date.today()
+        storage.add_event("过去", (today - timedelta(days=1)).isoformat())
+        storage.add_event("未来", (today + timedelta(days=5)).isoformat())
+        storage.add_event("明天", (today + timedelta(days=1)).isoformat())
+        
+        assert [e["name"] for e in storage.get_events_by_status("EXPIRED")] == ["过去"]
+        assert storage.count_events() == 3
+        assert storage.count_events("ACTIVE") == 2
+        assert storage.get_next_event()["name"] == "明天"
+
+    @pytest.mark.unit
+    def test_clear_all(self, storage):
+        """Clearing should remove every event."""
+        storage.add_event("生日", "2026-03-15")
+        storage.clear_all()
+        
+        assert storage.get_all_events() == []
+        assert storage.get_next_event() is None
+
+
+class TestDayOrdinals:
+    """Test precomputed target day ordinals."""
+
+    @pytest.mark.unit
+    def test_ordinal_stored_at_write_time(self, storage):
+        """Added events should persist their target day ordinal."""
+        storage.add_event("生日", "2026-03-15")
+        
+        stored = storage.load_events()["生日"]
+        assert stored["target_ordinal"] == date(2026, 3, 15).toordinal()
+
+    @pytest.mark.unit
+    def test_legacy_event_without_ordinal(self, storage):
+        """Events saved before ordinals existed should still be readable."""
+        tomorrow = date.today() + timedelta(days=1)
+        storage.save_events({
+            "旧": {"name": "旧", "target_date": tomorrow.isoformat(), "created_at": "2026-01-01T00:00:00"}
+        })
+        
+        event = storage.get_event("旧")
+        assert event["remaining_days"] == 1
+        assert event["status"] == "ACTIVE"
+
+    @pytest.mark.unit
+    def test_batch_matches_single_calculation(self, monkeypatch):
+        """Vectorized and plain batches should match the per-event helpers."""
+        import src.countdown_timer.storage as storage_module
+        
+        today = date.today()
+        dates = [(today + timedelta(days=d)).isoformat() for d in range(-3, 4)]
+        
+        for threshold in (0, 10**9):
+            monkeypatch.setattr(storage_module, "VECTORIZE_THRESHOLD", threshold)
+            events = Storage._with_countdowns([{"target_date": d} for d in dates])
+            
+            assert [e["remaining_days"] for e in events] == [
+                Storage._calculate_remaining_days(d) for d in dates
+            ]
+            assert [e["status"] for e in events] == [Storage._calculate_status(d) for d in dates]
+
+
+class TestDateIndex:
+    """Test date-sorted index queries."""
+
+    @pytest.fixture(params=[False, True], ids=["plain", "cached"])
+    def dated_storage(self, request, temp_storage_dir):
+        """Storage with events spread around today."""
+        storage = Storage(storage_dir=temp_storage_dir, cache=request.param)
+        today = date.today()
+        for name, offset in [("c", 9), ("a", -2), ("b", 3), ("d", 0), ("e", 3)]:
+            storage.add_event(name, (today + timedelta(days=offset)).isoformat())
+        return storage
+
+    @pytest.mark.unit
+    def test_upcoming_events(self, dated_storage):
+        """Upcoming events should start today and be sorted by date."""
+        names = [e["name"] for e in dated_storage.get_upcoming_events(limit=3)]
+        assert names == ["d", "b", "e"]
+
+    @pytest.mark.unit
+    def test_events_between(self, dated_storage):
+        """Range query should include both bounds."""
+        today = date.today()
+        events = dated_storage.get_events_between(
+            (today - timedelta(days=2)).isoformat(), (today + timedelta(days=3)).isoformat()
+        )
+        assert [e["name"] for e in events] == ["a", "d", "b", "e"]
+        assert [e["remaining_days"] for e in events] == [0, 0, 3, 3]
+
+    @pytest.mark.unit
+    def test_index_follows_mutations(self, dated_storage):
+        """Adds and deletes should be reflected in index queries."""
+        dated_storage.delete_event("d")
+        dated_storage.add_event("f", (date.today() + timedelta(days=1)).isoformat())
+        
+        assert dated_storage.get_next_event()["name"] == "f"
+        assert dated_storage.count_events("CURRENT") == 0
+        assert dated_storage.count_events("ACTIVE") == 4
+        assert dated_storage.count_between(None, None) == 5
+
+
+class TestStorageVersion:
+    """Test the storage change counter."""
+
+    @pytest.mark.unit
+    def test_version_changes_on_mutation_only(self, storage):
+        """Reads should keep the version, each mutation should bump it once."""
+        version = storage.version
+        storage.get_all_events()
+        assert storage.version == version
+        
+        storage.add_event("生日", "2026-03-15")
+        assert storage.version == version + 1
+        storage.delete_event("生日")
+        assert storage.version == version + 2
+
+    @pytest.mark.unit
+    def test_version_detects_external_change(self, temp_storage_dir):
+        """Writes by another instance should bump the version."""
+        storage = Storage(storage_dir=temp_storage_dir, cache=True)
+        version = storage.version
+        
+        Storage(storage_dir=temp_storage_dir).add_event("生日", "2026-03-15")
+        
+        assert storage.version > version
+        assert storage.event_exists("生日")
+
+
+def _add_many(storage_class, storage_dir, prefix, count):
+    """Add events from a separate process."""
+    storage = storage_class(storage_dir=storage_dir)
+    for i in range(count):
+        storage.add_event(f"{prefix}-{i}", "2026-03-15")
+
+
+class TestConcurrentWriters:
+    """Test locking, atomic replace and transactions."""
+
+    @pytest.mark.unit
+    def test_corrupt_file_raises(self, storage):
+        """A corrupt events.json must not be read as empty."""
+        storage.events_file.write_text('{"生日": {"name"')
+        
+        with pytest.raises(StorageError):
+            storage.load_events()
+        with pytest.raises(StorageError):
+            storage.add_event("新事件", "2026-03-15")
+        
+        assert storage.events_file.read_text() == '{"生日": {"name"'
+
+    @pytest.mark.unit
+    def test_save_replaces_file_atomically(self, storage):
+        """Saving should swap in a new file and leave no temp files behind."""
+        storage.add_event("生日", "2026-03-15")
+        inode = storage.events_file.stat().st_ino
+        
+        storage.add_event("会议", "2026-04-01")
+        
+        assert storage.events_file.stat().st_ino != inode
+        assert sorted(p.name for p in storage.storage_dir.iterdir()) == ["events.json", "events.lock"]
+
+    @pytest.mark.unit
+    def test_transaction_commits(self, storage):
+        """Changes made inside a transaction should be saved."""
+        storage.add_event("生日", "2026-03-15")
+        
+        with storage.transaction() as events:
+            events["生日"]["target_date"] = "2026-03-16"
+            del events["生日"]["target_ordinal"]
+        
+        assert storage.get_event("生日")["target_date"] == "2026-03-16"
+
+    @pytest.mark.unit
+    def test_fingerprint_taken_under_lock(self, temp_storage_dir, monkeypatch):
+        """save_events should record the fingerprint before releasing the write lock."""
+        storage = Storage(storage_dir=temp_storage_dir, cache=True)
+        held = []
+        original = storage._file_fingerprint
+        monkeypatch.setattr(
+            storage, "_file_fingerprint", lambda: held.append(storage._lock_depth > 0) or original()
+        )
+        
+        storage.clear_all()
+        
+        assert held == [True]
+
+    @pytest.mark.unit
+    def test_transaction_rolls_back(self, temp_storage_dir):
+        """An exception inside a transaction should discard the changes."""
+        storage = Storage(storage_dir=temp_storage_dir, cache=True)
+        storage.add_event("生日", "2026-03-15")
+        
+        with pytest.raises(RuntimeError):
+            with storage.transaction() as events:
+                events.clear()
+                raise RuntimeError("abort")
+        
+        assert storage.event_exists("生日")
+        assert Storage(storage_dir=temp_storage_dir).event_exists("生日")
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("storage_class", ["Storage", "JournalStorage"])
+    def test_concurrent_processes_keep_all_events(self, temp_storage_dir, storage_class):
+        """Events added by several processes at once should all survive."""
+        import multiprocessing
+        import src.countdown_timer as package
+        
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("needs fork")
+        
+        context = multiprocessing.get_context("fork")
+        cls = getattr(package, storage_class)
+        workers = [
+            context.Process(target=_add_many, args=(cls, temp_storage_dir, f"p{n}", 20))
+            for n in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert cls(storage_dir=temp_storage_dir).count_events() == 80
+
+
+class TestPagination:
+    """Test keyset pages out of the sorted indexes."""
+
+    @staticmethod
+    def _fill(storage):
+        today = date.today()
+        for name, offset in [("c", 2), ("a", 2), ("b", -1), ("d", 0), ("e", -3), ("f", 9)]:
+            storage.add_event(name, (today + timedelta(days=offset)).isoformat())
+
+    @staticmethod
+    def _walk(storage, sort, limit, **bounds):
+        names, after = [], None
+        while True:
+            page = storage.get_page(sort, after, limit, **bounds)
+            names += [e["name"] for e in page]
+            if len(page) < limit:
+                return names
+            after = (page[-1]["target_ordinal"], page[-1]["name"])
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("cache", [False, True])
+    @pytest.mark.parametrize("sort,expected", [
+        ("date", ["e", "b", "d", "a", "c", "f"]),
+        ("name", ["a", "b", "c", "d", "e", "f"]),
+        ("remaining", ["d", "a", "c", "f", "b", "e"]),
+    ])
+    def test_pages_cover_sort_order(self, temp_storage_dir, cache, sort, expected):
+        """Walking pages of any size should yield the full sort order."""
+        storage = Storage(storage_dir=temp_storage_dir, cache=cache)
+        self._fill(storage)
+        
+        for limit in (1, 2, 4, 10):
+            assert self._walk(storage, sort, limit) == expected
+
+    @pytest.mark.unit
+    def test_page_date_bounds(self, storage):
+        """Bounds should restrict every sort order."""
+        self._fill(storage)
+        today = date.today().toordinal()
+        
+        assert self._walk(storage, "name", 2, start=today - 1, end=today + 2) == ["a", "b", "c", "d"]
+        assert self._walk(storage, "remaining", 2, end=today) == ["d", "b", "e"]
+
+    @pytest.mark.unit
+    def test_name_index_follows_mutations(self, temp_storage_dir):
+        """The cached name index should track adds and deletes."""
+        storage = Storage(storage_dir=temp_storage_dir, cache=True)
+        self._fill(storage)
+        storage.get_page("name")
+        
+        storage.delete_event("a")
+        storage.add_events([("aa", "2026-03-15"), ("0", "2026-03-15")])
+        
+        assert [e["name"] for e in storage.get_page("name", limit=3)] == ["0", "aa", "b"]
+
+    @pytest.mark.unit
+    def test_unknown_sort(self, storage):
+        """Unsupported sorts should be rejected."""
+        with pytest.raises(ValueError):
+            storage.get_page("size")
+
+
+class TestSearch:
+    """Test name search."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("cache", [False, True])
+    def test_search_follows_mutations(self, temp_storage_dir, cache):
+        """Search results should reflect adds and deletes."""
+        storage = Storage(storage_dir=temp_storage_dir, cache=cache)
+        storage.add_events([("生日", "2026-03-15"), ("妈妈生日", "2026-05-01")])
+        assert [e["name"] for e in storage.search_events("生日")] == ["生日", "妈妈生日"]
+        
+        storage.delete_event("生日")
+        storage.add_event("生日聚会", "2026-06-01")
+        
+        results = storage.search_events("生日")
+        assert [e["name"] for e in results] == ["生日聚会", "妈妈生日"]
+        assert "remaining_days" in results[0]
+
+    @pytest.mark.unit
+    def test_search_sees_external_writes(self, temp_storage_dir):
+        """Writes by another instance should rebuild the cached index."""
+        storage = Storage(storage_dir=temp_storage_dir, cache=True)
+        storage.search_events("生日")
+        
+        Storage(storage_dir=temp_storage_dir).add_event("生日", "2026-03-15")
+        
+        assert [e["name"] for e in storage.search_events("日")] == ["生日"]
@@ -0,0 +1,92 @@
+"""Unit tests for tenants module."""
+
+import pytest
+from src.countdown_timer.tenants import TenantRegistry, validate_tenant_id
+
+
+@pytest.fixture
+def registry(temp_storage_dir):
+    """Registry keeping at most two idle tenants open."""
+    return TenantRegistry(base_dir=temp_storage_dir, max_open=2)
+
+
+class TestTenantRegistry:
+    """Test per-tenant storage and the LRU of open stores."""
+
+    @pytest.mark.unit
+    def test_tenants_are_isolated(self, registry):
+        """Each tenant should see only its own events."""
+        with registry.lease("alice") as manager:
+            manager.create_event("生日", "2026-03-15")
+        with registry.lease("bob") as manager:
+            assert manager.list_events() == []
+        
+        assert (registry.tenant_dir("alice") / "events.json").exists()
+        assert not (registry.tenant_dir("bob") / "events.json").exists()
+
+    @pytest.mark.unit
+    def test_same_store_while_open(self, registry):
+        """Repeated leases should reuse the open store."""
+        with registry.lease("alice") as first:
+            pass
+        with registry.lease("alice") as second:
+            assert second is first
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self, temp_storage_dir):
+        """Opening past max_open should close the least recently used idle store."""
+        closed = []
+        registry = TenantRegistry(
+            base_dir=temp_storage_dir,
+            max_open=2,
+            open_tenant=lambda path: path.name,
+            close_tenant=closed.append,
+        )
+        for tenant_id in ("a", "b", "a", "c"):
+            with registry.lease(tenant_id):
+                pass
+        
+        assert closed == ["b"]
+        assert "a" in registry and "c" in registry
+        assert len(registry) == 2
+
+    @pytest.mark.unit
+    def test_stores_in_use_are_not_evicted(self, temp_storage_dir):
+        """A leased store should stay open until released."""
+        closed = []
+        registry = TenantRegistry(
+            base_dir=temp_storage_dir,
+            max_open=1,
+            open_tenant=lambda path: path.name,
+            close_tenant=closed.append,
+        )
+        registry.acquire("a")
+        with registry.lease("b"):
+            assert closed == []
+            assert len(registry) == 2
+        
+        assert closed == ["b"]
+        registry.release("a")
+        assert "a" in registry
+
+    @pytest.mark.unit
+    def test_close(self, registry):
+        """close() should drop every idle store."""
+        with registry.lease("alice"):
+            pass
+        registry.close()
+        assert len(registry) == 0
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("tenant_id", ["", "..", "../x", "a/b", "-a", "a" * 65, None])
+    def test_invalid_tenant_id(self, registry, tenant_id):
+        """Tenant IDs that are not safe directory names should be rejected."""
+        with pytest.raises(ValueError):
+            validate_tenant_id(tenant_id)
+        with pytest.raises(ValueError):
+            registry.acquire(tenant_id)
+
+    @pytest.mark.unit
+    def test_valid_tenant_id(self):
+        """Letters, digits, dots, dashes and underscores should be accepted."""
+        assert validate_tenant_id("user-42_a.b") == "user-42_a.b"
@@ -0,0 +1,156 @@
+"""Unit tests for transfer module."""
+
+import json
+import pytest
+from src.countdown_timer.transfer import EventImporter, detect_format, export_events
+
+
+class TestExport:
+    """Test streaming export."""
+
+    @pytest.mark.unit
+    def test_export_ndjson(self, event_manager):
+        """Each event should be one JSON line."""
+        event_manager.create_events([("生日", "2026-03-15"), ("会议", "2026-04-01")])
+        
+        lines = "".join(export_events(event_manager)).splitlines()
+        
+        records = [json.loads(line) for line in lines]
+        assert [r["name"] for r in records] == ["生日", "会议"]
+        assert records[0]["date"] == "2026-03-15"
+        assert "days_remaining" in records[0]
+
+    @pytest.mark.unit
+    def test_export_streams_in_chunks(self, event_manager):
+        """Export should yield one piece per chunk."""
+        event_manager.create_events((f"事件{i}", "2026-03-15") for i in range(25))
+        
+        chunks = list(export_events(event_manager, "csv", chunk_size=10))
+        
+        assert chunks[0] == "name,date,status,days_remaining\n"
+        assert [c.count("\n") for c in chunks[1:]] == [10, 10, 5]
+
+    @pytest.mark.unit
+    def test_unknown_format(self, event_manager):
+        """Unsupported formats should be rejected."""
+        with pytest.raises(ValueError):
+            list(export_events(event_manager, "xml"))
+        with pytest.raises(ValueError):
+            EventImporter(event_manager, "xml")
+
+    @pytest.mark.unit
+    def test_detect_format(self):
+        """CSV should be detected from the file extension."""
+        assert detect_format("events.CSV") == "csv"
+        assert detect_format("events.ndjson") == "ndjson"
+        assert detect_format(None) == "ndjson"
+
+
+class TestImport:
+    """Test chunked import."""
+
+    @pytest.mark.unit
+    def test_import_ndjson(self, event_manager):
+        """Valid lines should be imported and bad ones reported by line."""
+        importer = EventImporter(event_manager)
+        importer.feed([
+            '{"name": "生日", "date": "2026-03-15"}\n',
+            "\n",
+            "not json\n",
+            '{"name": "会议", "target_date": "2026-04-01"}\n',
+            '{"name": "坏日期", "date": "2026-13-01"}\n',
+            '{"name": "生日", "date": "2026-05-01"}\n',
+        ])
+        summary = importer.finish()
+        
+        assert (summary["imported"], summary["failed"]) == (2, 3)
+        assert [e["line"] for e in summary["errors"]] == [3, 5, 6]
+        assert event_manager.count_events() == 2
+
+    @pytest.mark.unit
+    def test_import_csv_with_extra_columns(self, event_manager):
+        """CSV import should read name/date columns in any order."""
+        importer = EventImporter(event_manager, "csv")
+        importer.feed(["﻿status,date,name\n", "ACTIVE,2026-03-15,生日\n", ",2026-04-01,\"a, b\"\n"])
+        
+        assert importer.finish()["imported"] == 2
+        assert event_manager.get_event("a, b")["target_date"] == "2026-04-01"
+
+    @pytest.mark.unit
+    def test_import_commits_in_chunks(self, event_manager, monkeypatch):
+        """Events should be committed once per chunk, not per line."""
+        batches = []
+        original = event_manager.create_events
+        monkeypatch.setattr(
+            event_manager, "create_events", lambda items: batches.append(1) or original(items)
+        )
+        
+        importer = EventImporter(event_manager, chunk_size=10)
+        importer.feed(json.dumps({"name": f"e{i}", "date": "2026-03-15"}) for i in range(25))
+        importer.finish()
+        
+        assert len(batches) == 3
+        assert event_manager.count_events() == 25
+
+    @pytest.mark.unit
+    def test_bad_line_fails_alone(self, event_manager):
+        """A bad date should fail its own line while the other chunks are imported."""
+        lines = [json.dumps({"name": f"i{i}", "date": "2027-01-05"}) for i in range(3)]
+        lines.insert(2, json.dumps({"name": "bad", "date": "2027-1-5"}))
+        
+        importer = EventImporter(event_manager, chunk_size=2)
+        importer.feed(lines)
+        summary = importer.finish()
+        
+        assert (summary["imported"], summary["failed"]) == (3, 1)
+        assert [(e["line"], e["name"]) for e in summary["errors"]] == [(3, "bad")]
+        assert event_manager.count_events() == 3
+
+    @pytest.mark.unit
+    def test_storage_failure_is_per_line(self, event_manager, monkeypatch):
+        """A chunk storage rejects should be retried line by line."""
+        monkeypatch.setattr(event_manager.validator, "validate_event", lambda name, target_date: True)
+        
+        importer = EventImporter(event_manager, chunk_size=2)
+        importer.feed([
+            json.dumps({"name": "a", "date": "2027-01-05"}),
+            json.dumps({"name": "bad", "date": "2027-1-5"}),
+            json.dumps({"name": "b", "date": "2027-01-06"}),
+        ])
+        summary = importer.finish()
+        
+        assert (summary["imported"], summary["failed"]) == (2, 1)
+        assert summary["errors"][0]["name"] == "bad"
+        assert sorted(e["name"] for e in event_manager.list_events()) == ["a", "b"]
+
+    @pytest.mark.unit
+    def test_round_trip(self, event_manager, temp_storage_dir):
+        """Exported CSV should import into an empty storage."""
+        from src.countdown_timer.event_manager import EventManager
+        from src.countdown_timer.storage import Storage
+        
+        event_manager.create_events([("生日", "2026-03-15"), ("会议", "2026-04-01")])
+        target = EventManager(storage=Storage(storage_dir=f"{temp_storage_dir}/copy"))
+        
+        importer = EventImporter(target, "csv")
+        importer.feed("".join(export_events(event_manager, "csv")).splitlines())
+        importer.finish()
+        
+        assert [e["name"] for e in target.list_events()] == ["生日", "会议"]
+
+    @pytest.mark.unit
+    def test_round_trip_keeps_recurrence(self, event_manager, temp_storage_dir):
+        """NDJSON export should carry the rule and first date of recurring events."""
+        from src.countdown_timer.event_manager import EventManager
+        from src.countdown_timer.storage import Storage
+        
+        event_manager.create_event("月报", "2020-01-31", "monthly")
+        target = EventManager(storage=Storage(storage_dir=f"{temp_storage_dir}/copy"))
+        
+        importer = EventImporter(target)
+        importer.feed("".join(export_events(event_manager)).splitlines())
+        assert importer.finish()["imported"] == 1
+        
+        copied = target.get_event("月报")
+        assert (copied["recurrence"], copied["start_date"]) == ("monthly", "2020-01-31")
+        assert copied["target_date"] == event_manager.get_event("月报")["target_date"]
@@ -27,6 +27,13 @@ class TestValidateDateFormat:
         with pytest.raises(ValueError):
             Validator.validate_date_format("abc")
 
+    @pytest.mark.unit
+    def test_non_iso_dates_are_rejected(self):
+        """Only zero-padded YYYY-MM-DD dates should pass, as storage expects."""
+        for date_string in ("2027-1-5", "20270105", "2027-W01-1"):
+            with pytest.raises(ValueError):
+                Validator.validate_date_format(date_string)
+
 
 class TestValidateDateValue:
     """Test date value validation (FR-005)."""